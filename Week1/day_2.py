@@ -57,6 +57,10 @@
 
 # except:
 #     print("Not Valid")
+## Faster version: primes.py (Miller-Rabin + segmented sieve)
+# from primes import is_prime
+# user_input = int(input())
+# print("Prime" if is_prime(user_input) else "Not prime")
 ###Exercise 2
 # const =True
 # while const:
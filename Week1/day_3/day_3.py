@@ -57,6 +57,9 @@
 #     print(f"The factorail of {num} is {result}")
 
 # print_f(22)
+# # Faster version without the recursion limit: factorials.py (binary splitting + cache)
+# from factorials import factorial
+# print(factorial(10**5))
 # # # # # # # # # # #  Exercise 2: Create a Mathatical Module to Calculate +-*/ # # # # # # # # # # #
 # import math_operations as mo
 
@@ -0,0 +1,170 @@
+"""
+Big-integer factorials for Exercise 1 of day_3.py.
+
+The recursive `Factorial` hits Python's recursion limit near n = 1000, and the
+loop version multiplies one huge number by one small number n times, which gets
+quadratically slower as n grows. This module multiplies with binary splitting:
+
+    product(lo, hi) = product(lo, mid) * product(mid, hi)
+
+so the big multiplications happen between numbers of similar size. Results are
+kept in a small LRU cache of checkpoints, so factorial(10**5 + 10) reuses
+factorial(10**5) if it was already computed.
+"""
+import bisect
+import math
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+try:
+    from scipy.special import gammaln as _gammaln
+except ImportError:
+    _gammaln = np.vectorize(math.lgamma, otypes=[np.float64])
+
+CHECKPOINT_CACHE_SIZE = 64
+# Below this many factors a plain loop is faster than splitting further.
+_LEAF_SIZE = 32
+
+_checkpoints = OrderedDict()
+_checkpoint_keys = []
+
+
+def product_range(lo:int, hi:int):
+    """
+    This Function will multiply every integer in [lo, hi) with binary splitting.
+
+    Args:
+        lo: First factor (inclusive).
+        hi: Last factor (exclusive).
+    """
+    if hi - lo <= _LEAF_SIZE:
+        result = 1
+        for i in range(lo, hi):
+            result *= i
+        return result
+    mid = (lo + hi) // 2
+    return product_range(lo, mid) * product_range(mid, hi)
+
+
+def _remember(num:int, value:int):
+    if num in _checkpoints:
+        _checkpoints.move_to_end(num)
+        return
+    _checkpoints[num] = value
+    bisect.insort(_checkpoint_keys, num)
+    if len(_checkpoints) > CHECKPOINT_CACHE_SIZE:
+        oldest, _ = _checkpoints.popitem(last=False)
+        _checkpoint_keys.remove(oldest)
+
+
+def factorial(num:int):
+    """
+    This Function will calculate the Factorial of a number.
+
+    It starts from the largest cached checkpoint below num and multiplies the
+    remaining factors with binary splitting.
+
+    Args:
+        num: A non-negative integer.
+    """
+    if num < 0:
+        raise ValueError("factorial() not defined for negative values")
+    if num < 2:
+        return 1
+
+    i = bisect.bisect_right(_checkpoint_keys, num)
+    if i:
+        start = _checkpoint_keys[i - 1]
+        value = _checkpoints[start]
+        _checkpoints.move_to_end(start)
+    else:
+        start, value = 1, 1
+
+    if start != num:
+        value *= product_range(start + 1, num + 1)
+        _remember(num, value)
+    return value
+
+
+def clear_cache():
+    """
+    This Function will forget every cached checkpoint.
+    """
+    _checkpoints.clear()
+    _checkpoint_keys.clear()
+
+
+def factorial_mod(num:int, p:int):
+    """
+    This Function will calculate num! mod p without building the big number.
+
+    Args:
+        num: A non-negative integer.
+        p: A positive modulus.
+    """
+    if num < 0:
+        raise ValueError("factorial() not defined for negative values")
+    if p <= 0:
+        raise ValueError("p must be positive")
+    if num >= p:
+        # p itself (or all of its factors) appear in num!
+        return 0
+    result = 1 % p
+    for i in range(2, num + 1):
+        result = result * i % p
+    return result
+
+
+def log_factorial(nums):
+    """
+    This Function will calculate ln(n!) for a whole array of n at once.
+
+    Uses ln(n!) = lgamma(n + 1); the result is a float64 array.
+
+    Args:
+        nums: A number or array-like of non-negative numbers.
+    """
+    nums = np.asarray(nums, dtype=np.float64)
+    if (nums < 0).any():
+        raise ValueError("log_factorial() not defined for negative values")
+    return np.asarray(_gammaln(nums + 1.0), dtype=np.float64)
+
+
+def benchmark(sizes=(10**3, 10**4, 10**5, 10**6), loop_limit=10**5):
+    """
+    This Function will compare the old loop factorial with binary splitting.
+
+    Args:
+        sizes: Values of n to test.
+        loop_limit: Largest n for which the slow loop is timed (it takes minutes at 10**6).
+    """
+    def loop_factorial(num):
+        result = 1
+        for i in range(1, num + 1):
+            result = result * i
+        return result
+
+    print(f"{'n':>10} {'loop (s)':>10} {'split (s)':>10} {'cached (s)':>10} {'speedup':>8}")
+    for n in sizes:
+        loop_time = float("nan")
+        if n <= loop_limit:
+            start = time.perf_counter()
+            loop_factorial(n)
+            loop_time = time.perf_counter() - start
+
+        clear_cache()
+        start = time.perf_counter()
+        factorial(n)
+        split_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        factorial(n + 10)
+        cached_time = time.perf_counter() - start
+
+        print(f"{n:>10} {loop_time:>10.4f} {split_time:>10.4f} {cached_time:>10.4f} {loop_time / split_time:>8.1f}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -1,14 +1,150 @@
-def add(a, b):
-    return a + b
+"""
+Array-aware math operations.
 
-def subtract(a, b):
-    return a - b
+Every function accepts plain numbers, NumPy arrays, memoryviews or any other
+object that supports the buffer protocol. Inputs are broadcast together like
+normal NumPy arithmetic, and the result can be written into an existing array
+with `out=` so that hot loops do not allocate a new array on every call.
+"""
+import time
 
-def multiply(a, b):
-    return a * b
+import numpy as np
 
-def divide(a, b):
-    if b != 0:
-        return a / b
-    else:
-        return "Division by zero is not allowed"
\ No newline at end of file
+ZERO_DIVISION_POLICIES = ("nan", "mask", "raise")
+
+
+def _as_array(value):
+    """
+    This Function will view a number, array, memoryview or buffer as a NumPy array without copying.
+
+    Args:
+        value: A scalar or any object supporting the buffer protocol.
+    """
+    if isinstance(value, (bytes, bytearray)):
+        return np.frombuffer(value, dtype=np.uint8)
+    return np.asarray(value)
+
+
+def add(a, b, out=None):
+    """
+    This Function will add two numbers or arrays element by element.
+
+    Args:
+        a: First operand (number, array or buffer).
+        b: Second operand, broadcast against a.
+        out: Optional array that receives the result.
+    """
+    return np.add(_as_array(a), _as_array(b), out=out)
+
+
+def subtract(a, b, out=None):
+    """
+    This Function will subtract b from a element by element.
+
+    Args:
+        a: First operand (number, array or buffer).
+        b: Second operand, broadcast against a.
+        out: Optional array that receives the result.
+    """
+    return np.subtract(_as_array(a), _as_array(b), out=out)
+
+
+def multiply(a, b, out=None):
+    """
+    This Function will multiply two numbers or arrays element by element.
+
+    Args:
+        a: First operand (number, array or buffer).
+        b: Second operand, broadcast against a.
+        out: Optional array that receives the result.
+    """
+    return np.multiply(_as_array(a), _as_array(b), out=out)
+
+
+def divide(a, b, out=None, zero_division="nan"):
+    """
+    This Function will divide a by b element by element.
+
+    Args:
+        a: Dividend (number, array or buffer).
+        b: Divisor, broadcast against a.
+        out: Optional floating point array that receives the result.
+        zero_division: What to do where b is zero:
+            "nan"   -> put NaN in those positions.
+            "mask"  -> return a masked array with those positions masked (a masked
+                       array is returned even when b has no zeros).
+            "raise" -> raise ZeroDivisionError.
+    """
+    if zero_division not in ZERO_DIVISION_POLICIES:
+        raise ValueError(f"zero_division must be one of {ZERO_DIVISION_POLICIES}, got {zero_division!r}")
+
+    a = _as_array(a)
+    b = _as_array(b)
+    zero = b == 0
+
+    if not zero.any():
+        result = np.true_divide(a, b, out=out)
+        # "mask" always returns a masked array, so the type does not depend on the data.
+        return np.ma.masked_array(result) if zero_division == "mask" else result
+    if zero_division == "raise":
+        raise ZeroDivisionError("Division by zero is not allowed")
+
+    if out is None:
+        shape = np.broadcast_shapes(a.shape, b.shape)
+        out = np.empty(shape, dtype=np.result_type(a, b, np.float64))
+    np.true_divide(a, b, out=out, where=~zero)
+    np.copyto(out, np.nan, where=np.broadcast_to(zero, out.shape))
+
+    if zero_division == "mask":
+        return np.ma.masked_array(out, mask=np.broadcast_to(zero, out.shape))
+    if out.ndim == 0:
+        return out[()]
+    return out
+
+
+def benchmark(sizes=(10**3, 10**4, 10**5, 10**6, 10**7, 10**8), repeat=3):
+    """
+    This Function will compare the scalar Python loop with the array functions.
+
+    Args:
+        sizes: Number of elements to test.
+        repeat: How many times each measurement is repeated (the best is kept).
+    """
+    def scalar_divide(x, y):
+        if y != 0:
+            return x / y
+        else:
+            return "Division by zero is not allowed"
+
+    rng = np.random.default_rng(0)
+    scalar_limit = 10**6
+    print(f"{'size':>12} {'op':>9} {'loop (s)':>10} {'array (s)':>10} {'out= (s)':>10} {'speedup':>8}")
+    for size in sizes:
+        a = rng.random(size)
+        b = rng.random(size) + 1.0
+        out = np.empty(size)
+        for name, func, scalar_func in (
+            ("add", add, lambda x, y: x + y),
+            ("subtract", subtract, lambda x, y: x - y),
+            ("multiply", multiply, lambda x, y: x * y),
+            ("divide", divide, scalar_divide),
+        ):
+            loop_time = float("nan")
+            if size <= scalar_limit:
+                a_list, b_list = a.tolist(), b.tolist()
+                loop_time = min(_timed(lambda: [scalar_func(x, y) for x, y in zip(a_list, b_list)])
+                                for _ in range(repeat))
+            array_time = min(_timed(lambda: func(a, b)) for _ in range(repeat))
+            out_time = min(_timed(lambda: func(a, b, out=out)) for _ in range(repeat))
+            print(f"{size:>12} {name:>9} {loop_time:>10.4f} {array_time:>10.4f} {out_time:>10.4f} "
+                  f"{loop_time / out_time:>8.1f}")
+
+
+def _timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    benchmark()
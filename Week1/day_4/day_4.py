@@ -196,6 +196,9 @@ Key Points About Sets:
 #     words[each] = count
 
 # print(words)
+## Faster version (one pass with a hash map): word_frequency.py
+# from word_frequency import count_text
+# print(dict(count_text(input())))
 ##########################################################################################################
 # reversed = ['Book', 'Weed', 'Wood', 'Road', 'Wood', 'Wood']
 # reversed.reverse()
@@ -0,0 +1,191 @@
+"""
+Streaming word-frequency engine for the "Word Frequency Counter" exercise.
+
+The exercise rescans the whole list of words for every word (O(n^2)). Here each
+word is counted once in a hash map (collections.Counter), and files are read in
+fixed-size byte chunks so memory stays flat no matter how big the file is.
+
+Words are normalized the same way as in day_6.py:
+    word.lower().strip(string.punctuation)
+
+Big files can be split into byte ranges that are counted by a process pool
+(map) and then merged into one Counter (reduce).
+
+Example:
+    from word_frequency import count_file, top_k
+    counts = count_file("corpus.log", workers=8)
+    print(top_k(counts, 10))
+"""
+import heapq
+import os
+import re
+import string
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+_WHITESPACE = b" \t\n\r\x0b\x0c"
+_WHITESPACE_BYTES = tuple(bytes([b]) for b in _WHITESPACE)
+_SPACE = re.compile(rb"[ \t\n\r\x0b\x0c]")
+
+
+def normalize(word:str):
+    """
+    This Function will lowercase a word and strip punctuation from both ends.
+
+    Args:
+        word: A single word.
+    """
+    return word.lower().strip(string.punctuation)
+
+
+def _normalize_counts(raw_counts, encoding):
+    """
+    This Function will turn raw byte-token counts into normalized word counts.
+
+    Only the distinct tokens are decoded and normalized, not every occurrence.
+
+    Args:
+        raw_counts: A Counter of bytes tokens.
+        encoding: Text encoding of the tokens.
+    """
+    counts = Counter()
+    for token, count in raw_counts.items():
+        word = normalize(token.decode(encoding, errors="replace"))
+        if word:
+            counts[word] += count
+    return counts
+
+
+def count_text(text:str):
+    """
+    This Function will count the words of a string.
+
+    Args:
+        text: The text to count.
+    """
+    counts = Counter()
+    for word, count in Counter(text.split()).items():
+        word = normalize(word)
+        if word:
+            counts[word] += count
+    return counts
+
+
+def _first_space(data):
+    match = _SPACE.search(data)
+    return match.start() if match else -1
+
+
+def _last_space(data):
+    return max(data.rfind(ws) for ws in _WHITESPACE_BYTES)
+
+
+def _read_token_tail(file, chunk_size):
+    """
+    This Function will read from the current position up to the next whitespace.
+
+    Args:
+        file: A file opened in binary mode.
+        chunk_size: Number of bytes read at a time.
+    """
+    tail = b""
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            return tail
+        cut = _first_space(chunk)
+        if cut != -1:
+            return tail + chunk[:cut]
+        tail += chunk
+
+
+def _count_range(args):
+    """
+    This Function will count the words of one byte range of a file.
+
+    A range owns every token that starts inside it, so a token crossing the
+    start belongs to the previous range and a token crossing the end is read
+    to completion.
+
+    Args:
+        args: A tuple (path, start, end, chunk_size, encoding).
+    """
+    path, start, end, chunk_size, encoding = args
+    raw_counts = Counter()
+    with open(path, "rb") as file:
+        if start > 0:
+            file.seek(start - 1)
+            if file.read(1) not in _WHITESPACE:
+                # Skip the tail of a token owned by the previous range.
+                tail = _read_token_tail(file, chunk_size)
+                start += len(tail)
+        file.seek(start)
+
+        position = start
+        leftover = b""
+        while position < end:
+            chunk = file.read(min(chunk_size, end - position))
+            if not chunk:
+                break
+            position += len(chunk)
+            chunk = leftover + chunk
+            # Keep the last (maybe incomplete) token for the next chunk.
+            cut = _last_space(chunk)
+            if cut == -1:
+                leftover = chunk
+                continue
+            raw_counts.update(chunk[:cut].split())
+            leftover = chunk[cut + 1:]
+
+        if leftover:
+            # Finish the last token even if it runs past the end of the range.
+            tail = _read_token_tail(file, chunk_size)
+            raw_counts.update((leftover + tail).split())
+    return _normalize_counts(raw_counts, encoding)
+
+
+def count_file(path, chunk_size:int = DEFAULT_CHUNK_SIZE, workers:int = 1, encoding:str = "utf-8"):
+    """
+    This Function will count the words of a file in fixed-size chunks.
+
+    Args:
+        path: Path of the file.
+        chunk_size: Number of bytes read at a time.
+        workers: Number of processes; above 1 the file is split into byte ranges (map-reduce).
+        encoding: Text encoding of the file.
+    """
+    size = os.path.getsize(path)
+    if workers <= 1 or size <= chunk_size:
+        return _count_range((path, 0, size, chunk_size, encoding))
+
+    step = -(-size // workers)
+    ranges = [(path, start, min(start + step, size), chunk_size, encoding) for start in range(0, size, step)]
+    total = Counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for partial in pool.map(_count_range, ranges):
+            total.update(partial)
+    return total
+
+
+def top_k(counts, k:int = 10):
+    """
+    This Function will return the k most frequent words as (word, count) pairs.
+
+    Args:
+        counts: A Counter or dict of word counts.
+        k: How many words to return.
+    """
+    return heapq.nlargest(k, counts.items(), key=lambda item: item[1])
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python word_frequency.py <file> [top_k] [workers]")
+        sys.exit(1)
+    k = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else os.cpu_count()
+    for word, count in top_k(count_file(sys.argv[1], workers=workers), k):
+        print(f"{word}: {count}")
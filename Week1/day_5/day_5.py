@@ -88,3 +88,9 @@ Summary:
 # vowels = re.findall(r"[aeiou]", text, flags=re.IGNORECASE)
 # print(vowels)          # ['e', 'a', 'u', 'i', 'u', 'a', 'i', 'e', 'i', 'o', 'o']
 # print(len(vowels))     # Count of vowel letters
+########################## Faster version: text_pipeline.py #############################
+# from text_pipeline import TextPipeline
+# pipeline = TextPipeline(count=("vowels",))
+# for line in pipeline.process(["Beautiful day in the neighborhood"]):
+#     print(line.text, line.counts)    # beautiful day in the neighborhood {'vowels': 13}
+# print(pipeline.is_palindrome("A man, a plan, a canal: Panama"))  # True
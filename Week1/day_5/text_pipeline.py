@@ -0,0 +1,198 @@
+"""
+Reusable text-normalization pipeline for the exercises in day_5.py.
+
+The exercises clean one string at a time:
+
+    text = str(input()).lower()
+    text = re.sub(r"[^\\w\\s]", "", text)
+    text = " ".join(text.split())
+
+This module does the same work, but:
+- every pattern and translation table is built once, when the pipeline is created,
+- pure ASCII batches skip the regex engine and delete punctuation with a single
+  bytes.translate call (same result as the regex for ASCII text),
+- lines are processed in batches, so lowercase and punctuation stripping run
+  once over a whole batch instead of once per line,
+- results are produced lazily from any iterator of lines or from a file.
+
+Example:
+    from text_pipeline import TextPipeline
+    pipeline = TextPipeline(count=("vowels", "digits"))
+    for line in pipeline.process(["Hello,   World!", "Route 66"]):
+        print(line.text, line.counts)   # hello world {'vowels': 3, 'digits': 0} ...
+"""
+import random
+import re
+import string
+import time
+from collections import namedtuple
+from itertools import islice
+
+# ASCII characters matched by [^\w\s].
+_ASCII_PUNCTUATION = bytes(c for c in range(128) if not (chr(c).isalnum() or chr(c) == "_" or chr(c).isspace()))
+
+CHARACTER_CLASSES = {
+    "vowels": "aeiou",
+    "consonants": "bcdfghjklmnpqrstvwxyz",
+    "digits": string.digits,
+    "spaces": " ",
+}
+
+NormalizedLine = namedtuple("NormalizedLine", ["text", "counts"])
+
+
+class TextPipeline:
+    """
+    This Class will lowercase, strip punctuation, collapse whitespace and count
+    character classes for many lines at once.
+
+    Args:
+        lowercase: Convert the text to lower case.
+        strip_punctuation: Remove every character that is not a word character or whitespace.
+        collapse_whitespace: Replace runs of whitespace with one space and strip both ends.
+        count: Names from CHARACTER_CLASSES to count in the cleaned text.
+        batch_size: Number of lines cleaned together in one pass.
+    """
+
+    def __init__(self, lowercase=True, strip_punctuation=True, collapse_whitespace=True,
+                 count=("vowels",), batch_size=4096):
+        unknown = set(count) - set(CHARACTER_CLASSES)
+        if unknown:
+            raise ValueError(f"Unknown character classes: {sorted(unknown)}")
+        self.lowercase = lowercase
+        self.collapse_whitespace = collapse_whitespace
+        self.batch_size = batch_size
+        # Newlines are kept so a cleaned batch can be split back into lines.
+        self._punctuation = re.compile(r"[^\w\s]+") if strip_punctuation else None
+        # One bytes.translate pass replaces every counted character by the number of its
+        # class and deletes everything else, so only the short result is counted per class.
+        self._count_names = tuple(count)
+        table = bytearray(range(256))
+        counted = set()
+        for number, name in enumerate(self._count_names):
+            for char in set(CHARACTER_CLASSES[name] + CHARACTER_CLASSES[name].upper()):
+                table[ord(char)] = number
+                counted.add(ord(char))
+        self._count_table = bytes(table)
+        self._count_delete = bytes(c for c in range(256) if c not in counted)
+
+    def _strip_punctuation(self, text):
+        if text.isascii():
+            return text.encode("ascii").translate(None, _ASCII_PUNCTUATION).decode("ascii")
+        return self._punctuation.sub("", text)
+
+    def _clean_batch(self, lines):
+        lines = [line.rstrip("\r\n") for line in lines]
+        text = "\n".join(lines)
+        if self.lowercase:
+            text = text.lower()
+        if self._punctuation is not None:
+            text = self._strip_punctuation(text)
+        cleaned = text.split("\n")
+        if len(cleaned) != len(lines):
+            # A line had a newline inside it, so the batch cannot be split back; clean line by line.
+            return [self.normalize(line) for line in lines]
+        if self.collapse_whitespace:
+            cleaned = [" ".join(line.split()) for line in cleaned]
+        return cleaned
+
+    def count(self, text:str):
+        """
+        This Function will count the configured character classes in a text.
+
+        Args:
+            text: The text to count.
+        """
+        # The classes are ASCII and UTF-8 encodes other characters with bytes >= 128 only.
+        marks = text.encode("utf-8", "surrogatepass").translate(self._count_table, self._count_delete)
+        return {name: marks.count(number) for number, name in enumerate(self._count_names)}
+
+    def normalize(self, text:str):
+        """
+        This Function will clean a single text.
+
+        Args:
+            text: The text to clean.
+        """
+        if self.lowercase:
+            text = text.lower()
+        if self._punctuation is not None:
+            text = self._strip_punctuation(text)
+        if self.collapse_whitespace:
+            text = " ".join(text.split())
+        return text
+
+    def process(self, lines):
+        """
+        This Function will lazily yield a NormalizedLine for every input line.
+
+        Args:
+            lines: Any iterable of strings (a list, a generator, an open file ...).
+        """
+        lines = iter(lines)
+        while True:
+            batch = list(islice(lines, self.batch_size))
+            if not batch:
+                return
+            for text in self._clean_batch(batch):
+                yield NormalizedLine(text, self.count(text))
+
+    def process_file(self, path, encoding="utf-8"):
+        """
+        This Function will lazily yield a NormalizedLine for every line of a file.
+
+        Args:
+            path: Path of the text file.
+            encoding: Text encoding of the file.
+        """
+        with open(path, "r", encoding=encoding) as file:
+            yield from self.process(file)
+
+    def is_palindrome(self, text:str):
+        """
+        This Function will check if a text reads the same backwards, ignoring case, punctuation and spaces.
+
+        Args:
+            text: The text to check.
+        """
+        text = "".join(self.normalize(text).split())
+        return text == text[::-1]
+
+
+def benchmark(num_lines=200_000, repeat=3):
+    """
+    This Function will compare the per-call regex approach with the pipeline in MB/s.
+
+    Args:
+        num_lines: Number of generated lines.
+        repeat: How many times each measurement is repeated (the best is kept).
+    """
+    random.seed(42)
+    words = ["Hello,", "world!", "Python's", "regex;", "  fun", "(test)", "42", "Beautiful", "day..."]
+    lines = [" ".join(random.choices(words, k=12)) + "\n" for _ in range(num_lines)]
+    megabytes = sum(len(line) for line in lines) / 1e6
+
+    def per_call():
+        for line in lines:
+            text = line.lower()
+            text = re.sub(r"[^\w\s]", "", text)
+            text = " ".join(text.split())
+            len(re.findall(r"[aeiou]", text, flags=re.IGNORECASE))
+
+    pipeline = TextPipeline()
+
+    def batched():
+        for _ in pipeline.process(lines):
+            pass
+
+    for name, func in (("per-call regex", per_call), ("pipeline", batched)):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        print(f"{name:>15}: {megabytes / best:8.1f} MB/s")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -240,6 +240,12 @@ Tips:
 # count_words_and_lines("sample.txt")
 # make_sample("sample.txt",10)
 # count_words_and_lines("sample.txt")
+## Faster version for big files (mmap + NumPy, optional worker processes): file_counter.py
+# from file_counter import count_words_and_lines as fast_count
+# print(fast_count("sample.txt", workers=4))
+## Faster sample generator (whole NumPy blocks, reproducible seeds, GB sizes): text_generator.py
+# from text_generator import make_sample as make_big_sample
+# make_big_sample("sample.txt", "1GB", space_prob=0.3, workers=4)
 
 ############################## EXERCISE 2 Write and read a list of items  ############################################
 # list1 = ['Apple', 'Waterlemon', 'banana', 'cucamber']
@@ -265,6 +271,9 @@ Tips:
 #         print(f"An unexpected error occurred")
 
 # read_copy("sample.txt","sample2.txt")
+## Faster binary copy with constant memory (kernel copy, readinto fallback): file_copy.py
+# from file_copy import copy_file
+# copy_file("sample.txt", "sample2.txt")
 # ############################## EXERCISE 4 The number of words ############################################
 # import string
 # def words_counter(splited_line,user_word):
@@ -289,3 +298,8 @@ Tips:
 #     except Exception as e:
 #         print(f"An unexpected error occurred")
 
+## Faster repeated queries (inverted index saved to disk, incremental update): line_index.py
+# from line_index import LineIndex
+# index = LineIndex.build("sample.txt")
+# index.save("sample.idx")
+# print(LineIndex.load("sample.idx").opener("apple"))
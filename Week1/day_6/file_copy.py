@@ -0,0 +1,173 @@
+"""
+Constant-memory file copy for Exercise 3 of day_6.py.
+
+`read_copy` reads the whole source with readlines() and writes it back, so it
+needs memory for the whole file and only works for text. Here the copy is done
+in binary, in this order of preference:
+
+1. os.copy_file_range -> the kernel copies the data (no trip through Python).
+2. os.sendfile        -> also a kernel-side copy, for systems without (1).
+3. readinto loop      -> one reusable bytearray, refilled and written until EOF.
+
+copy_tree copies every file of a directory with a thread pool (the copies above
+release the GIL, so threads are enough).
+
+Example:
+    from file_copy import copy_file, copy_tree
+    copy_file("sample.txt", "sample2.txt")
+    copy_tree("snapshots/today", "backup/today", workers=8)
+"""
+import errno
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_BUFFER_SIZE = 1 << 20
+# Errors that mean "this fast path is not available here", not "the copy failed".
+_UNSUPPORTED = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.ENOTSUP, errno.EOPNOTSUPP, errno.EBADF, errno.EPERM}
+
+
+def _copy_kernel(copy_func, src_fd, dst_fd, size, chunk):
+    """
+    This Function will copy with a kernel-side call until size bytes are copied.
+
+    Returns the number of bytes copied, or None if the call is not supported (it raises
+    an "unsupported" error, or copies nothing at all on the first call: some file
+    systems report 0 instead of failing).
+
+    Args:
+        copy_func: Function(src_fd, dst_fd, offset, count) -> bytes copied.
+        src_fd: Source file descriptor.
+        dst_fd: Destination file descriptor.
+        size: Size of the source file.
+        chunk: Maximum bytes per call.
+    """
+    copied = 0
+    while copied < size:
+        try:
+            sent = copy_func(src_fd, dst_fd, copied, min(chunk, size - copied))
+        except OSError as e:
+            if copied == 0 and e.errno in _UNSUPPORTED:
+                return None
+            raise
+        if sent == 0:
+            if copied == 0:
+                return None
+            # The source got shorter while it was being copied.
+            break
+        copied += sent
+    return copied
+
+
+def _copy_file_range(src_fd, dst_fd, offset, count):
+    return os.copy_file_range(src_fd, dst_fd, count, offset, offset)
+
+
+def _sendfile(src_fd, dst_fd, offset, count):
+    os.lseek(dst_fd, offset, os.SEEK_SET)
+    return os.sendfile(dst_fd, src_fd, offset, count)
+
+
+def _copy_readinto(src, dst, buffer_size):
+    """
+    This Function will copy with one reusable buffer.
+
+    Args:
+        src: Source file opened in "rb" mode.
+        dst: Destination file opened in "wb" mode.
+        buffer_size: Size of the reusable buffer in bytes.
+    """
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    copied = 0
+    while True:
+        n = src.readinto(buffer)
+        if not n:
+            return copied
+        dst.write(view[:n])
+        copied += n
+
+
+def copy_file(filename, filename2, buffer_size:int = DEFAULT_BUFFER_SIZE, method:str = "auto"):
+    """
+    This Function will copy a file byte for byte with constant memory.
+
+    Args:
+        filename: Path of the source file.
+        filename2: Path of the destination file (overwritten if it exists).
+        buffer_size: Size of the buffer for the readinto fallback.
+        method: "auto", "copy_file_range", "sendfile" or "readinto".
+    """
+    methods = {
+        "copy_file_range": _copy_file_range if hasattr(os, "copy_file_range") else None,
+        "sendfile": _sendfile if hasattr(os, "sendfile") else None,
+    }
+    if method == "auto":
+        order = [func for func in methods.values() if func is not None]
+    elif method == "readinto":
+        order = []
+    elif method in methods:
+        if methods[method] is None:
+            raise OSError(errno.ENOSYS, f"{method} is not available on this platform")
+        order = [methods[method]]
+    else:
+        raise ValueError(f"Unknown copy method: {method!r}")
+
+    with open(filename, "rb") as src, open(filename2, "wb") as dst:
+        size = os.fstat(src.fileno()).st_size
+        if size == 0:
+            # Pseudo-files (e.g. /proc) report size 0, so read them normally.
+            order = []
+        for copy_func in order:
+            copied = _copy_kernel(copy_func, src.fileno(), dst.fileno(), size, max(buffer_size, 1 << 30))
+            if copied is not None:
+                return copied
+        # The kernel calls use explicit offsets; make sure the fallback starts at the beginning.
+        src.seek(0)
+        dst.seek(0)
+        return _copy_readinto(src, dst, buffer_size)
+
+
+def copy_tree(source_dir, target_dir, workers:int = 8, buffer_size:int = DEFAULT_BUFFER_SIZE):
+    """
+    This Function will copy every file under a directory with a thread pool.
+
+    File permissions and modification times are kept. Returns the total number of bytes copied.
+
+    Args:
+        source_dir: Directory to copy.
+        target_dir: Destination directory (created if needed).
+        workers: Number of copy threads.
+        buffer_size: Size of the buffer for the readinto fallback.
+    """
+    jobs = []
+    for root, _, files in os.walk(source_dir):
+        destination = os.path.join(target_dir, os.path.relpath(root, source_dir))
+        os.makedirs(destination, exist_ok=True)
+        for name in files:
+            jobs.append((os.path.join(root, name), os.path.join(destination, name)))
+
+    def copy_one(job):
+        src, dst = job
+        copied = copy_file(src, dst, buffer_size)
+        shutil.copystat(src, dst)
+        return copied
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return sum(pool.map(copy_one, jobs))
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    if len(sys.argv) < 3:
+        print("Usage: python file_copy.py <source> <destination>")
+        sys.exit(1)
+    start = time.perf_counter()
+    if os.path.isdir(sys.argv[1]):
+        total = copy_tree(sys.argv[1], sys.argv[2])
+    else:
+        total = copy_file(sys.argv[1], sys.argv[2])
+    elapsed = time.perf_counter() - start
+    print(f"Copied {total / 1e6:.1f} MB in {elapsed:.2f}s")
@@ -0,0 +1,125 @@
+"""
+`wc`-style line and word counter for Exercise 1 of day_6.py.
+
+`count_words_and_lines` calls file.readlines(), which loads the whole file
+into Python strings. Here the file is memory-mapped and counted as raw bytes
+with NumPy:
+
+- lines = number of b"\\n" bytes,
+- words = number of non-whitespace bytes whose previous byte is whitespace
+  (the same whitespace as bytes.split(): space, \\t, \\n, \\v, \\f, \\r).
+
+Only one block of the file is turned into NumPy temporaries at a time, so memory
+stays constant. Big files are cut into page-aligned ranges that are counted by
+worker processes and then added together.
+
+Example:
+    from file_counter import count_words_and_lines
+    lines, words = count_words_and_lines("sample.txt", workers=8)
+"""
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+DEFAULT_BLOCK_SIZE = 1 << 24
+
+_IS_SPACE = np.zeros(256, dtype=bool)
+_IS_SPACE[list(b" \t\n\x0b\x0c\r")] = True
+
+
+def _count_block(block, previous_is_space:bool):
+    """
+    This Function will count newlines and word starts in one block of bytes.
+
+    Args:
+        block: A uint8 NumPy array.
+        previous_is_space: True if the byte before the block is whitespace (or there is none).
+    """
+    lines = int(np.count_nonzero(block == 10))
+    space = _IS_SPACE[block]
+    words = int(np.count_nonzero(~space[1:] & space[:-1]))
+    if not space[0] and previous_is_space:
+        words += 1
+    return lines, words, bool(space[-1])
+
+
+def _count_mapped(data, start:int, end:int, previous_is_space:bool, block_size:int):
+    """
+    This Function will count lines and words in data[start:end], one block at a time.
+
+    Args:
+        data: A uint8 NumPy view of the mapped file.
+        start: First byte to count.
+        end: Byte after the last one to count.
+        previous_is_space: True if the byte before start is whitespace (or there is none).
+        block_size: Number of bytes per block.
+    """
+    lines = words = 0
+    for block_start in range(start, end, block_size):
+        block_lines, block_words, previous_is_space = _count_block(
+            data[block_start:min(block_start + block_size, end)], previous_is_space)
+        lines += block_lines
+        words += block_words
+    return lines, words
+
+
+def _count_range(args):
+    """
+    This Function will count lines and words in the byte range [start, end) of a file.
+
+    Args:
+        args: A tuple (path, start, end, block_size).
+    """
+    path, start, end, block_size = args
+    # Map from one byte before start (to know if a word continues into the range),
+    # rounded down because mmap offsets must be a multiple of the allocation granularity.
+    first = max(start - 1, 0)
+    offset = first - first % mmap.ALLOCATIONGRANULARITY
+    with open(path, "rb") as file:
+        with mmap.mmap(file.fileno(), end - offset, offset=offset, access=mmap.ACCESS_READ) as mapped:
+            data = np.frombuffer(mapped, dtype=np.uint8)
+            previous_is_space = start == 0 or bool(_IS_SPACE[data[start - 1 - offset]])
+            result = _count_mapped(data, start - offset, end - offset, previous_is_space, block_size)
+            # The NumPy view must be released before the map can be closed.
+            del data
+    return result
+
+
+def count_words_and_lines(filename, workers:int = 1, block_size:int = DEFAULT_BLOCK_SIZE):
+    """
+    This Function will count the lines and words of a file without reading it into Python strings.
+
+    Args:
+        filename: Path of the file.
+        workers: Number of processes; above 1 the file is split into page-aligned ranges.
+        block_size: Number of bytes turned into NumPy temporaries at a time.
+    """
+    size = os.path.getsize(filename)
+    if size == 0:
+        return 0, 0
+    if workers <= 1 or size <= block_size:
+        return _count_range((filename, 0, size, block_size))
+
+    step = -(-size // workers)
+    step += -step % mmap.ALLOCATIONGRANULARITY
+    ranges = [(filename, start, min(start + step, size), block_size) for start in range(0, size, step)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_count_range, ranges))
+    return sum(lines for lines, _ in results), sum(words for _, words in results)
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    if len(sys.argv) < 2:
+        print("Usage: python file_counter.py <file> [workers]")
+        sys.exit(1)
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    start = time.perf_counter()
+    line_count, word_count = count_words_and_lines(sys.argv[1], workers=workers)
+    print(f"Number of lines: {line_count}")
+    print(f"Number of words: {word_count}")
+    print(f"Time: {time.perf_counter() - start:.2f}s")
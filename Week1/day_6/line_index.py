@@ -0,0 +1,280 @@
+"""
+Persistent inverted index for Exercise 4 of day_6.py.
+
+`opener` rescans the whole file and re-splits every line for every word that is
+queried. Here the file is read once and turned into an inverted index:
+
+    word -> postings [(line number, count in that line), ...]
+
+Words are normalized like `words_counter`: word.lower().strip(string.punctuation).
+
+Postings are compressed with varints (line numbers stored as the gap from the
+previous line), and the index is saved in a compact binary file. Queries are then
+answered from the index without touching the source file. When lines are
+appended to the source, `update` only reads the new bytes.
+
+Example:
+    from line_index import LineIndex
+    index = LineIndex.build("sample.txt")
+    index.save("sample.idx")
+    index = LineIndex.load("sample.idx")
+    index.update("sample.txt")          # picks up appended lines
+    print(index.lookup("apple"))        # [(1, 2), (7, 1)]
+    print(index.opener("apple"))        # {'Line1': 2, 'Line2': 0, ...} like opener()
+"""
+import os
+import string
+import struct
+from collections import Counter
+
+MAGIC = b"LIDX"
+VERSION = 1
+_HEADER = struct.Struct("<4sBQQQI")
+# Word length and postings length, both in bytes (uint32, so any token length fits).
+_WORD = struct.Struct("<II")
+
+
+def normalize(word:str):
+    """
+    This Function will lowercase a word and strip punctuation from both ends.
+
+    Args:
+        word: A single word.
+    """
+    return word.lower().strip(string.punctuation)
+
+
+def _line_words(line:bytes, encoding:str):
+    counts = Counter()
+    for word in line.decode(encoding, errors="replace").split():
+        word = normalize(word)
+        if word:
+            counts[word] += 1
+    return counts
+
+
+def encode_postings(postings):
+    """
+    This Function will compress a list of (line, count) pairs into varint bytes.
+
+    Args:
+        postings: (line, count) pairs sorted by line.
+    """
+    out = bytearray()
+    previous = 0
+    for line, count in postings:
+        for value in (line - previous, count):
+            while value >= 0x80:
+                out.append((value & 0x7F) | 0x80)
+                value >>= 7
+            out.append(value)
+        previous = line
+    return bytes(out)
+
+
+def decode_postings(data:bytes):
+    """
+    This Function will expand varint bytes back into a list of (line, count) pairs.
+
+    Args:
+        data: Bytes made by encode_postings.
+    """
+    values = []
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            values.append(value)
+            value = shift = 0
+    postings = []
+    line = 0
+    for i in range(0, len(values), 2):
+        line += values[i]
+        postings.append((line, values[i + 1]))
+    return postings
+
+
+class LineIndex:
+    """
+    This Class will keep an inverted index of the words in a text file.
+
+    Attributes:
+        line_count: Number of lines indexed.
+        indexed_bytes: Number of source bytes already indexed.
+        tail_start: Byte offset of the last line if it had no newline yet (it is re-indexed on update).
+    """
+
+    def __init__(self, encoding:str = "utf-8"):
+        self.encoding = encoding
+        self.line_count = 0
+        self.indexed_bytes = 0
+        self.tail_start = None
+        self._encoded = {}
+        self._decoded = {}
+
+    @classmethod
+    def build(cls, path, encoding:str = "utf-8"):
+        """
+        This Function will build the index of a file in one pass.
+
+        Args:
+            path: Path of the text file.
+            encoding: Text encoding of the file.
+        """
+        index = cls(encoding)
+        index.update(path)
+        return index
+
+    def _postings(self, word:str):
+        if word not in self._decoded:
+            self._decoded[word] = decode_postings(self._encoded.pop(word, b""))
+        return self._decoded[word]
+
+    def update(self, path):
+        """
+        This Function will index the lines appended to the file since the last build or update.
+
+        Args:
+            path: Path of the text file.
+        """
+        size = os.path.getsize(path)
+        if size < self.indexed_bytes:
+            raise ValueError(f"{path} is smaller than when it was indexed; rebuild the index")
+
+        with open(path, "rb") as file:
+            if self.tail_start is not None:
+                # The last line had no newline, so it may have grown: remove it and read it again.
+                file.seek(self.tail_start)
+                for word in _line_words(file.read(self.indexed_bytes - self.tail_start), self.encoding):
+                    postings = self._postings(word)
+                    if postings and postings[-1][0] == self.line_count:
+                        postings.pop()
+                self.line_count -= 1
+                self.indexed_bytes = self.tail_start
+                self.tail_start = None
+
+            file.seek(self.indexed_bytes)
+            position = self.indexed_bytes
+            for line in file:
+                self.line_count += 1
+                for word, count in _line_words(line, self.encoding).items():
+                    self._postings(word).append((self.line_count, count))
+                if not line.endswith(b"\n"):
+                    self.tail_start = position
+                position += len(line)
+            self.indexed_bytes = position
+        return self
+
+    def lookup(self, word:str):
+        """
+        This Function will return every (line number, count) pair for a word.
+
+        Args:
+            word: The word to look up (normalized like the indexed words).
+        """
+        word = normalize(word)
+        if word not in self._decoded and word not in self._encoded:
+            return []
+        # The first lookup decodes the postings; later lookups reuse them.
+        return list(self._postings(word))
+
+    def count(self, word:str):
+        """
+        This Function will return how many times a word appears in the whole file.
+
+        Args:
+            word: The word to count.
+        """
+        return sum(count for _, count in self.lookup(word))
+
+    def opener(self, word:str):
+        """
+        This Function will return {'LineN': count} for every line, like opener() in day_6.py.
+
+        Args:
+            word: The word to count.
+        """
+        result = {f"Line{n}": 0 for n in range(1, self.line_count + 1)}
+        for line, count in self.lookup(word):
+            result[f"Line{line}"] = count
+        return result
+
+    def __contains__(self, word):
+        word = normalize(word)
+        return bool(self._decoded.get(word) or self._encoded.get(word))
+
+    def save(self, index_path):
+        """
+        This Function will write the index to a compact binary file.
+
+        Layout: header (magic, version, indexed_bytes, tail_start, line_count, word count),
+        then for every word: word length, postings length, word, varint postings.
+
+        Args:
+            index_path: Path of the index file (replaced atomically).
+        """
+        words = {word: data for word, data in self._encoded.items() if data}
+        for word, postings in self._decoded.items():
+            if postings:
+                words[word] = encode_postings(postings)
+
+        tmp_path = f"{index_path}.tmp"
+        with open(tmp_path, "wb") as file:
+            tail = self.tail_start if self.tail_start is not None else self.indexed_bytes
+            file.write(_HEADER.pack(MAGIC, VERSION, self.indexed_bytes, tail, self.line_count, len(words)))
+            for word in sorted(words):
+                raw = word.encode("utf-8")
+                file.write(_WORD.pack(len(raw), len(words[word])))
+                file.write(raw)
+                file.write(words[word])
+        os.replace(tmp_path, index_path)
+
+    @classmethod
+    def load(cls, index_path, encoding:str = "utf-8"):
+        """
+        This Function will read an index saved with save().
+
+        Postings stay compressed until a word is looked up.
+
+        Args:
+            index_path: Path of the index file.
+            encoding: Text encoding of the source file.
+        """
+        with open(index_path, "rb") as file:
+            data = file.read()
+        magic, version, indexed_bytes, tail, line_count, num_words = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{index_path} is not a line index (version {VERSION})")
+
+        index = cls(encoding)
+        index.indexed_bytes = indexed_bytes
+        index.tail_start = tail if tail != indexed_bytes else None
+        index.line_count = line_count
+        offset = _HEADER.size
+        for _ in range(num_words):
+            word_length, postings_length = _WORD.unpack_from(data, offset)
+            offset += _WORD.size
+            word = data[offset:offset + word_length].decode("utf-8")
+            offset += word_length
+            index._encoded[word] = data[offset:offset + postings_length]
+            offset += postings_length
+        return index
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 3:
+        print("Usage: python line_index.py <file> <word> [word ...]")
+        sys.exit(1)
+    index_path = sys.argv[1] + ".idx"
+    try:
+        line_index = LineIndex.load(index_path).update(sys.argv[1])
+    except (OSError, ValueError):
+        # No index yet, an index of an older format, or the file shrank: build from scratch.
+        line_index = LineIndex.build(sys.argv[1])
+    line_index.save(index_path)
+    for query in sys.argv[2:]:
+        print(query, line_index.lookup(query))
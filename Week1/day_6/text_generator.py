@@ -0,0 +1,156 @@
+"""
+Bulk random-text generator for stress-testing the word/line counters.
+
+`make_sample` in day_6.py reopens the file for every line and builds each
+string one character at a time with random.choice. Here whole blocks of bytes
+are generated at once from NumPy random streams and written with large writes.
+
+Every block gets its own random stream derived from (seed, block number), so the
+same seed always produces the same file, no matter how many worker processes
+share the work.
+
+Example:
+    from text_generator import make_sample
+    make_sample("corpus.txt", "2GB", space_prob=0.2, workers=8)
+"""
+import os
+import re
+import string
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+
+CHARACTERS = np.frombuffer((string.ascii_letters + string.digits).encode("ascii"), dtype=np.uint8)
+DEFAULT_BLOCK_SIZE = 1 << 24
+
+_UNITS = {"": 1, "B": 1, "KB": 10**3, "MB": 10**6, "GB": 10**9, "TB": 10**12,
+          "KIB": 2**10, "MIB": 2**20, "GIB": 2**30, "TIB": 2**40}
+
+
+def parse_size(size):
+    """
+    This Function will turn a size like 1024, "500MB" or "2.5GB" into a number of bytes.
+
+    Args:
+        size: An integer number of bytes or a string with a unit.
+    """
+    if isinstance(size, int):
+        return size
+    match = re.fullmatch(r"\s*([\d.]+)\s*([a-zA-Z]*)\s*", str(size))
+    if not match or match.group(2).upper() not in _UNITS:
+        raise ValueError(f"Invalid size: {size!r}")
+    return int(float(match.group(1)) * _UNITS[match.group(2).upper()])
+
+
+@lru_cache(maxsize=16)
+def _symbol_table(space_prob:float):
+    """
+    This Function will build a 65536-entry lookup table from random uint16 values to output bytes.
+
+    The first round(space_prob * 65536) entries are spaces and the rest cycle through
+    CHARACTERS, so one table lookup picks both "space or not" and the character.
+
+    Args:
+        space_prob: Probability of each character being a space.
+    """
+    spaces = round(space_prob * 65536)
+    table = np.empty(65536, dtype=np.uint8)
+    table[:spaces] = ord(" ")
+    table[spaces:] = CHARACTERS[np.arange(65536 - spaces) % len(CHARACTERS)]
+    return table
+
+
+def generate_block(rng, length:int, space_prob:float = 0.2, line_length:int = 80):
+    """
+    This Function will generate a block of random letters, digits, spaces and newlines.
+
+    Args:
+        rng: A numpy.random.Generator.
+        length: Number of bytes to generate.
+        space_prob: Probability of each character being a space (resolution 1/65536).
+        line_length: Bytes per line including the newline (0 for no newlines).
+    """
+    if not 0 <= space_prob <= 1:
+        raise ValueError("space_prob must be between 0 and 1")
+    symbols = np.frombuffer(rng.bytes(2 * length), dtype=np.uint16)
+    block = np.take(_symbol_table(space_prob), symbols)
+    if line_length > 0:
+        block[line_length - 1::line_length] = ord("\n")
+    return block
+
+
+def _block_rng(seed:int, index:int):
+    return np.random.Generator(np.random.PCG64(np.random.SeedSequence(seed, spawn_key=(index,))))
+
+
+def _write_blocks(args):
+    """
+    This Function will write a run of blocks into their place in the output file.
+
+    Args:
+        args: A tuple (filename, size, first_block, last_block, block_size, space_prob, line_length, seed).
+    """
+    filename, size, first_block, last_block, block_size, space_prob, line_length, seed = args
+    fd = os.open(filename, os.O_WRONLY)
+    try:
+        for index in range(first_block, last_block):
+            offset = index * block_size
+            block = generate_block(_block_rng(seed, index), min(block_size, size - offset), space_prob, line_length)
+            view = memoryview(block)
+            while view:
+                written = os.pwrite(fd, view, offset)
+                view = view[written:]
+                offset += written
+    finally:
+        os.close(fd)
+
+
+def make_sample(filename, size, space_prob:float = 0.2, line_length:int = 80, seed:int = 0,
+                workers:int = 1, block_size:int = DEFAULT_BLOCK_SIZE):
+    """
+    This Function will create a random text file of the requested size.
+
+    Args:
+        filename: Path of the output file (overwritten if it exists).
+        size: Target size in bytes, or a string like "500MB" / "2GB".
+        space_prob: Probability of each character being a space.
+        line_length: Bytes per line including the newline (0 for no newlines).
+        seed: Seed of the random streams; the same seed gives the same file.
+        workers: Number of processes that generate and write blocks.
+        block_size: Bytes generated per block (rounded down to whole lines).
+    """
+    size = parse_size(size)
+    if line_length > 0:
+        block_size = max(line_length, block_size - block_size % line_length)
+
+    with open(filename, "wb") as file:
+        file.truncate(size)
+
+    num_blocks = -(-size // block_size)
+    workers = max(1, min(workers, num_blocks))
+    per_worker = -(-num_blocks // workers) if num_blocks else 0
+    jobs = [(filename, size, first, min(first + per_worker, num_blocks), block_size, space_prob, line_length, seed)
+            for first in range(0, num_blocks, per_worker or 1)]
+    if workers == 1:
+        for job in jobs:
+            _write_blocks(job)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_write_blocks, jobs))
+    return size
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    if len(sys.argv) < 3:
+        print("Usage: python text_generator.py <file> <size, e.g. 1GB> [workers] [seed]")
+        sys.exit(1)
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else os.cpu_count()
+    seed = int(sys.argv[4]) if len(sys.argv) > 4 else 0
+    start = time.perf_counter()
+    written = make_sample(sys.argv[1], sys.argv[2], workers=workers, seed=seed)
+    elapsed = time.perf_counter() - start
+    print(f"Wrote {written / 1e6:.1f} MB in {elapsed:.2f}s ({written / 1e6 / elapsed:.1f} MB/s)")
@@ -322,63 +322,187 @@ Key points:
 
 ################################## Hands-On Project : Command-Line Task Manager ################################################################################
 
-tasks = {}
+import argparse
+import sys
+from pathlib import Path
+from task_store import TaskStore, parse_command
+
+# Tasks are kept in task_store.TaskStore: O(log n) access by task number and
+# an append-only log (tasks.log) so they survive between runs. The log is opened
+# in main(), so importing this file does not create it.
+TASKS_LOG = Path(__file__).parent / "tasks.log"
+PAGE_SIZE = 20
+tasks = None
 
 def Create_task(task:str):
-    tasks[task] = ""
+    tasks.add(task)
+    tasks.flush()
 
 def Check_task(number_of_task:int):
-    key = list(tasks.keys())[number_of_task-1]
-    tasks[key] = 'Done'
+    tasks.mark_done(number_of_task)
+    tasks.flush()
 
 def Delete_task(number_of_task:int):
-    key = list(tasks.keys())[number_of_task - 1]
-    del tasks[key]
+    tasks.delete(number_of_task)
+    tasks.flush()
     print("The Task deleted!")
 
-while True:
-    for i, (key, value) in enumerate(tasks.items()):
-        print(f"{i+1}_{key}: {value}")
-    print()
-    print()
-    print("Choose an action:")
-    print("1. Add a task")
-    print("2. Mark a task as done")
-    print("3. Delete a task")
-    print("4. Exit")
-    
-    choice = input("Enter your choice (1-4): ").strip()
-    
-    if choice == '1':
-        task_name = input("Enter the new task: ").strip()
-        Create_task(task_name)
-        print("Task added.\n")
-        
-    elif choice == '2':
-        if not tasks:
-            print("No tasks to mark done.\n")
-            continue
-        task_num = input("Enter the number of the task to mark as done: ").strip()
-        if task_num.isdigit() and 1 <= int(task_num) <= len(tasks):
-            Check_task(int(task_num))
-            print("Task marked as done.\n")
-        else:
-            print("Invalid task number.\n")
-            
-    elif choice == '3':
-        if not tasks:
-            print("No tasks to delete.\n")
-            continue
-        task_num = input("Enter the number of the task to delete: ").strip()
-        if task_num.isdigit() and 1 <= int(task_num) <= len(tasks):
-            Delete_task(int(task_num))
-            print()
+def Print_tasks(page:int = 1, page_size:int = PAGE_SIZE):
+    """
+    This Function will print one page of tasks instead of the whole list.
+
+    Args:
+        page: Page number (1-based).
+        page_size: Number of tasks per page.
+    """
+    if page < 1:
+        raise ValueError(f"Page must be 1 or more, not {page}")
+    if page_size < 1:
+        raise ValueError(f"Page size must be 1 or more, not {page_size}")
+    first = (page - 1) * page_size + 1
+    for i, (key, value) in enumerate(tasks.items(first, first + page_size - 1), start=first):
+        print(f"{i}_{key}: {value}")
+    pages = page_count(page_size)
+    print(f"-- page {page}/{pages}, {len(tasks)} tasks --")
+
+def page_count(page_size:int = PAGE_SIZE):
+    return max(1, -(-len(tasks) // page_size))
+
+def open_input(filename:str):
+    if filename == "-":
+        return sys.stdin
+    return open(filename, "r", encoding="utf-8")
+
+def run_batch_mode(argv):
+    """
+    This Function will run the task manager without the menu, for scripts.
+
+    Examples:
+        python day_7.py add "Buy milk"
+        python day_7.py done 3
+        python day_7.py delete 3
+        python day_7.py list --page 2 --page-size 50
+        python day_7.py batch commands.txt     (lines like "add ...", "done 3", "delete 3"; "-" = stdin)
+        python day_7.py import tasks.jsonl     (JSON Lines {"task": ..., "status": ...}; "-" = stdin)
+        python day_7.py export tasks.jsonl     ("-" = stdout)
+
+    batch and import apply every line in one transaction: if one line fails, nothing changes.
+
+    Args:
+        argv: Command-line arguments without the script name (sys.argv[1:]).
+    """
+    parser = argparse.ArgumentParser(prog="day_7.py", description="Command-line task manager")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("add", help="add a task").add_argument("task", nargs="+")
+    commands.add_parser("done", help="mark task number N as done").add_argument("number", type=int)
+    commands.add_parser("delete", help="delete task number N").add_argument("number", type=int)
+    list_parser = commands.add_parser("list", help="print one page of tasks")
+    list_parser.add_argument("--page", type=int, default=1)
+    list_parser.add_argument("--page-size", type=int, default=PAGE_SIZE)
+    commands.add_parser("batch", help="apply commands from a file").add_argument("file")
+    commands.add_parser("import", help="import tasks from JSON Lines").add_argument("file")
+    commands.add_parser("export", help="export tasks as JSON Lines").add_argument("file")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "add":
+            Create_task(" ".join(args.task))
+        elif args.command == "done":
+            Check_task(args.number)
+        elif args.command == "delete":
+            Delete_task(args.number)
+        elif args.command == "list":
+            Print_tasks(args.page, args.page_size)
+        elif args.command == "batch":
+            with open_input(args.file) as file, tasks.transaction():
+                for line in file:
+                    if line.strip():
+                        tasks.apply(parse_command(line))
+            print(f"Batch applied, {len(tasks)} tasks.")
+        elif args.command == "import":
+            with open_input(args.file) as file:
+                tasks.import_jsonl(file)
+            print(f"Import done, {len(tasks)} tasks.")
+        elif args.command == "export":
+            if args.file == "-":
+                tasks.export_jsonl(sys.stdout)
+            else:
+                with open(args.file, "w", encoding="utf-8") as file:
+                    tasks.export_jsonl(file)
+    except (IndexError, KeyError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        tasks.close()
+    return 0
+
+def main():
+    """
+    This Function will open the task log and run the batch command or the interactive menu.
+    """
+    global tasks
+    tasks = TaskStore(TASKS_LOG)
+    if len(sys.argv) > 1:
+        return run_batch_mode(sys.argv[1:])
+    run_menu()
+    return 0
+
+def run_menu():
+    """
+    This Function will run the interactive menu.
+    """
+    page = 1
+    while True:
+        # Deleting tasks can leave fewer pages than the current page number.
+        page = min(page, page_count())
+        Print_tasks(page)
+        print()
+        print("Choose an action:")
+        print("1. Add a task")
+        print("2. Mark a task as done")
+        print("3. Delete a task")
+        print("4. Exit")
+        print("5. Next page of tasks")
+
+        choice = input("Enter your choice (1-5): ").strip()
+
+        if choice == '1':
+            task_name = input("Enter the new task: ").strip()
+            Create_task(task_name)
+            print("Task added.\n")
+
+        elif choice == '2':
+            if not tasks:
+                print("No tasks to mark done.\n")
+                continue
+            task_num = input("Enter the number of the task to mark as done: ").strip()
+            if task_num.isdigit() and 1 <= int(task_num) <= len(tasks):
+                Check_task(int(task_num))
+                print("Task marked as done.\n")
+            else:
+                print("Invalid task number.\n")
+
+        elif choice == '3':
+            if not tasks:
+                print("No tasks to delete.\n")
+                continue
+            task_num = input("Enter the number of the task to delete: ").strip()
+            if task_num.isdigit() and 1 <= int(task_num) <= len(tasks):
+                Delete_task(int(task_num))
+                print()
+            else:
+                print("Invalid task number.\n")
+
+        elif choice == '4':
+            tasks.close()
+            print("Goodbye!")
+            break
+
+        elif choice == '5':
+            page = page + 1 if page * PAGE_SIZE < len(tasks) else 1
+
         else:
-            print("Invalid task number.\n")
-            
-    elif choice == '4':
-        print("Goodbye!")
-        break
-        
-    else:
-        print("Invalid choice. Please try again.\n")
\ No newline at end of file
+            print("Invalid choice. Please try again.\n")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,468 @@
+"""
+Indexed, persistent storage for the command-line task manager in day_7.py.
+
+The task manager keeps tasks in a dict and finds "task number n" with
+list(tasks.keys())[n - 1], which copies every key on every action, and all
+tasks are lost on exit. TaskStore fixes both:
+
+- Order-statistic index: tasks live in insertion slots, and a Fenwick tree
+  (binary indexed tree) counts the live slots, so "the n-th task" is found in
+  O(log n) even after deletions. Lookups by name are O(1) through a dict.
+- Durability: every change is appended to a JSON Lines log. On start-up the log
+  is replayed; when it holds many more records than live tasks it is compacted
+  (rewritten with only the live tasks, then atomically swapped in).
+
+The store behaves like the old dict where day_7.py needs it:
+len(tasks), `if not tasks`, tasks.items() (in order) and `name in tasks`.
+
+Example:
+    from task_store import TaskStore
+    tasks = TaskStore("tasks.log")
+    tasks.add("Buy milk")
+    tasks.mark_done(1)
+    tasks.delete(1)
+"""
+import json
+import os
+import warnings
+from contextlib import contextmanager
+
+
+class FenwickTree:
+    """
+    This Class will keep prefix sums of 0/1 flags with O(log n) updates and k-th lookups.
+
+    Args:
+        flags: Initial list of 0/1 values.
+    """
+
+    def __init__(self, flags=()):
+        self._tree = [0] + list(flags)
+        size = len(self._tree)
+        # O(n) construction: push every node's sum to its parent.
+        for i in range(1, size):
+            parent = i + (i & -i)
+            if parent < size:
+                self._tree[parent] += self._tree[i]
+
+    def __len__(self):
+        return len(self._tree) - 1
+
+    def copy(self):
+        """
+        This Function will return an independent copy of the tree.
+        """
+        tree = FenwickTree()
+        tree._tree = list(self._tree)
+        return tree
+
+    def append(self, value:int):
+        """
+        This Function will add one more flag at the end.
+
+        Args:
+            value: 0 or 1.
+        """
+        i = len(self._tree)
+        # Node i covers (i - lowbit(i), i]; add the sums of the nodes it covers.
+        total = value
+        child = i - 1
+        stop = i - (i & -i)
+        while child > stop:
+            total += self._tree[child]
+            child -= child & -child
+        self._tree.append(total)
+
+    def add(self, index:int, delta:int):
+        """
+        This Function will add delta to the flag at a 0-based index.
+
+        Args:
+            index: 0-based position.
+            delta: Value to add.
+        """
+        i = index + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def find_kth(self, k:int):
+        """
+        This Function will return the 0-based index of the k-th set flag (k starts at 1).
+
+        Args:
+            k: Rank of the wanted flag.
+        """
+        position = 0
+        step = 1 << (len(self._tree) - 1).bit_length()
+        while step:
+            nxt = position + step
+            if nxt < len(self._tree) and self._tree[nxt] < k:
+                position = nxt
+                k -= self._tree[nxt]
+            step >>= 1
+        return position
+
+
+class TaskStore:
+    """
+    This Class will store tasks in order with O(log n) access by task number and an append-only log.
+
+    Args:
+        path: Path of the JSON Lines log file, or None to keep tasks only in memory.
+        compact_ratio: Compact when the log has this many times more records than live tasks.
+        compact_min_records: Never compact logs shorter than this.
+    """
+
+    def __init__(self, path=None, compact_ratio:int = 4, compact_min_records:int = 10_000):
+        self.path = path
+        self.compact_ratio = compact_ratio
+        self.compact_min_records = compact_min_records
+        self._names = []
+        self._status = []
+        self._slot = {}
+        self._alive = FenwickTree()
+        self._log = None
+        self._log_records = 0
+        self._pending = None
+        if path is not None:
+            self._replay()
+            self._log = open(path, "a", encoding="utf-8")
+
+    def _replay(self):
+        """
+        This Function will rebuild the tasks from the log file.
+
+        A malformed last record (a crash in the middle of an append) is dropped with
+        a warning and cut off the file, so the log stays usable; a malformed record
+        before other records means real corruption and raises ValueError.
+        """
+        if not os.path.exists(self.path):
+            return
+        alive = []
+        with open(self.path, "rb") as file:
+            lines = file.readlines()
+        good_bytes = 0
+        for number, raw in enumerate(lines, 1):
+            if not raw.strip():
+                good_bytes += len(raw)
+                continue
+            try:
+                record = json.loads(raw.decode("utf-8"))
+                op, name = record["op"], record["task"]
+            except (ValueError, KeyError, TypeError) as error:
+                if any(rest.strip() for rest in lines[number:]):
+                    raise ValueError(f"Task log {self.path} is corrupt at line {number}: {error}") from error
+                warnings.warn(f"Dropping incomplete last record of task log {self.path} (line {number})")
+                self._truncate(good_bytes)
+                break
+            good_bytes += len(raw)
+            if not raw.endswith(b"\n"):
+                # The last record is complete but its newline was never written.
+                with open(self.path, "ab") as file:
+                    file.write(b"\n")
+            self._log_records += 1
+            slot = self._slot.get(name)
+            if op == "add":
+                if slot is None:
+                    self._slot[name] = len(self._names)
+                    self._names.append(name)
+                    self._status.append(record.get("status", ""))
+                    alive.append(1)
+                else:
+                    self._status[slot] = record.get("status", "")
+            elif op == "done" and slot is not None:
+                self._status[slot] = "Done"
+            elif op == "delete" and slot is not None:
+                del self._slot[name]
+                alive[slot] = 0
+        self._alive = FenwickTree(alive)
+        self._compact_slots()
+
+    def _truncate(self, size:int):
+        with open(self.path, "r+b") as file:
+            file.truncate(size)
+            file.flush()
+            os.fsync(file.fileno())
+
+    def _write(self, op:str, name:str):
+        if self._log is None:
+            return
+        record = json.dumps({"op": op, "task": name}, ensure_ascii=False) + "\n"
+        if self._pending is not None:
+            self._pending.append(record)
+        else:
+            self._log.write(record)
+            self._log_records += 1
+
+    def _compact_slots(self):
+        """
+        This Function will drop deleted slots from memory when they outnumber live ones.
+        """
+        if len(self._names) < 2 * len(self._slot) + 1024:
+            return
+        live = [slot for slot, name in enumerate(self._names) if self._slot.get(name) == slot]
+        self._names = [self._names[slot] for slot in live]
+        self._status = [self._status[slot] for slot in live]
+        self._slot = {name: i for i, name in enumerate(self._names)}
+        self._alive = FenwickTree([1] * len(self._names))
+
+    def _slot_of(self, number:int):
+        if not 1 <= number <= len(self):
+            raise IndexError(f"Task number {number} is out of range (1-{len(self)})")
+        return self._alive.find_kth(number)
+
+    def __len__(self):
+        return len(self._slot)
+
+    def __contains__(self, name):
+        return name in self._slot
+
+    def __getitem__(self, name):
+        return self._status[self._slot[name]]
+
+    def items(self, start:int = 1, stop:int = None):
+        """
+        This Function will yield (task, status) pairs in order, optionally only tasks start..stop.
+
+        Args:
+            start: First task number (1-based).
+            stop: Last task number (inclusive), or None for the end.
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        if start > stop:
+            return
+        slot = self._slot_of(start)
+        remaining = stop - start + 1
+        while remaining:
+            name = self._names[slot]
+            if self._slot.get(name) == slot:
+                yield name, self._status[slot]
+                remaining -= 1
+            slot += 1
+
+    def keys(self):
+        return (name for name, _ in self.items())
+
+    def __iter__(self):
+        return self.keys()
+
+    def name_of(self, number:int):
+        """
+        This Function will return the name of task number n (1-based).
+
+        Args:
+            number: Task number as shown in the list.
+        """
+        return self._names[self._slot_of(number)]
+
+    def add(self, name:str):
+        """
+        This Function will add a task (or reset an existing task to not done, like the old dict).
+
+        Args:
+            name: Task description.
+        """
+        slot = self._slot.get(name)
+        if slot is None:
+            self._slot[name] = len(self._names)
+            self._names.append(name)
+            self._status.append("")
+            self._alive.append(1)
+        else:
+            self._status[slot] = ""
+        self._write("add", name)
+
+    def _set_done(self, slot:int):
+        self._status[slot] = "Done"
+        self._write("done", self._names[slot])
+
+    def _remove(self, slot:int):
+        name = self._names[slot]
+        del self._slot[name]
+        self._alive.add(slot, -1)
+        self._write("delete", name)
+        self._compact_slots()
+
+    def mark_done(self, number:int):
+        """
+        This Function will mark task number n as done.
+
+        Args:
+            number: Task number as shown in the list.
+        """
+        self._set_done(self._slot_of(number))
+
+    def delete(self, number:int):
+        """
+        This Function will delete task number n.
+
+        Args:
+            number: Task number as shown in the list.
+        """
+        self._remove(self._slot_of(number))
+
+    def mark_done_task(self, name:str):
+        """
+        This Function will mark a task as done by its name.
+
+        Args:
+            name: Task description.
+        """
+        self._set_done(self._slot[name])
+
+    def delete_task(self, name:str):
+        """
+        This Function will delete a task by its name.
+
+        Args:
+            name: Task description.
+        """
+        self._remove(self._slot[name])
+
+    def apply(self, command:dict):
+        """
+        This Function will run one command dict.
+
+        Commands:
+            {"op": "add", "task": name}
+            {"op": "done" / "delete", "id": task number}  or  {"op": ..., "task": name}
+            {"task": name, "status": "Done" or ""}        (an exported task; added or updated)
+
+        Args:
+            command: The command to run.
+        """
+        op = command.get("op", "import")
+        if op == "import" or op == "add":
+            self.add(command["task"])
+            if command.get("status") == "Done":
+                self.mark_done_task(command["task"])
+        elif op in ("done", "delete"):
+            if "id" in command:
+                slot = self._slot_of(int(command["id"]))
+            elif command.get("task") in self._slot:
+                slot = self._slot[command["task"]]
+            else:
+                raise KeyError(f"Unknown task: {command.get('task')!r}")
+            if op == "done":
+                self._set_done(slot)
+            else:
+                self._remove(slot)
+        else:
+            raise ValueError(f"Unknown command: {op!r}")
+
+    @contextmanager
+    def transaction(self):
+        """
+        This Function will apply a group of changes all together or not at all.
+
+        Log records are held back until the block ends and then written in one go.
+        If the block raises, the tasks are restored to how they were before it.
+        """
+        if self._pending is not None:
+            yield self
+            return
+        snapshot = (list(self._names), list(self._status), dict(self._slot), self._alive.copy())
+        self._pending = []
+        try:
+            yield self
+        except BaseException:
+            self._names, self._status, self._slot, self._alive = snapshot
+            self._pending = None
+            raise
+        pending, self._pending = self._pending, None
+        if self._log is not None and pending:
+            self._log.write("".join(pending))
+            self._log_records += len(pending)
+        self.flush()
+
+    def export_jsonl(self, file):
+        """
+        This Function will write every task as a JSON line {"task": ..., "status": ...}.
+
+        Args:
+            file: A text file opened for writing.
+        """
+        for name, status in self.items():
+            file.write(json.dumps({"task": name, "status": status}, ensure_ascii=False) + "\n")
+
+    def import_jsonl(self, lines):
+        """
+        This Function will apply JSON Lines commands or exported tasks in one transaction.
+
+        Args:
+            lines: An iterable of JSON strings (for example an open file).
+        """
+        with self.transaction():
+            for line in lines:
+                if line.strip():
+                    self.apply(json.loads(line))
+
+    def flush(self):
+        """
+        This Function will flush the log and compact it if it has grown too much.
+        """
+        if self._log is None or self._pending is not None:
+            return
+        self._log.flush()
+        if self._log_records >= max(self.compact_min_records, self.compact_ratio * len(self)):
+            self.compact()
+
+    def compact(self):
+        """
+        This Function will rewrite the log with only the live tasks and swap it in atomically.
+        """
+        if self.path is None:
+            return
+        self._log.close()
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            for name, status in self.items():
+                record = {"op": "add", "task": name}
+                if status:
+                    record["status"] = status
+                file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self.path)
+        self._log_records = len(self)
+        self._log = open(self.path, "a", encoding="utf-8")
+
+    def close(self):
+        """
+        This Function will flush and close the log.
+        """
+        if self._log is not None:
+            self.flush()
+            self._log.close()
+            self._log = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def parse_command(line:str):
+    """
+    This Function will turn one line of a batch file into a command dict.
+
+    A line is either JSON (see TaskStore.apply) or plain text:
+        add <task description>
+        done <task number>
+        delete <task number>
+
+    Args:
+        line: One line of the batch file.
+    """
+    line = line.strip()
+    if line.startswith("{"):
+        return json.loads(line)
+    op, _, argument = line.partition(" ")
+    op, argument = op.lower(), argument.strip()
+    if op == "add":
+        return {"op": "add", "task": argument}
+    if op in ("done", "delete") and argument.isdigit():
+        return {"op": op, "id": int(argument)}
+    raise ValueError(f"Invalid command: {line!r}")
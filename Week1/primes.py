@@ -0,0 +1,213 @@
+"""
+Prime engine for the "Check if a Number is Prime" exercise in day_2.py.
+
+Trial division tries every divisor below the number, which is far too slow for
+large inputs. This module offers three faster tools instead:
+
+1. segmented_sieve / primes_in_range -> every prime in [lo, hi) using a
+   Sieve of Eratosthenes that only keeps one segment in memory at a time.
+2. is_prime -> deterministic Miller-Rabin test, exact for every 64-bit integer.
+3. is_prime_batch -> tests a whole NumPy array of candidates at once.
+
+Example:
+    from primes import is_prime, primes_in_range, is_prime_batch
+    is_prime(2**61 - 1)                      # True
+    primes_in_range(10**12, 10**12 + 1000)   # array of the primes in that range
+    is_prime_batch(np.arange(20))            # boolean mask
+"""
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# These bases make Miller-Rabin exact for every n < 3.3 * 10**24 (covers 64-bit).
+MR_BASES_64 = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+# These bases make Miller-Rabin exact for every n < 4,759,123,141 (covers 32-bit).
+MR_BASES_32 = (2, 7, 61)
+
+DEFAULT_SEGMENT_SIZE = 1 << 20
+
+
+def small_primes(limit:int):
+    """
+    This Function will return every prime below limit with a classic sieve.
+
+    Args:
+        limit: An integer upper bound (exclusive).
+    """
+    if limit < 3:
+        return np.array([], dtype=np.int64)
+    sieve = np.ones(limit, dtype=bool)
+    sieve[:2] = False
+    sieve[4::2] = False
+    for p in range(3, math.isqrt(limit - 1) + 1, 2):
+        if sieve[p]:
+            sieve[p * p::2 * p] = False
+    return np.flatnonzero(sieve).astype(np.int64)
+
+
+def segmented_sieve(lo:int, hi:int, segment_size:int = DEFAULT_SEGMENT_SIZE):
+    """
+    This Function will yield the primes in [lo, hi) one segment at a time.
+
+    Memory use is bounded by segment_size plus the base primes up to sqrt(hi).
+
+    Args:
+        lo: Start of the range (inclusive).
+        hi: End of the range (exclusive).
+        segment_size: Number of integers sieved per segment.
+    """
+    lo = max(lo, 2)
+    if hi <= lo:
+        return
+    base = small_primes(math.isqrt(hi - 1) + 1)
+
+    for start in range(lo, hi, segment_size):
+        stop = min(start + segment_size, hi)
+        segment = np.ones(stop - start, dtype=bool)
+        for p in base:
+            p = int(p)
+            if p * p >= stop:
+                break
+            first = max(p * p, -(-start // p) * p)
+            segment[first - start::p] = False
+        yield np.flatnonzero(segment).astype(np.int64) + start
+
+
+def _sieve_chunk(args):
+    lo, hi, segment_size = args
+    return np.concatenate(list(segmented_sieve(lo, hi, segment_size)) or [np.array([], dtype=np.int64)])
+
+
+def primes_in_range(lo:int, hi:int, segment_size:int = DEFAULT_SEGMENT_SIZE, workers:int = 1):
+    """
+    This Function will return every prime in [lo, hi) as a NumPy array.
+
+    Args:
+        lo: Start of the range (inclusive).
+        hi: End of the range (exclusive).
+        segment_size: Number of integers sieved per segment.
+        workers: Number of processes; above 1 the range is split across a process pool.
+    """
+    if workers <= 1 or hi - lo <= segment_size:
+        return _sieve_chunk((lo, hi, segment_size))
+
+    step = max(segment_size, -(-(hi - lo) // workers))
+    chunks = [(start, min(start + step, hi), segment_size) for start in range(lo, hi, step)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return np.concatenate(list(pool.map(_sieve_chunk, chunks)))
+
+
+def is_prime(num:int):
+    """
+    This Function will check if a number is prime with deterministic Miller-Rabin.
+
+    Args:
+        num: An integer (exact for every value below 3.3 * 10**24).
+    """
+    if num < 2:
+        return False
+    for p in MR_BASES_64:
+        if num % p == 0:
+            return num == p
+
+    d = num - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    for a in MR_BASES_64:
+        x = pow(a, d, num)
+        if x == 1 or x == num - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % num
+            if x == num - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _is_prime_batch_32(n):
+    """
+    This Function will run Miller-Rabin on an array of odd numbers 62 <= n < 2**32.
+
+    Every product of two residues fits in uint64, so the whole test is vectorized.
+
+    Args:
+        n: A uint64 NumPy array.
+    """
+    d = n - 1
+    s = np.zeros_like(n)
+    while True:
+        even = (d & 1) == 0
+        if not even.any():
+            break
+        d = np.where(even, d >> 1, d)
+        s += even
+
+    result = np.ones(n.shape, dtype=bool)
+    for a in MR_BASES_32:
+        # x = a ** d % n, using per-element square-and-multiply.
+        x = np.ones_like(n)
+        base = np.full_like(n, a) % n
+        e = d.copy()
+        while e.any():
+            odd = (e & 1) == 1
+            x = np.where(odd, x * base % n, x)
+            base = base * base % n
+            e >>= 1
+
+        passed = (x == 1) | (x == n - 1)
+        for r in range(1, 32):
+            x = x * x % n
+            passed |= (x == n - 1) & (r < s)
+        result &= passed
+    return result
+
+
+def is_prime_batch(candidates):
+    """
+    This Function will test an array of candidates for primality at once.
+
+    Values below 2**32 use a vectorized Miller-Rabin; larger values fall back to is_prime.
+
+    Args:
+        candidates: An array-like of non-negative integers.
+    """
+    n = np.asarray(candidates)
+    if n.dtype.kind not in "iu":
+        raise TypeError("is_prime_batch expects integer candidates")
+    flat = n.ravel()
+    result = np.zeros(flat.shape, dtype=bool)
+
+    small_table = np.zeros(62, dtype=bool)
+    small_table[small_primes(62)] = True
+    small = (flat >= 0) & (flat < 62)
+    result[small] = small_table[flat[small]]
+
+    large = flat >= 62
+    mid = large & (flat < 2**32) & (flat % 2 == 1)
+    if mid.any():
+        result[mid] = _is_prime_batch_32(flat[mid].astype(np.uint64))
+
+    huge = np.flatnonzero(large & (flat >= 2**32))
+    for i in huge:
+        result[i] = is_prime(int(flat[i]))
+    return result.reshape(n.shape)
+
+
+if __name__ == "__main__":
+    import time
+
+    candidates = np.random.default_rng(0).integers(2, 2**32, size=10**6, dtype=np.uint64)
+    start = time.perf_counter()
+    mask = is_prime_batch(candidates)
+    elapsed = time.perf_counter() - start
+    print(f"is_prime_batch: {candidates.size / elapsed:,.0f} queries/s ({mask.sum()} primes)")
+
+    start = time.perf_counter()
+    primes = primes_in_range(10**9, 10**9 + 10**7)
+    print(f"primes_in_range: {primes.size} primes in [1e9, 1e9+1e7) in {time.perf_counter() - start:.2f}s")
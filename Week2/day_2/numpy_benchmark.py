@@ -0,0 +1,219 @@
+"""
+Loop vs vectorized benchmark suite for the NumPy fundamentals of Week2 day_1 / day_2.
+
+Every operation from the lessons is timed three ways:
+
+- loop       -> pure Python over nested lists (the "no NumPy" baseline),
+- vectorized -> the normal NumPy call, e.g. np.sum(arr, axis=0),
+- out        -> the same call writing into a preallocated array with out=.
+
+Operations: sum / mean / std along axis 0 and 1, broadcasting a vector onto a
+matrix, and the boolean mask arr[(arr > 2) & (arr < 5)]. Each runs for sizes
+from 1e2 to 1e8 elements and for C- and F-ordered matrices.
+
+Results are written as JSON (with the NumPy version and BLAS build info), so runs
+on different NumPy/BLAS builds can be compared to spot regressions.
+
+Usage:
+    python numpy_benchmark.py --output results.json
+    python numpy_benchmark.py --max-size 1e6 --output quick.json
+"""
+import argparse
+import json
+import math
+import platform
+import time
+
+import numpy as np
+
+SIZES = [10**k for k in range(2, 9)]
+ORDERS = ("C", "F")
+# Pure Python loops above this many elements take minutes, so they are skipped.
+LOOP_LIMIT = 10**6
+
+
+def _loop_sum(rows, axis):
+    if axis == 0:
+        totals = [0.0] * len(rows[0])
+        for row in rows:
+            for j, value in enumerate(row):
+                totals[j] += value
+        return totals
+    return [sum(row) for row in rows]
+
+
+def _loop_mean(rows, axis):
+    count = len(rows) if axis == 0 else len(rows[0])
+    return [total / count for total in _loop_sum(rows, axis)]
+
+
+def _loop_std(rows, axis):
+    means = _loop_mean(rows, axis)
+    count = len(rows) if axis == 0 else len(rows[0])
+    squares = [0.0] * len(means)
+    for i, row in enumerate(rows):
+        for j, value in enumerate(row):
+            k = j if axis == 0 else i
+            squares[k] += (value - means[k]) ** 2
+    return [math.sqrt(total / count) for total in squares]
+
+
+def _loop_broadcast(rows, vector):
+    return [[value + v for value, v in zip(row, vector)] for row in rows]
+
+
+def _loop_mask(rows):
+    return [value for row in rows for value in row if 2 < value < 5]
+
+
+def _make_cases(matrix, rows, vector):
+    """
+    This Function will return {operation: {variant: function}} for one matrix.
+
+    Args:
+        matrix: The 2D NumPy array (C or F ordered).
+        rows: The same data as nested lists (None when loops are skipped).
+        vector: A row vector to broadcast onto the matrix.
+    """
+    n_rows, n_cols = matrix.shape
+    out_cols = np.empty(n_cols)
+    out_rows = np.empty(n_rows)
+    out_matrix = np.empty_like(matrix)
+    mask = np.empty(matrix.shape, dtype=bool, order="F" if np.isfortran(matrix) else "C")
+    mask2 = np.empty_like(mask)
+
+    def masked_out():
+        np.greater(matrix, 2, out=mask)
+        np.less(matrix, 5, out=mask2)
+        np.logical_and(mask, mask2, out=mask)
+        return matrix[mask]
+
+    cases = {}
+    for axis, out in ((0, out_cols), (1, out_rows)):
+        cases[f"sum_axis{axis}"] = {
+            "loop": lambda axis=axis: _loop_sum(rows, axis),
+            "vectorized": lambda axis=axis: np.sum(matrix, axis=axis),
+            "out": lambda axis=axis, out=out: np.sum(matrix, axis=axis, out=out),
+        }
+        cases[f"mean_axis{axis}"] = {
+            "loop": lambda axis=axis: _loop_mean(rows, axis),
+            "vectorized": lambda axis=axis: np.mean(matrix, axis=axis),
+            "out": lambda axis=axis, out=out: np.mean(matrix, axis=axis, out=out),
+        }
+        cases[f"std_axis{axis}"] = {
+            "loop": lambda axis=axis: _loop_std(rows, axis),
+            "vectorized": lambda axis=axis: np.std(matrix, axis=axis),
+            "out": lambda axis=axis, out=out: np.std(matrix, axis=axis, out=out),
+        }
+    cases["broadcast_add"] = {
+        "loop": lambda: _loop_broadcast(rows, vector.tolist()),
+        "vectorized": lambda: matrix + vector,
+        "out": lambda: np.add(matrix, vector, out=out_matrix),
+    }
+    cases["boolean_mask"] = {
+        "loop": lambda: _loop_mask(rows),
+        "vectorized": lambda: matrix[(matrix > 2) & (matrix < 5)],
+        "out": masked_out,
+    }
+    return cases
+
+
+def time_call(func, min_time:float = 0.2, max_repeat:int = 50):
+    """
+    This Function will time a call and return the best of several runs in seconds.
+
+    Args:
+        func: Function without arguments.
+        min_time: Keep repeating until this much total time has been spent.
+        max_repeat: Upper bound on the number of runs.
+    """
+    best = float("inf")
+    spent = 0.0
+    for _ in range(max_repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        spent += elapsed
+        if spent >= min_time:
+            break
+    return best
+
+
+def environment():
+    """
+    This Function will describe the NumPy/BLAS build so results can be compared across machines.
+    """
+    info = {
+        "numpy": np.__version__,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+    }
+    try:
+        config = np.show_config(mode="dicts")
+        info["blas"] = config.get("Build Dependencies", {}).get("blas", {})
+        info["lapack"] = config.get("Build Dependencies", {}).get("lapack", {})
+    except TypeError:
+        # NumPy < 1.25 can only print its configuration.
+        info["blas"] = "unknown"
+    return info
+
+
+def run(sizes=SIZES, orders=ORDERS, loop_limit:int = LOOP_LIMIT, seed:int = 0, verbose:bool = True):
+    """
+    This Function will run every operation, variant, size and memory order.
+
+    Args:
+        sizes: Total number of matrix elements to test.
+        orders: Memory layouts to test ("C", "F").
+        loop_limit: Largest size for which the pure Python loop is timed.
+        seed: Seed for the random data.
+        verbose: Print each result as it is measured.
+    """
+    rng = np.random.default_rng(seed)
+    results = []
+    for size in sizes:
+        n_rows = max(1, math.isqrt(size))
+        n_cols = max(1, size // n_rows)
+        base = rng.uniform(0, 7, size=(n_rows, n_cols))
+        vector = rng.uniform(0, 1, size=n_cols)
+        rows = base.tolist() if size <= loop_limit else None
+        for order in orders:
+            matrix = np.asarray(base, order=order)
+            for operation, variants in _make_cases(matrix, rows, vector).items():
+                for variant, func in variants.items():
+                    if variant == "loop" and rows is None:
+                        continue
+                    seconds = time_call(func)
+                    results.append({
+                        "operation": operation,
+                        "variant": variant,
+                        "size": n_rows * n_cols,
+                        "shape": [n_rows, n_cols],
+                        "order": order,
+                        "seconds": seconds,
+                    })
+                    if verbose:
+                        print(f"{operation:>14} {variant:>10} {order} {n_rows * n_cols:>10} {seconds:.6f}s")
+            del matrix
+    return {"environment": environment(), "results": results}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--output", default="numpy_benchmark.json", help="JSON file to write")
+    parser.add_argument("--max-size", type=float, default=1e8, help="largest number of elements")
+    parser.add_argument("--loop-limit", type=float, default=LOOP_LIMIT, help="largest size for pure Python loops")
+    parser.add_argument("--orders", default="CF", help="memory orders to test, e.g. C, F or CF")
+    args = parser.parse_args(argv)
+
+    sizes = [size for size in SIZES if size <= args.max_size]
+    report = run(sizes, tuple(args.orders), int(args.loop_limit))
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    print(f"Wrote {len(report['results'])} results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -159,3 +159,13 @@ This exercise:
 2. Displays the first few rows (df.head()).
 3. Filters rows where sepal_length > 5.
 """
+
+############################ Large CSV files: chunked reading with smaller dtypes ##########################
+# from chunked_reader import read_csv_optimized, read_chunks
+# df = read_csv_optimized(path2)
+# for chunk in read_chunks(path2, chunksize=100_000):
+#     print(chunk.dtypes)
+"""
+chunked_reader.py reads a CSV file in chunks and turns repeated text into
+categories, downcasts numbers and parses dates with one guessed format.
+"""
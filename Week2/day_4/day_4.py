@@ -164,3 +164,23 @@ Example: Score=85 → Score_Percentage=85
 """
 
 # print(merged)
+
+################################################# Imputing many columns at once #################################################
+# from imputation import Imputer
+# imputer = Imputer({"Age": "mean", "Score": "linear", "Name": ("constant", "Unknown")})
+# df = imputer.fit_transform(df)
+"""
+imputation.py fills every column with its own strategy (mean, median, mode,
+constant, ffill, bfill, linear) in one pass per column, with a thread pool, and
+can also fill chunks of a large file with transform_chunks.
+"""
+
+################################################# Joining tables larger than memory #################################################
+# from external_join import hash_join
+# for chunk in hash_join("patients.csv", "billing.csv", on="ID", how="left"):
+#     print(chunk)
+"""
+external_join.py does the same join as pd.merge(how="inner"/"left"), but splits
+both tables into partition files by key first, so only one partition of the
+right table is in memory at a time.
+"""
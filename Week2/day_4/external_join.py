@@ -0,0 +1,292 @@
+"""
+Out-of-core join (grace hash join) for tables that do not fit in memory.
+
+pd.merge(df1, df2, on="ID") in day_4.py needs both DataFrames in RAM. hash_join
+joins two tables that are read chunk by chunk:
+
+1. Partition: every chunk of both tables is split by a hash of the key columns
+   into P partition files on disk, so rows with the same key always land in
+   the same partition number on both sides.
+2. Join: for each partition, the right side is loaded into memory and the left
+   side is streamed through pd.merge against it, one chunk at a time.
+
+P is chosen so one right partition fits in the memory budget. A partition that
+is still too big (skewed keys) is split again with a different hash.
+
+Supports how="inner" and how="left" on one or more key columns. Output rows come
+out partition by partition, not in the input order.
+
+Example:
+    from external_join import hash_join
+    for chunk in hash_join("patients.csv", "billing.csv", on="ID", how="left",
+                           memory_budget=512 * 2**20):
+        print(chunk.head())
+    hash_join_to_csv("patients.csv", "billing.csv", "joined.csv", on=["ID", "Date"])
+"""
+import math
+import os
+import pickle
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_MEMORY_BUDGET = 256 * 2**20
+DEFAULT_CHUNKSIZE = 100_000
+# A CSV file takes roughly this many times its size once loaded into pandas.
+_CSV_EXPANSION = 3
+# Every partition keeps a file open while partitioning.
+_MAX_PARTITIONS = 256
+# One 16-character hash key per partitioning level; a partition is split again at most len - 1 times.
+_HASH_KEYS = ("0123456789123456", "grace-hash-key-1", "grace-hash-key-2", "grace-hash-key-3")
+
+
+def iter_chunks(source, chunksize:int = DEFAULT_CHUNKSIZE, **read_csv_kwargs):
+    """
+    This Function will yield DataFrame chunks from a CSV path, a DataFrame or an iterable of DataFrames.
+
+    Args:
+        source: Path of a CSV file, a DataFrame, or an iterable of DataFrames.
+        chunksize: Rows per chunk for paths and DataFrames.
+        read_csv_kwargs: Extra options for pd.read_csv.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with pd.read_csv(source, chunksize=chunksize, **read_csv_kwargs) as reader:
+            yield from reader
+    elif isinstance(source, pd.DataFrame):
+        for start in range(0, max(len(source), 1), chunksize):
+            yield source.iloc[start:start + chunksize]
+    else:
+        yield from source
+
+
+class _PartitionFiles:
+    """
+    This Class will append DataFrame pieces to P files, one pickle record per piece.
+
+    Args:
+        directory: Directory for the files.
+        name: File name prefix ("left" / "right").
+        count: Number of partitions.
+    """
+
+    def __init__(self, directory, name:str, count:int):
+        self.paths = [os.path.join(directory, f"{name}-{i}.pkl") for i in range(count)]
+        self.files = [None] * count
+        self.bytes = [0] * count
+        self.template = None
+
+    def write(self, chunk, partition_ids):
+        if self.template is None:
+            self.template = chunk.iloc[:0]
+        if len(chunk) == 0:
+            return
+        row_bytes = chunk.memory_usage(deep=True).sum() / len(chunk)
+        order = np.argsort(partition_ids, kind="stable")
+        bounds = np.cumsum(np.bincount(partition_ids, minlength=len(self.paths)))
+        start = 0
+        for i, stop in enumerate(bounds):
+            if stop > start:
+                if self.files[i] is None:
+                    self.files[i] = open(self.paths[i], "wb")
+                pickle.dump(chunk.iloc[order[start:stop]], self.files[i], protocol=pickle.HIGHEST_PROTOCOL)
+                self.bytes[i] += int(row_bytes * (stop - start))
+            start = stop
+
+    def close(self):
+        for file in self.files:
+            if file is not None:
+                file.close()
+
+    def read(self, i:int):
+        """
+        This Function will yield the pieces of partition i, then delete its file.
+        """
+        if self.files[i] is None:
+            return
+        with open(self.paths[i], "rb") as file:
+            while True:
+                try:
+                    yield pickle.load(file)
+                except EOFError:
+                    break
+        os.remove(self.paths[i])
+
+    def discard(self, i:int):
+        if self.files[i] is not None:
+            os.remove(self.paths[i])
+            self.files[i] = None
+
+
+def _canonical_keys(chunk, on):
+    """
+    This Function will return the key columns in a dtype-independent form for hashing.
+
+    The hash of a value depends on its dtype (1 as int64 and 1.0 as float64 hash
+    differently), but pd.merge matches them. A CSV int column that gets one NaN in
+    a chunk is read as float64, so without this the same key would land in
+    different partitions on the two sides and the join would lose rows.
+    Numbers (and nullable / categorical numbers) become float64 with 0.0 for -0.0
+    and one NaN for every missing value; datetimes become nanoseconds.
+    """
+    keys = {}
+    for name in on:
+        column = chunk[name]
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            categories = column.cat.categories
+            if pd.api.types.is_numeric_dtype(categories.dtype):
+                values = np.append(categories.to_numpy(dtype=np.float64), np.nan)[column.cat.codes.to_numpy()]
+                column = pd.Series(values, copy=False)
+            else:
+                column = column.astype(object)
+        if pd.api.types.is_bool_dtype(column.dtype) or pd.api.types.is_numeric_dtype(column.dtype):
+            values = column.to_numpy(dtype=np.float64, na_value=np.nan) + 0.0
+            values[np.isnan(values)] = np.nan
+            column = pd.Series(values, copy=False)
+        elif pd.api.types.is_datetime64_any_dtype(column.dtype):
+            column = column.dt.as_unit("ns")
+        keys[name] = column.reset_index(drop=True)
+    return pd.DataFrame(keys)
+
+
+def _partition_ids(chunk, on, count:int, depth:int):
+    hashes = pd.util.hash_pandas_object(_canonical_keys(chunk, on), index=False, hash_key=_HASH_KEYS[depth])
+    return (hashes.to_numpy() % np.uint64(count)).astype(np.intp)
+
+
+def _partition(chunks, on, directory, name:str, count:int, depth:int):
+    files = _PartitionFiles(directory, name, count)
+    try:
+        for chunk in chunks:
+            files.write(chunk, _partition_ids(chunk, on, count, depth))
+    finally:
+        files.close()
+    return files
+
+
+def _split(frame, chunksize:int):
+    for start in range(0, len(frame), chunksize):
+        yield frame.iloc[start:start + chunksize]
+
+
+def _join_partitions(left, right, on, how, memory_budget, chunksize, directory, depth, suffixes):
+    """
+    This Function will join matching partitions, splitting again the ones that are too big.
+    """
+    for i in range(len(right.paths)):
+        if left.files[i] is None:
+            # No left rows: nothing to output for either join type.
+            right.discard(i)
+            continue
+        if right.bytes[i] > memory_budget and depth + 1 < len(_HASH_KEYS):
+            count = min(math.ceil(right.bytes[i] / memory_budget) + 1, _MAX_PARTITIONS)
+            sub_directory = tempfile.mkdtemp(dir=directory, prefix=f"p{i}-")
+            sub_right = _partition(right.read(i), on, sub_directory, "right", count, depth + 1)
+            sub_right.template = right.template
+            sub_left = _partition(left.read(i), on, sub_directory, "left", count, depth + 1)
+            sub_left.template = left.template
+            yield from _join_partitions(sub_left, sub_right, on, how, memory_budget, chunksize,
+                                        sub_directory, depth + 1, suffixes)
+            os.rmdir(sub_directory)
+            continue
+
+        # One key can hold more rows than the budget; after the last split it is joined anyway.
+        pieces = list(right.read(i))
+        build = pd.concat(pieces, ignore_index=True) if pieces else right.template
+        for probe in left.read(i):
+            joined = pd.merge(probe, build, how=how, on=on, suffixes=suffixes)
+            yield from _split(joined, chunksize)
+
+
+def hash_join(left, right, on, how:str = "inner", memory_budget:int = DEFAULT_MEMORY_BUDGET,
+              chunksize:int = DEFAULT_CHUNKSIZE, partitions:int = None, tmp_dir=None,
+              suffixes=("_x", "_y"), **read_csv_kwargs):
+    """
+    This Function will join two tables with a grace hash join and yield the result in chunks.
+
+    Args:
+        left: Left table: CSV path, DataFrame or iterable of DataFrames (streamed).
+        right: Right table, same kinds (one partition of it is held in memory at a time).
+        on: Key column name or list of names (numeric keys may differ in dtype, e.g. int and float).
+        how: "inner" or "left".
+        memory_budget: Target size in bytes of the right partition held in memory.
+        chunksize: Rows per input and output chunk.
+        partitions: Number of partitions (default: from the CSV file size and the budget).
+        tmp_dir: Directory for the partition files (default: the system temp directory).
+        suffixes: Suffixes for overlapping non-key columns, like pd.merge.
+        read_csv_kwargs: Extra options for pd.read_csv when left/right are paths.
+    """
+    if how not in ("inner", "left"):
+        raise ValueError(f"how must be 'inner' or 'left', not {how!r}")
+    on = [on] if isinstance(on, str) else list(on)
+    if partitions is None:
+        if isinstance(right, (str, os.PathLike)):
+            estimated = os.path.getsize(right) * _CSV_EXPANSION
+        elif isinstance(right, pd.DataFrame):
+            estimated = right.memory_usage(deep=True).sum()
+        else:
+            estimated = memory_budget * 16
+        partitions = min(max(1, math.ceil(estimated / memory_budget)), _MAX_PARTITIONS)
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir, prefix="hash-join-") as directory:
+        right_files = _partition(iter_chunks(right, chunksize, **read_csv_kwargs), on, directory, "right", partitions, 0)
+        left_files = _partition(iter_chunks(left, chunksize, **read_csv_kwargs), on, directory, "left", partitions, 0)
+        if left_files.template is None or right_files.template is None:
+            return
+        yield from _join_partitions(left_files, right_files, on, how, memory_budget, chunksize,
+                                    directory, 0, suffixes)
+
+
+def hash_join_to_csv(left, right, output, on, **kwargs):
+    """
+    This Function will write the joined table to a CSV file and return the number of rows.
+
+    Args:
+        left: Left table (see hash_join).
+        right: Right table (see hash_join).
+        output: Path of the CSV file to write.
+        on: Key column name or list of names.
+        kwargs: Other options of hash_join.
+    """
+    rows = 0
+    with open(output, "w", encoding="utf-8", newline="") as file:
+        for chunk in hash_join(left, right, on, **kwargs):
+            chunk.to_csv(file, header=rows == 0, index=False)
+            rows += len(chunk)
+    return rows
+
+
+if __name__ == "__main__":
+    import time
+
+    rng = np.random.default_rng(0)
+    n = 1_000_000
+    patients = pd.DataFrame({"ID": np.arange(n), "Age": rng.integers(1, 90, n)})
+    billing = pd.DataFrame({"ID": rng.integers(0, n * 2, n), "Amount": rng.uniform(10, 5000, n)})
+
+    start = time.perf_counter()
+    expected = pd.merge(patients, billing, how="left", on="ID")
+    merge_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = pd.concat(hash_join(patients, billing, on="ID", how="left", memory_budget=2 * 2**20))
+    join_time = time.perf_counter() - start
+
+    key = ["ID", "Amount"]
+    pd.testing.assert_frame_equal(
+        result.sort_values(key, ignore_index=True), expected.sort_values(key, ignore_index=True)
+    )
+    print(f"pd.merge: {merge_time:.2f}s  hash_join (2 MB budget): {join_time:.2f}s  rows: {len(result)}")
+
+    # Keys of different dtypes must still meet: float keys (with NaN) on the left, int keys on the right.
+    left_keys = pd.DataFrame({"ID": rng.integers(0, 5_000, 10_000).astype(np.float64), "Age": rng.integers(1, 90, 10_000)})
+    left_keys.loc[::1_000, "ID"] = np.nan
+    right_keys = pd.DataFrame({"ID": rng.integers(0, 5_000, 10_000), "Amount": rng.uniform(10, 5000, 10_000)})
+    for how in ("inner", "left"):
+        expected = pd.merge(left_keys, right_keys, how=how, on="ID")
+        result = pd.concat(hash_join(left_keys, right_keys, on="ID", how=how, partitions=16, chunksize=1_000))
+        key = ["ID", "Age", "Amount"]
+        pd.testing.assert_frame_equal(
+            result.sort_values(key, ignore_index=True), expected.sort_values(key, ignore_index=True)
+        )
+    print(f"mixed int/float keys: {len(expected)} rows, same as pd.merge")
@@ -0,0 +1,378 @@
+"""
+Column-parallel imputation of missing values for the Exercise 1 of day_4.py.
+
+day_4.py fills gaps with separate full-frame calls (fillna(mean), ffill, bfill,
+interpolate()), and each one scans the data again. Imputer takes one strategy
+per column and does each column in a single NumPy pass:
+
+    mean / median / mode   -> statistic of the non-missing values (learned by fit)
+    constant               -> a fixed value, written ("constant", value)
+    ffill / bfill          -> last / next valid value (index trick, no Python loop)
+    linear                 -> straight line between the surrounding valid values,
+                              like Series.interpolate() (leading gaps stay missing)
+
+The missing mask of a column is computed once and reused for its statistic and
+its fill. Columns are processed in a thread pool (NumPy releases the GIL).
+
+transform_chunks imputes a stream of DataFrames (e.g. pd.read_csv(chunksize=...)):
+the last value of every ffill/linear column is carried into the next chunk, and
+rows whose bfill/linear gap is still open at the end of a chunk are held back
+until a later chunk closes it.
+
+Example:
+    from imputation import Imputer
+    imputer = Imputer({"Age": "mean", "Score": "linear", "Name": ("constant", "Unknown")})
+    df = imputer.fit_transform(df)
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+STRATEGIES = ("mean", "median", "mode", "constant", "ffill", "bfill", "linear")
+_STATISTICS = ("mean", "median", "mode")
+# Strategies that need the value after a gap, so a gap at the end of a chunk must wait.
+_LOOKAHEAD = ("bfill", "linear")
+# Strategies that need the value before a gap, so the last value is carried to the next chunk.
+_CARRY = ("ffill", "linear")
+
+
+def missing_mask(values):
+    """
+    This Function will return a boolean array that is True where a value is missing.
+
+    Args:
+        values: A 1D NumPy array.
+    """
+    if values.dtype.kind in "fc":
+        return np.isnan(values)
+    if values.dtype.kind == "O":
+        return pd.isna(values)
+    if values.dtype.kind in "mM":
+        return np.isnat(values)
+    return np.zeros(len(values), dtype=bool)
+
+
+def _positions(n:int):
+    return np.arange(n, dtype=np.int32 if n < 2**31 else np.intp)
+
+
+def ffill(values, mask):
+    """
+    This Function will return the values with every gap taking the last valid value before it.
+
+    Args:
+        values: A 1D NumPy array.
+        mask: missing_mask(values).
+    """
+    # For every position, the index of the last valid value up to it (0 before the first one).
+    last = _positions(len(values))
+    np.multiply(last, ~mask, out=last)
+    np.maximum.accumulate(last, out=last)
+    return values.take(last)
+
+
+def bfill(values, mask):
+    """
+    This Function will return the values with every gap taking the next valid value after it.
+
+    Args:
+        values: A 1D NumPy array.
+        mask: missing_mask(values).
+    """
+    following = _positions(len(values))
+    np.putmask(following, mask, len(values) - 1)
+    backwards = following[::-1]
+    np.minimum.accumulate(backwards, out=backwards)
+    return values.take(following)
+
+
+def interpolate(values, mask):
+    """
+    This Function will fill gaps on a straight line between their neighbours (in place).
+
+    Like Series.interpolate(): gaps before the first valid value stay missing and
+    gaps after the last valid value take that value.
+
+    Args:
+        values: A writable 1D float array.
+        mask: missing_mask(values).
+    """
+    valid = np.flatnonzero(~mask)
+    if len(valid) == 0:
+        return values
+    gaps = np.flatnonzero(mask)
+    gaps = gaps[gaps > valid[0]]
+    values[gaps] = np.interp(gaps, valid, values[valid])
+    return values
+
+
+class Imputer:
+    """
+    This Class will fill missing values with one strategy per column.
+
+    Args:
+        strategies: {column: strategy}; a strategy is one of STRATEGIES, or ("constant", value).
+        workers: Number of threads for the columns (default: number of CPUs).
+    """
+
+    def __init__(self, strategies:dict, workers:int = None):
+        self.strategies = {}
+        self.constants = {}
+        for column, strategy in strategies.items():
+            if isinstance(strategy, tuple):
+                strategy, self.constants[column] = strategy
+            if strategy not in STRATEGIES:
+                raise ValueError(f"Unknown strategy for {column!r}: {strategy!r}")
+            if strategy == "constant" and column not in self.constants:
+                raise ValueError(f"Strategy for {column!r} must be ('constant', value)")
+            self.strategies[column] = strategy
+        self.workers = workers or os.cpu_count() or 1
+        self.statistics_ = {}
+        self._partial = {}
+
+    def _map_columns(self, func, columns):
+        if self.workers == 1 or len(columns) < 2:
+            return [func(column) for column in columns]
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(columns))) as pool:
+            return list(pool.map(func, columns))
+
+    # ------------------------------------------------------------------ fit
+
+    def _partial_fit_column(self, df, column):
+        values = df[column].to_numpy()
+        present = values[~missing_mask(values)]
+        strategy = self.strategies[column]
+        if strategy == "mean":
+            return float(np.sum(present, dtype=np.float64)), len(present)
+        if strategy == "median":
+            return present
+        # mode: counts of every distinct value.
+        if present.dtype.kind in "biufmM":
+            uniques, counts = np.unique(present, return_counts=True)
+            return pd.Series(counts, index=uniques)
+        return pd.Series(present).value_counts(sort=False)
+
+    def partial_fit(self, df):
+        """
+        This Function will add one chunk to the mean / median / mode statistics.
+
+        Call finish_fit() after the last chunk (fit() does both for a single DataFrame).
+
+        Args:
+            df: A DataFrame or one chunk of a larger table.
+        """
+        columns = [column for column, strategy in self.strategies.items() if strategy in _STATISTICS]
+        results = self._map_columns(lambda column: self._partial_fit_column(df, column), columns)
+        for column, result in zip(columns, results):
+            self._partial.setdefault(column, []).append(result)
+        return self
+
+    def finish_fit(self):
+        """
+        This Function will turn the collected partial results into the final statistics.
+        """
+        for column, parts in self._partial.items():
+            strategy = self.strategies[column]
+            if strategy == "mean":
+                total = sum(part[0] for part in parts)
+                count = sum(part[1] for part in parts)
+                self.statistics_[column] = total / count if count else np.nan
+            elif strategy == "median":
+                present = np.concatenate(parts)
+                self.statistics_[column] = np.median(present) if len(present) else np.nan
+            else:
+                counts = parts[0]
+                for part in parts[1:]:
+                    counts = counts.add(part, fill_value=0)
+                if len(counts) == 0:
+                    self.statistics_[column] = np.nan
+                else:
+                    # Ties go to the smallest value, like Series.mode()[0].
+                    self.statistics_[column] = counts.index[counts.to_numpy() == counts.max()].min()
+        self._partial = {}
+        return self
+
+    def fit(self, df):
+        """
+        This Function will learn the mean / median / mode of the columns that need them.
+
+        Args:
+            df: The DataFrame.
+        """
+        self._partial = {}
+        return self.partial_fit(df).finish_fit()
+
+    def fit_chunks(self, chunks):
+        """
+        This Function will learn the statistics from an iterable of DataFrames.
+
+        Medians keep the non-missing values of their column in memory; means and modes only keep totals.
+
+        Args:
+            chunks: Iterable of DataFrames (e.g. pd.read_csv(path, chunksize=...)).
+        """
+        self._partial = {}
+        for chunk in chunks:
+            self.partial_fit(chunk)
+        return self.finish_fit()
+
+    # ------------------------------------------------------------ transform
+
+    def _fill_value(self, column):
+        strategy = self.strategies[column]
+        if strategy == "constant":
+            return self.constants[column]
+        if column not in self.statistics_:
+            raise RuntimeError(f"Imputer is not fitted for {column!r}; call fit() first")
+        return self.statistics_[column]
+
+    def _impute_column(self, series, carry=None):
+        """
+        This Function will return the filled values of one column, or None if nothing is missing.
+
+        Args:
+            series: The column.
+            carry: Value of the row just before this chunk (streaming), or None.
+        """
+        strategy = self.strategies[series.name]
+        values = series.to_numpy()
+        owned = False
+        if strategy == "linear" and values.dtype.kind not in "fc":
+            values = values.astype(np.float64)
+            owned = True
+        mask = missing_mask(values)
+        if not mask.any():
+            return None
+
+        if strategy in _CARRY and carry is not None:
+            # Put the carried value in front so a gap at the start of the chunk sees it.
+            extended = np.empty(len(values) + 1, dtype=values.dtype)
+            extended[0] = carry
+            extended[1:] = values
+            extended_mask = np.empty(len(mask) + 1, dtype=bool)
+            extended_mask[0] = missing_mask(extended[:1])[0]
+            extended_mask[1:] = mask
+            filled = self._fill(series.name, extended, extended_mask)
+            return filled[1:]
+        if strategy not in ("ffill", "bfill") and not owned:
+            # to_numpy() may return a read-only view of the frame's data, so fill a copy.
+            values = np.array(values, copy=True)
+        return self._fill(series.name, values, mask)
+
+    def _fill(self, column, values, mask):
+        strategy = self.strategies[column]
+        if strategy == "ffill":
+            return ffill(values, mask)
+        if strategy == "bfill":
+            return bfill(values, mask)
+        if strategy == "linear":
+            return interpolate(values, mask)
+        values[mask] = self._fill_value(column)
+        return values
+
+    def _transform(self, df, carry):
+        columns = [column for column in self.strategies if column in df.columns]
+        results = self._map_columns(lambda column: self._impute_column(df[column], carry.get(column)), columns)
+        for column, values in zip(columns, results):
+            if values is None:
+                continue
+            dtype = df[column].dtype
+            if isinstance(dtype, np.dtype) or self.strategies[column] == "linear":
+                df[column] = values
+            else:
+                df[column] = pd.array(values, dtype=dtype)
+        return df
+
+    def transform(self, df, copy:bool = False):
+        """
+        This Function will fill the missing values of the strategy columns.
+
+        Args:
+            df: The DataFrame (its columns are replaced unless copy is True).
+            copy: Work on a copy and leave df unchanged.
+        """
+        if copy:
+            df = df.copy()
+        return self._transform(df, {})
+
+    def fit_transform(self, df, copy:bool = False):
+        """
+        This Function will fit on df and fill its missing values.
+
+        Args:
+            df: The DataFrame.
+            copy: Work on a copy and leave df unchanged.
+        """
+        return self.fit(df).transform(df, copy)
+
+    def _ready_rows(self, df):
+        """
+        This Function will return how many leading rows can be emitted: after them, some
+        bfill/linear column has no valid value left in this chunk.
+        """
+        ready = len(df)
+        for column, strategy in self.strategies.items():
+            if strategy in _LOOKAHEAD and column in df.columns:
+                valid = np.flatnonzero(~missing_mask(df[column].to_numpy()))
+                ready = min(ready, valid[-1] + 1 if len(valid) else 0)
+        return ready
+
+    def transform_chunks(self, chunks):
+        """
+        This Function will fill a stream of DataFrames, carrying fill state across chunk boundaries.
+
+        Yields DataFrames with the same rows as the input, but rows with an open bfill /
+        linear gap at the end of a chunk come out with a later chunk. mean / median / mode
+        columns must be fitted first (fit or fit_chunks).
+
+        Args:
+            chunks: Iterable of DataFrames.
+        """
+        carry = {}
+        pending = None
+        for chunk in chunks:
+            if pending is not None and len(pending):
+                chunk = pd.concat([pending, chunk])
+            ready = self._ready_rows(chunk)
+            pending = chunk.iloc[ready:]
+            if ready == 0:
+                continue
+            # Fill the whole chunk: a gap before `ready` in one column may close after it.
+            out = self._transform(chunk.copy(), carry).iloc[:ready]
+            for column, strategy in self.strategies.items():
+                if strategy in _CARRY and column in out.columns:
+                    carry[column] = out[column].iloc[-1]
+            yield out
+        if pending is not None and len(pending):
+            yield self._transform(pending.copy(), carry)
+
+
+if __name__ == "__main__":
+    import time
+
+    rng = np.random.default_rng(0)
+    n = 2_000_000
+    frame = pd.DataFrame({name: rng.normal(size=n) for name in "abcdefg"})
+    for name in frame.columns:
+        frame.loc[rng.random(n) < 0.1, name] = np.nan
+    plan = dict(zip(frame.columns, ("mean", "median", "mode", "ffill", "bfill", "linear", ("constant", 0.0))))
+
+    start = time.perf_counter()
+    expected = frame.copy()
+    expected["a"] = expected["a"].fillna(expected["a"].mean())
+    expected["b"] = expected["b"].fillna(expected["b"].median())
+    expected["c"] = expected["c"].fillna(expected["c"].mode()[0])
+    expected["d"] = expected["d"].ffill()
+    expected["e"] = expected["e"].bfill()
+    expected["f"] = expected["f"].interpolate()
+    expected["g"] = expected["g"].fillna(0.0)
+    pandas_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = Imputer(plan).fit_transform(frame, copy=True)
+    imputer_time = time.perf_counter() - start
+
+    pd.testing.assert_frame_equal(result, expected)
+    print(f"pandas calls: {pandas_time:.3f}s  Imputer: {imputer_time:.3f}s")
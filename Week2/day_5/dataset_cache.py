@@ -0,0 +1,209 @@
+"""
+Content-hashed columnar cache for CSV files.
+
+The same iris.csv is copied into several folders (Week2/day_3, Week2/day_5,
+Week4 ...) and every script parses it again with pd.read_csv. load_csv parses a
+file once and keeps a columnar copy in a shared cache directory:
+
+    <cache_dir>/<content hash>/meta.json      column names, dtypes, categories
+    <cache_dir>/<content hash>/<n>.npy        one NumPy array per column
+
+- The cache key is a hash of the file *content* (plus the read_csv options), so
+  identical copies in different folders share one entry, and editing a file
+  automatically gives it a new entry.
+- Hashes are remembered by (path, size, modification time), so an unchanged file
+  is not even re-read to be hashed.
+- Numeric, boolean and datetime columns are memory-mapped copy-on-write
+  (np.load(mmap_mode="c")): pages are read lazily, and writing to the DataFrame
+  changes only the in-memory copy, never the cache. read_only=True maps them
+  read-only instead (writes raise), which is the zero-copy option.
+  Text columns are stored as integer codes plus a list of distinct values.
+- Entries are written to a temporary directory and renamed into place, so a
+  crash never leaves a half-written entry behind.
+
+Example:
+    from dataset_cache import load_csv
+    df = load_csv(base_dir / "iris.csv")
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+FORMAT_VERSION = 1
+DEFAULT_CACHE_DIR = Path(os.environ.get("DATASET_CACHE_DIR", Path.home() / ".cache" / "ai-practice-datasets"))
+_HASH_CHUNK = 1 << 20
+
+
+def file_digest(path):
+    """
+    This Function will hash the content of a file with BLAKE2b.
+
+    Args:
+        path: Path of the file.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _cached_digest(path, cache_dir):
+    """
+    This Function will return the content hash, reusing it while size and mtime are unchanged.
+
+    Args:
+        path: Path of the file.
+        cache_dir: Cache directory holding the hash index.
+    """
+    stat = os.stat(path)
+    key = f"{Path(path).resolve()}|{stat.st_size}|{stat.st_mtime_ns}"
+    index_path = cache_dir / "hashes.json"
+    try:
+        with open(index_path, "r", encoding="utf-8") as file:
+            hashes = json.load(file)
+    except (OSError, ValueError):
+        hashes = {}
+    if key in hashes:
+        return hashes[key]
+
+    digest = file_digest(path)
+    hashes[key] = digest
+    _write_json_atomic(index_path, hashes)
+    return digest
+
+
+def _write_json_atomic(path, data):
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as file:
+        json.dump(data, file)
+    os.replace(tmp_path, path)
+
+
+def _options_key(read_csv_kwargs):
+    return hashlib.blake2b(json.dumps(read_csv_kwargs, sort_keys=True, default=str).encode(), digest_size=8).hexdigest()
+
+
+def _save_frame(df, entry_dir):
+    """
+    This Function will write a DataFrame as one .npy file per column plus meta.json.
+
+    Args:
+        df: The parsed DataFrame.
+        entry_dir: Directory of the cache entry.
+    """
+    meta = {"version": FORMAT_VERSION, "columns": []}
+    if not df.index.equals(pd.RangeIndex(len(df))):
+        # A non-default index (e.g. read_csv(index_col=...)) is stored as the first column.
+        meta["index_name"] = df.index.name
+        df = df.reset_index()
+
+    for i, name in enumerate(df.columns):
+        column = df[name]
+        info = {"name": name, "dtype": str(column.dtype), "file": f"{i}.npy"}
+        if isinstance(column.dtype, np.dtype) and column.dtype.kind in "biuf":
+            values = column.to_numpy()
+        elif column.dtype.kind in "mM":
+            if getattr(column.dtype, "tz", None) is not None:
+                info["tz"] = str(column.dtype.tz)
+                column = column.dt.tz_convert("UTC").dt.tz_localize(None)
+            values = column.to_numpy()
+            info["kind"] = "datetime"
+            info["numpy_dtype"] = str(values.dtype)
+            values = values.view(np.int64)
+        else:
+            codes, uniques = pd.factorize(column, use_na_sentinel=True)
+            info["kind"] = "codes"
+            info["categories"] = [None if pd.isna(value) else value for value in np.asarray(uniques, dtype=object)]
+            values = codes
+        np.save(entry_dir / info["file"], np.ascontiguousarray(values))
+        meta["columns"].append(info)
+
+    with open(entry_dir / "meta.json", "w", encoding="utf-8") as file:
+        json.dump(meta, file, default=str)
+
+
+def _load_frame(entry_dir, read_only:bool = False):
+    """
+    This Function will rebuild the DataFrame from a cache entry, memory-mapping numeric columns.
+
+    Args:
+        entry_dir: Directory of the cache entry.
+        read_only: Map the columns read-only instead of copy-on-write.
+    """
+    with open(entry_dir / "meta.json", "r", encoding="utf-8") as file:
+        meta = json.load(file)
+    if meta.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Cache entry {entry_dir} has an old format")
+
+    columns = {}
+    for info in meta["columns"]:
+        values = np.load(entry_dir / info["file"], mmap_mode="r" if read_only else "c")
+        kind = info.get("kind")
+        if kind == "datetime":
+            values = pd.Series(values.view(info["numpy_dtype"]), copy=False)
+            if "tz" in info:
+                values = values.dt.tz_localize("UTC").dt.tz_convert(info["tz"])
+        elif kind == "codes":
+            # Code -1 (missing) picks the extra None at the end.
+            lookup = np.array(info["categories"] + [None], dtype=object)
+            values = lookup[values]
+            if info["dtype"] != "object":
+                values = pd.Series(values).astype(info["dtype"])
+        columns[info["name"]] = values
+    df = pd.DataFrame(columns, copy=False)
+    if "index_name" in meta:
+        df = df.set_index(df.columns[0])
+        df.index.name = meta["index_name"]
+    return df
+
+
+def load_csv(path, cache_dir=None, refresh:bool = False, read_only:bool = False, **read_csv_kwargs):
+    """
+    This Function will load a CSV file, parsing it only the first time its content is seen.
+
+    Args:
+        path: Path of the CSV file.
+        cache_dir: Shared cache directory (default: $DATASET_CACHE_DIR or ~/.cache/ai-practice-datasets).
+        refresh: Parse the CSV again even if a cache entry exists.
+        read_only: Return cached numeric columns as read-only memory maps (writes raise ValueError).
+        read_csv_kwargs: Extra options passed to pd.read_csv (they are part of the cache key).
+    """
+    cache_dir = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    key = f"{_cached_digest(path, cache_dir)}-{_options_key(read_csv_kwargs)}"
+    entry_dir = cache_dir / key
+
+    if entry_dir.is_dir() and not refresh:
+        try:
+            return _load_frame(entry_dir, read_only)
+        except (OSError, ValueError, KeyError):
+            shutil.rmtree(entry_dir, ignore_errors=True)
+
+    df = pd.read_csv(path, **read_csv_kwargs)
+    tmp_dir = Path(tempfile.mkdtemp(dir=cache_dir, prefix=f".{key}-"))
+    try:
+        _save_frame(df, tmp_dir)
+        if refresh:
+            shutil.rmtree(entry_dir, ignore_errors=True)
+        os.rename(tmp_dir, entry_dir)
+    except OSError:
+        # Another process stored the same entry first; theirs is identical.
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return df
+
+
+def clear_cache(cache_dir=None):
+    """
+    This Function will delete every cached dataset.
+
+    Args:
+        cache_dir: Cache directory to clear (default: the shared cache directory).
+    """
+    shutil.rmtree(Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR, ignore_errors=True)
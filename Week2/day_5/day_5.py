@@ -18,9 +18,13 @@ path2 = base_dir / "iris.csv"
 We create the full path to 'iris.csv' inside the same folder as the script.
 """
 
-df = pd.read_csv(path2)
+from dataset_cache import load_csv
+
+df = load_csv(path2)
 """Explanation:
-pd.read_csv() reads the CSV file into a DataFrame.
+load_csv() reads the CSV file into a DataFrame like pd.read_csv(), but keeps a
+columnar copy in a shared cache (see dataset_cache.py), so the next run loads it
+without parsing the CSV again.
 At this point, 'df' contains the iris dataset.
 """
 
@@ -176,3 +180,25 @@ The result is a DataFrame with multi-level column names.
    - Calculate mean, max, and min of 'Age'.
 4. Print the result to analyze class performance and age distribution.
 """
+
+#################################### Many groups: vectorized aggregation ####################################
+
+# from group_agg import group_agg
+# print(group_agg(df, "Class", {"Score": ["mean", "max", "min", "range"], "Age": ["mean", "max", "min"]}))
+"""Explanation:
+group_agg.py gives the same result as groupby().agg(), but sorts the rows by
+group once and computes every reduction with one NumPy call for all groups.
+"range" (max - min) is built in, so range_func does not run once per group.
+"""
+
+#################################### Pivot tables over growing data ####################################
+
+# from pivot_cube import PivotCube
+# cube = PivotCube(index="team", values="score").append(df)
+# cube.append(new_rows)
+# print(cube.pivot("score", "mean"))
+"""Explanation:
+pivot_cube.py keeps count, sum, min, max and spread for every pivot cell, so
+appending new rows only updates the cells they fall into instead of building
+the pivot table again from all rows.
+"""
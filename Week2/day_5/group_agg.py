@@ -0,0 +1,275 @@
+"""
+Vectorized grouped aggregation for the groupby examples of day_5.py.
+
+df.groupby("team")["score"].agg(range_func) calls range_func once per group, so
+with millions of small groups the time goes into Python calls. Here:
+
+1. The key columns are factorized and the rows are sorted by group once
+   (GroupBy(df, by) can be reused for many aggregations).
+2. Every column is put in group order once, and each reduction is one NumPy
+   kernel over all groups: np.add.reduceat, np.minimum.reduceat, ...
+3. Derived reductions are combinations of the basic ones instead of
+   callbacks, e.g. range = max - min, std = sqrt(sum of squared deviations / (n - 1)).
+   Your own can be added with register_reducer.
+
+Missing values are skipped and rows with a missing key are dropped, like pandas.
+
+Example:
+    from group_agg import GroupBy, register_reducer
+    stats = GroupBy(df, "Class").agg({"Score": ["mean", "max", "min", "range"], "Age": ["mean", "std"]})
+    register_reducer("cv", lambda s: s.std / s.mean)
+"""
+import numpy as np
+import pandas as pd
+
+
+class GroupStats:
+    """
+    This Class will compute per-group statistics of one column, each at most once.
+
+    Attributes are NumPy arrays with one value per group, computed on first use:
+    count, size, sum, min, max, mean, var, std, median, first, last, prod.
+
+    Args:
+        values: The column values already sorted by group.
+        starts: Index where each group starts in values.
+        sizes: Number of rows of each group.
+    """
+
+    def __init__(self, values, starts, sizes):
+        self._values = values
+        self.starts = starts
+        self.size = sizes
+        self._cache = {}
+        self.is_float = values.dtype.kind in "fc"
+        self.valid = ~np.isnan(values) if self.is_float else None
+
+    def __getattr__(self, name):
+        if name.startswith("_") or name not in REDUCERS:
+            raise AttributeError(name)
+        if name not in self._cache:
+            self._cache[name] = REDUCERS[name](self)
+        return self._cache[name]
+
+    def filled(self, fill):
+        """
+        This Function will return the sorted values with missing values replaced by fill.
+
+        Args:
+            fill: Replacement value (0 for sums, +inf for minimums ...).
+        """
+        if self.valid is None or self.valid.all():
+            return self._values
+        return np.where(self.valid, self._values, fill)
+
+    def empty_to_nan(self, result):
+        """
+        This Function will set the result of groups without valid values to NaN.
+
+        Args:
+            result: One value per group.
+        """
+        if self.valid is None:
+            return result
+        empty = self.count == 0
+        if empty.any():
+            result = result.astype(np.float64)
+            result[empty] = np.nan
+        return result
+
+    def _reduce(self, ufunc, fill):
+        return self.empty_to_nan(ufunc.reduceat(self.filled(fill), self.starts))
+
+    def _deviations(self):
+        """
+        This Function will return each value minus the mean of its group (0 for missing values).
+        """
+        deviations = self.filled(0.0) - np.repeat(self.mean, self.size)
+        if self.valid is not None:
+            deviations[~self.valid] = 0.0
+        return deviations
+
+    def _nth_valid(self, from_end:bool):
+        if self.valid is None:
+            return self._values[self.starts + self.size - 1 if from_end else self.starts]
+        positions = np.flatnonzero(self.valid)
+        group_end = self.starts + self.size
+        if from_end:
+            index = np.searchsorted(positions, group_end, side="left") - 1
+        else:
+            index = np.searchsorted(positions, self.starts, side="left")
+        index = np.clip(index, 0, max(len(positions) - 1, 0))
+        result = self._values[positions[index]] if len(positions) else np.full(len(self.starts), np.nan)
+        return self.empty_to_nan(result)
+
+    def _median(self):
+        # Sort every group by value at once: primary key group number, secondary key value.
+        group = np.repeat(np.arange(len(self.starts)), self.size)
+        order = np.lexsort((self._values, group))
+        ranked = self._values[order]
+        # NaNs sort last inside their group, so the valid values are the first `count`.
+        count = self.count
+        low = self.starts + np.maximum(count - 1, 0) // 2
+        high = self.starts + count // 2
+        high = np.where(count > 0, high, low)
+        median = (ranked[low] + ranked[high]) / 2
+        return self.empty_to_nan(median)
+
+
+REDUCERS = {
+    "count": lambda s: np.add.reduceat(s.valid, s.starts).astype(np.int64) if s.valid is not None else s.size,
+    "sum": lambda s: np.add.reduceat(s.filled(0), s.starts),
+    "prod": lambda s: np.multiply.reduceat(s.filled(1), s.starts),
+    "min": lambda s: s._reduce(np.minimum, np.inf),
+    "max": lambda s: s._reduce(np.maximum, -np.inf),
+    "mean": lambda s: s.empty_to_nan(s.sum / np.maximum(s.count, 1)),
+    "var": lambda s: np.add.reduceat(s._deviations() ** 2, s.starts) / np.where(s.count > 1, s.count - 1, np.nan),
+    "std": lambda s: np.sqrt(s.var),
+    "range": lambda s: s.max - s.min,
+    "median": lambda s: s._median(),
+    "first": lambda s: s._nth_valid(from_end=False),
+    "last": lambda s: s._nth_valid(from_end=True),
+}
+
+
+def register_reducer(name:str, func):
+    """
+    This Function will add a reduction that is built from other reductions.
+
+    Args:
+        name: Name to use in agg specs.
+        func: Function(GroupStats) -> one value per group, e.g. lambda s: s.max - s.min.
+    """
+    REDUCERS[name] = func
+
+
+class GroupBy:
+    """
+    This Class will group a DataFrame once and compute many aggregations with NumPy kernels.
+
+    Args:
+        df: The DataFrame.
+        by: Key column name or list of names.
+    """
+
+    def __init__(self, df, by):
+        self.df = df
+        self.by = [by] if isinstance(by, str) else list(by)
+
+        # Combine the factorized keys into one integer per row, keeping sorted key order.
+        combined = None
+        for name in self.by:
+            codes, uniques = pd.factorize(df[name], sort=True)
+            codes = codes.astype(np.int64)
+            if combined is None:
+                combined = codes
+            else:
+                if (int(combined.max(initial=0)) + 1) * len(uniques) > np.iinfo(np.int64).max:
+                    # Squeeze the codes back to 0..n-1 first, the product would overflow int64.
+                    kept = combined >= 0
+                    combined[kept] = pd.factorize(combined[kept], sort=True)[0]
+                combined = np.where((combined < 0) | (codes < 0), -1, combined * len(uniques) + codes)
+        rows = np.flatnonzero(combined >= 0) if (combined < 0).any() else None
+        if rows is not None:
+            combined = combined[rows]
+
+        order = np.argsort(combined, kind="stable")
+        ordered = combined[order]
+        self.order = order if rows is None else rows[order]
+        boundary = np.empty(len(ordered), dtype=bool)
+        boundary[:1] = True
+        np.not_equal(ordered[1:], ordered[:-1], out=boundary[1:])
+        self.starts = np.flatnonzero(boundary)
+        self.sizes = np.diff(np.append(self.starts, len(ordered)))
+        self.ngroups = len(self.starts)
+        self._stats = {}
+
+    @property
+    def index(self):
+        """
+        The group keys as an Index (one key) or MultiIndex (several keys).
+        """
+        first_rows = self.order[self.starts]
+        if len(self.by) == 1:
+            name = self.by[0]
+            return pd.Index(self.df[name].to_numpy()[first_rows], name=name)
+        arrays = [self.df[name].to_numpy()[first_rows] for name in self.by]
+        return pd.MultiIndex.from_arrays(arrays, names=self.by)
+
+    def stats(self, column):
+        """
+        This Function will return the GroupStats of a column (values are put in group order once).
+
+        Args:
+            column: Column name.
+        """
+        if column not in self._stats:
+            values = self.df[column].to_numpy()
+            if values.dtype.kind == "b":
+                values = values.astype(np.int64)
+            self._stats[column] = GroupStats(values[self.order], self.starts, self.sizes)
+        return self._stats[column]
+
+    def agg(self, spec):
+        """
+        This Function will compute the requested reductions, like DataFrameGroupBy.agg.
+
+        Args:
+            spec: {column: name or [names]}, or a name / list of names for every non-key column.
+                  A name may also be a (label, function) pair with function(GroupStats).
+        """
+        if not isinstance(spec, dict):
+            spec = {column: spec for column in self.df.columns if column not in self.by}
+        flat = all(not isinstance(funcs, list) for funcs in spec.values())
+
+        result = {}
+        for column, funcs in spec.items():
+            stats = self.stats(column)
+            for func in funcs if isinstance(funcs, list) else [funcs]:
+                label, func = func if isinstance(func, tuple) else (func, REDUCERS.get(func))
+                if func is None:
+                    raise ValueError(f"Unknown reduction: {label!r}")
+                result[column if flat else (column, label)] = func(stats)
+        frame = pd.DataFrame(result, index=self.index)
+        if not flat:
+            frame.columns = pd.MultiIndex.from_tuples(frame.columns)
+        return frame
+
+
+def group_agg(df, by, spec):
+    """
+    This Function will group df by the key columns and compute spec in one call.
+
+    Args:
+        df: The DataFrame.
+        by: Key column name or list of names.
+        spec: See GroupBy.agg.
+    """
+    return GroupBy(df, by).agg(spec)
+
+
+if __name__ == "__main__":
+    import time
+
+    rng = np.random.default_rng(0)
+    n = 2_000_000
+    frame = pd.DataFrame({
+        "team": rng.integers(0, n // 4, n),
+        "score": rng.normal(70, 10, n),
+        "age": rng.integers(15, 18, n),
+    })
+
+    def range_func(x):
+        return x.max() - x.min()
+
+    start = time.perf_counter()
+    expected = frame.groupby("team").agg({"score": ["mean", "max", "min", "std", range_func], "age": ["mean"]})
+    pandas_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = group_agg(frame, "team", {"score": ["mean", "max", "min", "std", "range"], "age": ["mean"]})
+    vectorized_time = time.perf_counter() - start
+
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy())
+    print(f"{n} rows, {len(result)} groups")
+    print(f"pandas agg with range_func: {pandas_time:.2f}s  group_agg: {vectorized_time:.2f}s")
@@ -0,0 +1,240 @@
+"""
+Incrementally maintained pivot table ("cube") for append-only data.
+
+df.pivot_table(values="score", index="team", aggfunc="mean") in day_5.py, and
+the income by department x years_experience pivot in Week2/day_7/day_7.py, go
+over every row again each time they are built. PivotCube keeps, for every cell
+(combination of index/column keys) and every value column:
+
+    count, sum, m2 (sum of squared deviations from the cell mean), min, max
+
+These merge exactly: adding new rows only groups the new rows and updates the
+cells they touch, and two cubes built on different parts of the data can be
+merged. mean, var, std and pivoted views are read from the cells in O(cells).
+
+Numeric dimensions can be binned with fixed edges, e.g. bins={"years_experience":
+[0, 10, 20, 30]}. (pd.cut(..., bins=3) picks new edges whenever the data range
+changes, so it cannot be kept up to date incrementally.)
+
+Example:
+    from pivot_cube import PivotCube
+    cube = PivotCube(index="department", columns="years_experience", values="income",
+                     bins={"years_experience": [0, 10, 20, 40]})
+    cube.append(df)
+    cube.append(new_rows)            # only the touched cells change
+    print(cube.pivot("income", "mean"))
+"""
+import numpy as np
+import pandas as pd
+
+from group_agg import GroupBy
+
+STATISTICS = ("count", "sum", "mean", "var", "std", "min", "max")
+_BATCH_REDUCERS = [
+    "count",
+    "sum",
+    ("m2", lambda s: np.where(s.count > 1, s.var * (s.count - 1), 0.0)),
+    "min",
+    "max",
+]
+
+
+class PivotCube:
+    """
+    This Class will keep mergeable per-cell statistics that are updated as rows are appended.
+
+    Args:
+        index: Row key column name or list of names.
+        values: Value column name or list of names.
+        columns: Column key name or list of names (optional).
+        bins: {column: bin edges} for numeric key columns, cut like pd.cut(column, edges).
+    """
+
+    def __init__(self, index, values, columns=(), bins=None):
+        as_list = lambda names: [names] if isinstance(names, str) else list(names)
+        self.index = as_list(index)
+        self.columns = as_list(columns)
+        self.values = as_list(values)
+        self.bins = dict(bins or {})
+        self.dimensions = self.index + self.columns
+        self._cell_of = {}
+        self._keys = []
+        shape = (0, len(self.values))
+        self._count = np.zeros(shape, dtype=np.int64)
+        self._sum = np.zeros(shape)
+        self._m2 = np.zeros(shape)
+        self._min = np.full(shape, np.nan)
+        self._max = np.full(shape, np.nan)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def _cell_ids(self, keys):
+        """
+        This Function will return the cell number of every key, creating cells for new keys.
+
+        Args:
+            keys: List of key tuples.
+        """
+        ids = np.empty(len(keys), dtype=np.intp)
+        for i, key in enumerate(keys):
+            cell = self._cell_of.get(key)
+            if cell is None:
+                cell = self._cell_of[key] = len(self._keys)
+                self._keys.append(key)
+            ids[i] = cell
+        missing = len(self._keys) - len(self._count)
+        if missing > 0:
+            # Grow the arrays by at least doubling, so many small appends stay cheap.
+            grow = max(missing, len(self._count))
+            self._count = np.concatenate([self._count, np.zeros((grow, len(self.values)), dtype=np.int64)])
+            self._sum = np.concatenate([self._sum, np.zeros((grow, len(self.values)))])
+            self._m2 = np.concatenate([self._m2, np.zeros((grow, len(self.values)))])
+            self._min = np.concatenate([self._min, np.full((grow, len(self.values)), np.nan)])
+            self._max = np.concatenate([self._max, np.full((grow, len(self.values)), np.nan)])
+        return ids
+
+    def _merge_cells(self, ids, count, total, m2, minimum, maximum):
+        """
+        This Function will merge statistics of other rows into the cells ids (Chan's parallel update).
+
+        Args:
+            ids: Cell numbers (no duplicates), one per row of the other arrays.
+            count, total, m2, minimum, maximum: Statistics to merge, shape (len(ids), len(values)).
+        """
+        old_count = self._count[ids]
+        old_sum = self._sum[ids]
+        new_count = old_count + count
+        with np.errstate(divide="ignore", invalid="ignore"):
+            delta = total / count - old_sum / old_count
+            correction = np.where((old_count > 0) & (count > 0), delta ** 2 * old_count * count / new_count, 0.0)
+        self._m2[ids] += m2 + correction
+        self._count[ids] = new_count
+        self._sum[ids] = old_sum + total
+        self._min[ids] = np.fmin(self._min[ids], minimum)
+        self._max[ids] = np.fmax(self._max[ids], maximum)
+
+    def append(self, df):
+        """
+        This Function will add new rows, updating only the cells they fall into.
+
+        Args:
+            df: DataFrame with the key columns and the value columns.
+        """
+        if len(df) == 0:
+            return self
+        frame = df[self.dimensions + self.values]
+        if self.bins:
+            frame = frame.assign(**{name: pd.cut(frame[name], edges) for name, edges in self.bins.items()})
+        grouped = GroupBy(frame, self.dimensions)
+        if grouped.ngroups == 0:
+            return self
+        batch = grouped.agg({value: _BATCH_REDUCERS for value in self.values})
+        keys = [key if isinstance(key, tuple) else (key,) for key in batch.index]
+        stats = {name: batch.xs(name, axis=1, level=1)[self.values].to_numpy(np.float64) for name in
+                 ("count", "sum", "m2", "min", "max")}
+        self._merge_cells(self._cell_ids(keys), stats["count"].astype(np.int64), stats["sum"],
+                          stats["m2"], stats["min"], stats["max"])
+        return self
+
+    def merge(self, other):
+        """
+        This Function will add the cells of another cube built with the same keys and values.
+
+        Args:
+            other: A PivotCube.
+        """
+        if other.dimensions != self.dimensions or other.values != self.values:
+            raise ValueError("Only cubes with the same keys and values can be merged")
+        n = len(other)
+        if n:
+            self._merge_cells(self._cell_ids(other._keys), other._count[:n], other._sum[:n],
+                              other._m2[:n], other._min[:n], other._max[:n])
+        return self
+
+    def stat(self, statistic:str = "mean", value=None):
+        """
+        This Function will return one statistic for every cell, as a Series indexed by the keys.
+
+        Args:
+            statistic: One of STATISTICS.
+            value: Value column (default: the first one).
+        """
+        column = self.values.index(value if value is not None else self.values[0])
+        n = len(self)
+        count = self._count[:n, column]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if statistic == "count":
+                result = count
+            elif statistic == "sum":
+                result = self._sum[:n, column]
+            elif statistic == "mean":
+                result = self._sum[:n, column] / count
+            elif statistic in ("var", "std"):
+                result = np.where(count > 1, self._m2[:n, column] / (count - 1), np.nan)
+                if statistic == "std":
+                    result = np.sqrt(result)
+            elif statistic == "min":
+                result = self._min[:n, column]
+            elif statistic == "max":
+                result = self._max[:n, column]
+            else:
+                raise ValueError(f"Unknown statistic {statistic!r}; choose from {STATISTICS}")
+        index = pd.MultiIndex.from_tuples(self._keys, names=self.dimensions) if n else \
+            pd.MultiIndex.from_arrays([[]] * len(self.dimensions), names=self.dimensions)
+        if len(self.dimensions) == 1:
+            index = index.get_level_values(0)
+        return pd.Series(result, index=index, name=statistic).sort_index()
+
+    def pivot(self, value=None, aggfunc:str = "mean"):
+        """
+        This Function will return the pivot table (index keys x column keys) of one statistic.
+
+        Args:
+            value: Value column (default: the first one).
+            aggfunc: One of STATISTICS.
+        """
+        series = self.stat(aggfunc, value)
+        if not self.columns:
+            return series.to_frame(value if value is not None else self.values[0])
+        return series.unstack(self.columns)
+
+    def to_frame(self):
+        """
+        This Function will return every cell with all its statistics as a DataFrame.
+        """
+        return pd.concat(
+            {(value, name): self.stat(name, value) for value in self.values for name in STATISTICS},
+            axis=1,
+        )
+
+
+if __name__ == "__main__":
+    import time
+
+    rng = np.random.default_rng(0)
+    n = 2_000_000
+    data = pd.DataFrame({
+        "department": rng.choice(["IT", "HR", "Sales", "Finance"], n),
+        "years_experience": rng.uniform(0, 30, n),
+        "income": rng.normal(60_000, 15_000, n),
+    })
+    edges = [0, 10, 20, 30]
+    cube = PivotCube("department", "income", columns="years_experience", bins={"years_experience": edges})
+    cube.append(data)
+
+    new_rows = data.sample(1_000, random_state=0)
+    start = time.perf_counter()
+    cube.append(new_rows)
+    cube_view = cube.pivot("income", "mean")
+    cube_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    everything = pd.concat([data, new_rows])
+    expected = pd.pivot_table(everything, values="income", index="department",
+                              columns=pd.cut(everything["years_experience"], edges), aggfunc="mean", observed=True)
+    pivot_time = time.perf_counter() - start
+
+    np.testing.assert_allclose(cube_view.to_numpy(), expected.to_numpy())
+    print(cube_view)
+    print(f"Refresh after 1000 new rows: PivotCube {cube_time * 1000:.1f} ms, pivot_table {pivot_time * 1000:.1f} ms")
@@ -0,0 +1,248 @@
+"""
+Offline-first registry for the remote datasets used across the course.
+
+day_7.py and the notebooks of Week4-Week7 download iris, tips, titanic,
+StudentsPerformance and creditcard with requests.get(url) / pd.read_csv(url)
+on every run. DatasetRegistry maps a dataset name to its URL (and optionally
+its SHA-256) and keeps downloaded files in a content-addressed store:
+
+    <store>/objects/<first 2 hex digits>/<sha256>   the file, named by its hash
+    <store>/refs.json                               {name: {"sha256": ..., "url": ...}}
+
+- A dataset is downloaded once; later loads read the local object (no network).
+- Downloads go to a temporary file and are renamed into place after the hash
+  is checked, so a failed or interrupted download never leaves a bad file.
+- iris and titanic ship with the SHA-256 of the copies in this repository
+  (Week2/day_3/iris.csv, Week2/day_7/dataset/titanic_dataset.csv). For entries
+  with sha256=None the hash of the first download is recorded in refs.json and
+  pinned from then on.
+- offline_dir: a local folder that stands in for the remote host (files named
+  like the dataset, e.g. titanic_dataset.csv, titanic.csv). offline=True, or the
+  environment variable DATASET_OFFLINE=1, never touches the network.
+
+Example:
+    from dataset_registry import DatasetRegistry
+    registry = DatasetRegistry(offline_dir="dataset")
+    df = registry.load("titanic")
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import urllib.request
+from pathlib import Path
+
+DATASETS = {
+    "iris": {
+        "url": "https://raw.githubusercontent.com/mwaskom/seaborn-data/refs/heads/master/iris.csv",
+        "sha256": "9cc1c345c71bcc9b486b74cbf6063fa66f4bb5e0f603a4b3c3471ec2e5e8e355",
+    },
+    "tips": {
+        "url": "https://raw.githubusercontent.com/mwaskom/seaborn-data/refs/heads/master/tips.csv",
+        "sha256": None,
+    },
+    "titanic": {
+        "url": "https://raw.githubusercontent.com/datasciencedojo/datasets/refs/heads/master/titanic.csv",
+        "sha256": "4a437fde05fe5264e1701a7387ac6fb75393772ba38bb2c9c566405af5af4bd7",
+        "filename": "titanic_dataset.csv",
+    },
+    "students_performance": {
+        "url": "https://raw.githubusercontent.com/shubhamtamhane/student-performance-python/refs/heads/master/StudentsPerformance.csv",
+        "sha256": None,
+    },
+    "creditcard": {
+        "url": "https://storage.googleapis.com/download.tensorflow.org/data/creditcard.csv",
+        "sha256": None,
+    },
+}
+DEFAULT_STORE = Path(os.environ.get("DATASET_STORE", Path.home() / ".cache" / "ai-practice-datasets-store"))
+_CHUNK = 1 << 20
+
+
+class DatasetRegistry:
+    """
+    This Class will serve named datasets from a local content-addressed store, downloading them once.
+
+    Args:
+        store: Store directory (default: $DATASET_STORE or ~/.cache/ai-practice-datasets-store).
+        offline_dir: Local folder used instead of the remote host when it has the file.
+        offline: Never download (default: $DATASET_OFFLINE == "1").
+        datasets: {name: {"url": ..., "sha256": ... or None, "filename": ...}} (default: DATASETS).
+        timeout: Download timeout in seconds.
+    """
+
+    def __init__(self, store=None, offline_dir=None, offline:bool = None, datasets=None, timeout:float = 60):
+        self.store = Path(store) if store is not None else DEFAULT_STORE
+        self.offline_dir = Path(offline_dir) if offline_dir is not None else None
+        self.offline = os.environ.get("DATASET_OFFLINE") == "1" if offline is None else offline
+        self.datasets = {name: dict(entry) for name, entry in (datasets or DATASETS).items()}
+        self.timeout = timeout
+
+    def register(self, name:str, url:str, sha256:str = None, filename:str = None):
+        """
+        This Function will add or replace a dataset entry.
+
+        Args:
+            name: Dataset name.
+            url: Where to download it.
+            sha256: Expected SHA-256 of the file (None: pin the first download).
+            filename: Name of the file in offline_dir (default: the last part of the URL).
+        """
+        self.datasets[name] = {"url": url, "sha256": sha256, "filename": filename}
+
+    # ------------------------------------------------------------- store
+
+    def _object_path(self, digest:str):
+        return self.store / "objects" / digest[:2] / digest
+
+    def _refs(self):
+        try:
+            with open(self.store / "refs.json", "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_ref(self, name:str, digest:str, source:str):
+        refs = self._refs()
+        refs[name] = {"sha256": digest, "url": self.datasets[name]["url"], "source": source}
+        self.store.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.store, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(refs, file, indent=2)
+        os.replace(tmp_path, self.store / "refs.json")
+
+    def _expected(self, name:str):
+        """
+        This Function will return the pinned hash of a dataset: from the registry, else from refs.json.
+        """
+        entry = self._entry(name)
+        if entry.get("sha256"):
+            return entry["sha256"]
+        ref = self._refs().get(name)
+        if ref and ref.get("url") == entry["url"]:
+            return ref["sha256"]
+        return None
+
+    def _entry(self, name:str):
+        if name not in self.datasets:
+            raise KeyError(f"Unknown dataset {name!r}; known: {', '.join(sorted(self.datasets))}")
+        return self.datasets[name]
+
+    def _store_stream(self, stream, expected:str = None):
+        """
+        This Function will copy a byte stream into the store and return its hash.
+
+        The data goes to a temporary file first and is only renamed into place
+        once its hash is known (and matches `expected` when given).
+
+        Args:
+            stream: Binary file-like object.
+            expected: Required SHA-256, or None.
+        """
+        objects = self.store / "objects"
+        objects.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        fd, tmp_path = tempfile.mkstemp(dir=objects, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                for chunk in iter(lambda: stream.read(_CHUNK), b""):
+                    digest.update(chunk)
+                    file.write(chunk)
+                file.flush()
+                os.fsync(file.fileno())
+            hexdigest = digest.hexdigest()
+            if expected is not None and hexdigest != expected:
+                raise ValueError(f"Checksum mismatch: expected {expected}, got {hexdigest}")
+            target = self._object_path(hexdigest)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp_path, target)
+            return hexdigest
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _offline_file(self, name:str):
+        if self.offline_dir is None:
+            return None
+        entry = self._entry(name)
+        candidates = [entry.get("filename"), entry["url"].rsplit("/", 1)[-1], f"{name}.csv"]
+        for candidate in candidates:
+            if candidate and (self.offline_dir / candidate).is_file():
+                return self.offline_dir / candidate
+        return None
+
+    # -------------------------------------------------------------- API
+
+    def path(self, name:str, refresh:bool = False):
+        """
+        This Function will return the local path of a dataset, fetching it first if needed.
+
+        Args:
+            name: Dataset name.
+            refresh: Fetch again even if the store has it (the hash must still match if pinned).
+        """
+        expected = self._expected(name)
+        if expected is not None and not refresh:
+            target = self._object_path(expected)
+            if target.is_file():
+                return target
+        return self.fetch(name, expected)
+
+    def fetch(self, name:str, expected:str = None):
+        """
+        This Function will copy a dataset into the store from offline_dir or the URL.
+
+        Args:
+            name: Dataset name.
+            expected: Required SHA-256 (default: the pinned hash, if any).
+        """
+        entry = self._entry(name)
+        expected = expected if expected is not None else self._expected(name)
+        local = self._offline_file(name)
+        if local is not None:
+            with open(local, "rb") as stream:
+                digest = self._store_stream(stream, expected)
+            source = str(local)
+        elif self.offline:
+            raise FileNotFoundError(f"Dataset {name!r} is not in the store and offline mode is on")
+        else:
+            with urllib.request.urlopen(entry["url"], timeout=self.timeout) as stream:
+                digest = self._store_stream(stream, expected)
+            source = entry["url"]
+        self._save_ref(name, digest, source)
+        return self._object_path(digest)
+
+    def load(self, name:str, **read_csv_kwargs):
+        """
+        This Function will read a dataset with pd.read_csv from the local store.
+
+        Args:
+            name: Dataset name.
+            read_csv_kwargs: Options for pd.read_csv.
+        """
+        import pandas as pd
+
+        return pd.read_csv(self.path(name), **read_csv_kwargs)
+
+    def export(self, name:str, destination):
+        """
+        This Function will copy a dataset to a normal file (e.g. dataset/titanic_dataset.csv).
+
+        Args:
+            name: Dataset name.
+            destination: Path of the copy.
+        """
+        destination = Path(destination)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(self.path(name), destination)
+        return destination
+
+
+if __name__ == "__main__":
+    import sys
+
+    registry = DatasetRegistry()
+    for dataset in sys.argv[1:] or sorted(registry.datasets):
+        print(dataset, registry.path(dataset))
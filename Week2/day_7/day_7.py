@@ -184,20 +184,17 @@ plt.title('Income Distribution by Department')
 """
 
 import pandas as pd
-import requests
 import os
 from pathlib import Path
+from dataset_registry import DatasetRegistry
 
 ################################Task 1: Perform Data Cleaning, Aggregation, and Filtering
 # Load Titanic dataset
-url = "https://raw.githubusercontent.com/datasciencedojo/datasets/refs/heads/master/titanic.csv"
+# The registry downloads titanic.csv only once into a local store (or takes the
+# copy in dataset/ when there is one) and checks it against its SHA-256.
 current_dir = Path(os.getcwd())
-path = current_dir / "dataset" / "titanic_dataset.csv"
-if not path.exists():
-    with open(path, "w", encoding="utf-8") as f:
-        data = requests.get(url)
-        f.write(data.text)
-df = pd.read_csv(path)
+registry = DatasetRegistry(offline_dir=current_dir / "dataset")
+df = registry.load("titanic")
 data = pd.DataFrame(df)
 # print(data)
 
@@ -254,6 +251,14 @@ plt.show()
 
 
 
+# The three figures above can also be written straight to PNG/SVG files, in
+# parallel and only when their data or settings changed, with:
+#     python figure_render.py dataset/titanic_dataset.csv results/figures
+
+# The whole profile (missing values, moments, quantiles, top values, survival rate
+# by every small column) can be written to a report file in one pass with:
+#     python eda_report.py dataset/titanic_dataset.csv --target Survived
+
 ###########################A Note to myself###############################
 """
 Additional Practice
@@ -0,0 +1,400 @@
+"""
+One-pass EDA report for CSV files of any size.
+
+day_7.py looks at the Titanic data with info(), describe(), three boolean
+filters for survival_counts and a groupby for the survival rate, and the
+report in results/ is written by hand. profile_csv reads the file once, in
+chunks, and keeps for every column only small mergeable summaries:
+
+- missing values and dtype,
+- numeric columns: count, mean, std, skew, kurtosis (merged moments), min, max,
+  and quantiles from a bounded uniform sample (exact while the column is small),
+- every column: the most frequent values (exact up to max_tracked distinct
+  values, then the rarest ones are dropped and counts become lower bounds),
+- with a target column (e.g. Survived): the target rate for every level of each
+  low-cardinality column (survival by Pclass, Sex, Embarked ...) and the
+  correlation of each numeric column with the target.
+
+Memory does not grow with the number of rows. write_report turns the profile
+into a text report like results/Titanic Dataset EDA Report.txt.
+
+Usage:
+    python eda_report.py dataset/titanic_dataset.csv --target Survived
+"""
+import argparse
+import math
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CHUNKSIZE = 100_000
+SAMPLE_SIZE = 100_000
+MAX_TRACKED = 10_000
+MAX_LEVELS = 20
+QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+
+class NumericSummary:
+    """
+    This Class will keep count, moments, min/max and a bounded sample of a numeric column.
+
+    Args:
+        sample_size: Maximum number of values kept for quantiles.
+        seed: Seed of the sampling.
+    """
+
+    def __init__(self, sample_size:int = SAMPLE_SIZE, seed:int = 0):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = self.m3 = self.m4 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.sample_size = sample_size
+        self._rng = np.random.default_rng(seed)
+        self._sample = np.empty(0)
+        self._keys = np.empty(0)
+
+    def update(self, values):
+        """
+        This Function will add the non-missing values of one chunk.
+
+        Args:
+            values: 1D float array without NaN.
+        """
+        nb = len(values)
+        if nb == 0:
+            return
+        mean_b = values.mean()
+        deviation = values - mean_b
+        squares = deviation * deviation
+        m2b = squares.sum()
+        m3b = (squares * deviation).sum()
+        m4b = (squares * squares).sum()
+
+        # Merge two sets of central moments (Chan / Pebay update formulas).
+        na, n = self.n, self.n + nb
+        delta = mean_b - self.mean
+        self.m4 += (m4b + delta ** 4 * na * nb * (na * na - na * nb + nb * nb) / n ** 3
+                    + 6 * delta ** 2 * (na * na * m2b + nb * nb * self.m2) / n ** 2
+                    + 4 * delta * (na * m3b - nb * self.m3) / n)
+        self.m3 += m3b + delta ** 3 * na * nb * (na - nb) / n ** 2 + 3 * delta * (na * m2b - nb * self.m2) / n
+        self.m2 += m2b + delta ** 2 * na * nb / n
+        self.mean += delta * nb / n
+        self.n = n
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+
+        # Bottom-k sampling: every value gets a random key and the smallest keys are kept,
+        # which is a uniform sample of everything seen so far.
+        keys = np.concatenate([self._keys, self._rng.random(nb)])
+        sample = np.concatenate([self._sample, values])
+        if len(sample) > self.sample_size:
+            keep = np.argpartition(keys, self.sample_size)[:self.sample_size]
+            keys, sample = keys[keep], sample[keep]
+        self._keys, self._sample = keys, sample
+
+    @property
+    def exact_quantiles(self):
+        return self.n <= self.sample_size
+
+    def quantiles(self, probabilities=QUANTILES):
+        if self.n == 0:
+            return {p: math.nan for p in probabilities}
+        return dict(zip(probabilities, np.quantile(self._sample, probabilities)))
+
+    @property
+    def std(self):
+        return math.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else math.nan
+
+    @property
+    def skew(self):
+        """Sample skewness, like Series.skew()."""
+        n = self.n
+        if n < 3 or self.m2 == 0:
+            return math.nan
+        g1 = math.sqrt(n) * self.m3 / self.m2 ** 1.5
+        return g1 * math.sqrt(n * (n - 1)) / (n - 2)
+
+    @property
+    def kurtosis(self):
+        """Sample excess kurtosis, like Series.kurt()."""
+        n = self.n
+        if n < 4 or self.m2 == 0:
+            return math.nan
+        g2 = n * self.m4 / self.m2 ** 2 - 3
+        return (n - 1) / ((n - 2) * (n - 3)) * ((n + 1) * g2 + 6)
+
+
+class ValueCounter:
+    """
+    This Class will count values, keeping at most max_tracked distinct values.
+
+    Args:
+        max_tracked: Number of distinct values kept; beyond it the rarest are dropped.
+    """
+
+    def __init__(self, max_tracked:int = MAX_TRACKED):
+        self.max_tracked = max_tracked
+        self.counts = pd.Series(dtype=np.int64)
+        self.approximate = False
+
+    def update(self, values):
+        chunk_counts = pd.Series(values).value_counts(dropna=True)
+        self.counts = self.counts.add(chunk_counts, fill_value=0) if len(self.counts) else chunk_counts
+        if len(self.counts) > self.max_tracked:
+            self.counts = self.counts.nlargest(self.max_tracked)
+            self.approximate = True
+
+    def top(self, k:int = 5):
+        return self.counts.nlargest(k).astype(np.int64)
+
+
+class TargetRates:
+    """
+    This Class will keep the count and target sum for every level of one column.
+
+    Args:
+        max_levels: Stop (and report nothing) once the column has more levels than this.
+    """
+
+    def __init__(self, max_levels:int = MAX_LEVELS):
+        self.max_levels = max_levels
+        self.table = None
+        self.too_many = False
+
+    def update(self, levels, target):
+        if self.too_many:
+            return
+        chunk = target.groupby(levels, dropna=False, sort=False).agg(["count", "sum"])
+        self.table = chunk if self.table is None else self.table.add(chunk, fill_value=0)
+        if len(self.table) > self.max_levels:
+            self.table, self.too_many = None, True
+
+    def rates(self):
+        if self.table is None:
+            return None
+        table = self.table.sort_index()
+        return pd.DataFrame({"count": table["count"].astype(np.int64), "rate": table["sum"] / table["count"]})
+
+
+class Correlation:
+    """
+    This Class will keep shifted sums to compute the Pearson correlation of two columns in one pass.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.shift = None
+        self.sums = np.zeros(5)
+
+    def update(self, x, y):
+        keep = ~(np.isnan(x) | np.isnan(y))
+        x, y = x[keep], y[keep]
+        if len(x) == 0:
+            return
+        if self.shift is None:
+            # Shifting by a typical value keeps the sums of squares small (less cancellation).
+            self.shift = (x[0], y[0])
+        x = x - self.shift[0]
+        y = y - self.shift[1]
+        self.n += len(x)
+        self.sums += (x.sum(), y.sum(), (x * x).sum(), (y * y).sum(), (x * y).sum())
+
+    @property
+    def value(self):
+        n = self.n
+        sx, sy, sxx, syy, sxy = self.sums
+        denominator = math.sqrt(max(n * sxx - sx * sx, 0) * max(n * syy - sy * sy, 0))
+        return (n * sxy - sx * sy) / denominator if n > 1 and denominator else math.nan
+
+
+class Profile:
+    """
+    This Class will build the summaries of every column from a stream of DataFrame chunks.
+
+    Args:
+        target: Name of a numeric or 0/1 target column for conditional rates (optional).
+        sample_size: Values kept per numeric column for quantiles.
+        max_tracked: Distinct values counted per column.
+        max_levels: Columns with more levels than this get no target rates.
+    """
+
+    def __init__(self, target=None, sample_size:int = SAMPLE_SIZE, max_tracked:int = MAX_TRACKED,
+                 max_levels:int = MAX_LEVELS):
+        self.target = target
+        self.sample_size = sample_size
+        self.max_tracked = max_tracked
+        self.max_levels = max_levels
+        self.rows = 0
+        self.columns = []
+        self.dtypes = {}
+        self.missing = {}
+        self.numeric = {}
+        self.values = {}
+        self.rates = {}
+        self.correlations = {}
+
+    def _start(self, chunk):
+        self.columns = list(chunk.columns)
+        for i, name in enumerate(self.columns):
+            self.dtypes[name] = str(chunk[name].dtype)
+            self.missing[name] = 0
+            self.values[name] = ValueCounter(self.max_tracked)
+            if pd.api.types.is_numeric_dtype(chunk[name]) and not pd.api.types.is_bool_dtype(chunk[name]):
+                self.numeric[name] = NumericSummary(self.sample_size, seed=i)
+                if self.target is not None and name != self.target:
+                    self.correlations[name] = Correlation()
+            if self.target is not None and name != self.target:
+                self.rates[name] = TargetRates(self.max_levels)
+
+    def update(self, chunk):
+        """
+        This Function will add one chunk of rows to every summary.
+
+        Args:
+            chunk: DataFrame with the same columns as the first chunk.
+        """
+        if not self.columns:
+            self._start(chunk)
+        self.rows += len(chunk)
+        target = None
+        if self.target is not None:
+            target = pd.to_numeric(chunk[self.target], errors="coerce").astype(np.float64)
+
+        for name in self.columns:
+            column = chunk[name]
+            missing = column.isna()
+            self.missing[name] += int(missing.sum())
+            present = column[~missing]
+            self.values[name].update(present)
+            if name in self.numeric:
+                numbers = pd.to_numeric(present, errors="coerce").to_numpy(np.float64)
+                self.numeric[name].update(numbers[~np.isnan(numbers)])
+                if name in self.correlations:
+                    x = pd.to_numeric(column, errors="coerce").to_numpy(np.float64)
+                    self.correlations[name].update(x, target.to_numpy())
+            if name in self.rates:
+                self.rates[name].update(column, target)
+        return self
+
+
+def profile_csv(path, target=None, chunksize:int = DEFAULT_CHUNKSIZE, **kwargs):
+    """
+    This Function will profile a CSV file in one pass over its chunks.
+
+    Args:
+        path: Path of the CSV file.
+        target: Optional target column (e.g. "Survived").
+        chunksize: Rows per chunk (bounds the memory used).
+        kwargs: Options for Profile.
+    """
+    profile = Profile(target, **kwargs)
+    with pd.read_csv(path, chunksize=chunksize) as reader:
+        for chunk in reader:
+            profile.update(chunk)
+    return profile
+
+
+def profile_frame(df, target=None, **kwargs):
+    """
+    This Function will profile a DataFrame that is already in memory.
+
+    Args:
+        df: The DataFrame.
+        target: Optional target column.
+        kwargs: Options for Profile.
+    """
+    return Profile(target, **kwargs).update(df)
+
+
+def _fmt(value):
+    if isinstance(value, (float, np.floating)):
+        return "nan" if math.isnan(value) else f"{value:,.4g}"
+    return str(value)
+
+
+def render_report(profile, title:str = "EDA Report"):
+    """
+    This Function will turn a profile into the text of the report.
+
+    Args:
+        profile: A Profile.
+        title: First line of the report.
+    """
+    lines = [title, "", "1.Overview", ""]
+    lines.append(f"    Dataset contains {profile.rows} rows and {len(profile.columns)} columns.")
+    with_missing = [name for name in profile.columns if profile.missing[name]]
+    if with_missing:
+        lines.append("    Missing values:")
+        for name in with_missing:
+            share = profile.missing[name] / max(profile.rows, 1)
+            lines.append(f"        {name:<20} {profile.missing[name]:>10} ({share:.1%})")
+    else:
+        lines.append("    No missing values.")
+
+    lines += ["", "2.Numeric Columns", ""]
+    header = ["count", "mean", "std", "min"] + [f"{p:.0%}" for p in QUANTILES] + ["max", "skew", "kurt"]
+    lines.append("    " + f"{'column':<20}" + "".join(f"{h:>11}" for h in header))
+    for name, summary in profile.numeric.items():
+        row = [summary.n, summary.mean, summary.std, summary.min]
+        row += list(summary.quantiles().values()) + [summary.max, summary.skew, summary.kurtosis]
+        lines.append("    " + f"{name:<20}" + "".join(f"{_fmt(value):>11}" for value in row))
+    if any(not summary.exact_quantiles for summary in profile.numeric.values()):
+        lines.append(f"    (quantiles estimated from a uniform sample of {profile.sample_size} values)")
+
+    lines += ["", "3.Top Values", ""]
+    for name in profile.columns:
+        counter = profile.values[name]
+        distinct = f"{len(counter.counts)}+" if counter.approximate else str(len(counter.counts))
+        top = ", ".join(f"{value} ({count})" for value, count in counter.top().items())
+        lines.append(f"    {name:<20} distinct: {distinct:<8} top: {top}")
+
+    if profile.target is not None:
+        lines += ["", f"4.{profile.target} Rate by Group", ""]
+        for name, rates in profile.rates.items():
+            table = rates.rates()
+            if table is None:
+                continue
+            parts = ", ".join(f"{level}: {rate:.0%} of {count}"
+                              for level, rate, count in zip(table.index, table["rate"], table["count"]))
+            lines.append(f"    {name:<20} {parts}")
+        lines += ["", f"5.Correlation with {profile.target}", ""]
+        ranked = sorted(profile.correlations.items(), key=lambda item: -abs(np.nan_to_num(item[1].value)))
+        for name, correlation in ranked:
+            lines.append(f"    {name:<20} {_fmt(correlation.value)}")
+    return "\n".join(lines) + "\n"
+
+
+def write_report(profile, output, title:str = "EDA Report"):
+    """
+    This Function will write the report text file.
+
+    Args:
+        profile: A Profile.
+        output: Path of the report file.
+        title: First line of the report.
+    """
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(render_report(profile, title), encoding="utf-8")
+    return output
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a one-pass EDA report for a CSV file.")
+    parser.add_argument("csv", help="CSV file to profile")
+    parser.add_argument("--target", help="target column for conditional rates, e.g. Survived")
+    parser.add_argument("--output", help="report file (default: results/<name> EDA Profile.txt)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    args = parser.parse_args(argv)
+
+    path = Path(args.csv)
+    output = args.output or Path(__file__).parent / "results" / f"{path.stem} EDA Profile.txt"
+    profile = profile_csv(path, args.target, args.chunksize)
+    written = write_report(profile, output, f"{path.stem} EDA Report")
+    print(f"Wrote {written}")
+
+
+if __name__ == "__main__":
+    main()
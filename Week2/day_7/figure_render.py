@@ -0,0 +1,234 @@
+"""
+Headless, parallel rendering of EDA figures from specs.
+
+day_7.py draws the survival-rate bar chart, the Age histogram and the Age vs
+Fare scatter one by one with plt.show(), and results/Figure_1..3.png were saved
+by hand. Here every figure is a small dict (a "spec"):
+
+    {"name": "survival_rate", "kind": "bar", "x": "Pclass", "y": "Survived", "agg": "mean",
+     "title": "Survival Rate", "ylabel": "survival Rate", "color": "skyblue"}
+
+render_figures draws the specs with the Agg backend (no window, no pyplot state)
+in a process pool and writes PNG or SVG files directly. Each output remembers a
+key made of the spec and a hash of the columns it uses; when neither changed
+the figure is skipped.
+
+Kinds: bar (optionally aggregated by x with agg=), hist (bins=, kde=True), scatter,
+line, box (y by x).
+
+Usage:
+    python figure_render.py dataset/titanic_dataset.csv results/figures
+"""
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+RENDER_VERSION = 1
+CACHE_FILE = ".figure_cache.json"
+_SPEC_COLUMNS = ("x", "y")
+
+TITANIC_FIGURES = [
+    {"name": "survival_rate", "kind": "bar", "x": "Pclass", "y": "Survived", "agg": "mean",
+     "title": "Survival Rate", "ylabel": "survival Rate", "color": "skyblue"},
+    {"name": "age_distribution", "kind": "hist", "x": "Age", "bins": 20, "kde": True,
+     "title": "Age distribution", "xlabel": "Age", "ylabel": "frequency", "color": "purple"},
+    {"name": "age_vs_fare", "kind": "scatter", "x": "Age", "y": "Fare", "alpha": 0.5,
+     "title": "Age vs Fare", "xlabel": "Age", "ylabel": "Fare", "color": "green"},
+]
+
+
+def spec_columns(spec):
+    """
+    This Function will return the data columns a spec uses.
+
+    Args:
+        spec: Figure spec dict.
+    """
+    return [spec[key] for key in _SPEC_COLUMNS if spec.get(key) is not None]
+
+
+def figure_key(spec, data):
+    """
+    This Function will return the cache key of a figure: a hash of its spec and its data.
+
+    Args:
+        spec: Figure spec dict.
+        data: DataFrame with the spec's columns.
+    """
+    import matplotlib
+
+    digest = hashlib.sha256()
+    digest.update(json.dumps(spec, sort_keys=True, default=str).encode())
+    digest.update(f"{RENDER_VERSION}|{matplotlib.__version__}".encode())
+    digest.update(pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes())
+    digest.update(json.dumps(list(data.columns), default=str).encode())
+    return digest.hexdigest()
+
+
+def _kde(values, points:int = 512):
+    """
+    This Function will return (grid, density) of a Gaussian KDE with Scott's bandwidth.
+
+    The values are binned first, so the cost is linear in the number of values.
+    """
+    values = values[np.isfinite(values)]
+    if len(values) < 2 or values.std() == 0:
+        return None
+    bandwidth = values.std(ddof=1) * len(values) ** (-1 / 5)
+    low, high = values.min() - 3 * bandwidth, values.max() + 3 * bandwidth
+    counts, edges = np.histogram(values, bins=points, range=(low, high))
+    step = edges[1] - edges[0]
+    half_width = int(4 * bandwidth / step) + 1
+    offsets = np.arange(-half_width, half_width + 1) * step
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2)
+    # The kernel can be longer than the grid (few values), where mode="same" would return
+    # len(kernel) values; take the centred len(counts) values of the full convolution instead.
+    density = np.convolve(counts, kernel / kernel.sum())[half_width:half_width + len(counts)] / (len(values) * step)
+    return (edges[:-1] + edges[1:]) / 2, density
+
+
+def _draw(ax, spec, data):
+    kind = spec["kind"]
+    x, y = spec.get("x"), spec.get("y")
+    style = {key: spec[key] for key in ("color", "alpha") if key in spec}
+    if kind == "bar":
+        series = data.groupby(x)[y].agg(spec["agg"]) if spec.get("agg") else data.set_index(x)[y]
+        ax.bar([str(label) for label in series.index], series.to_numpy(), **style)
+        ax.set_xlabel(x)
+    elif kind == "hist":
+        values = data[x].dropna().to_numpy(np.float64)
+        counts, edges, _ = ax.hist(values, bins=spec.get("bins", 10), **style)
+        if spec.get("kde"):
+            curve = _kde(values)
+            if curve is not None:
+                # Scale the density to the histogram counts, like sns.histplot(kde=True).
+                ax.plot(curve[0], curve[1] * len(values) * (edges[1] - edges[0]), color=spec.get("color"))
+    elif kind == "scatter":
+        ax.scatter(data[x], data[y], s=spec.get("size", 12), **style)
+    elif kind == "line":
+        ax.plot(data[x], data[y], **style)
+    elif kind == "box":
+        groups = [(label, group[y].dropna().to_numpy()) for label, group in data.groupby(x)]
+        ax.boxplot([values for _, values in groups], tick_labels=[str(label) for label, _ in groups])
+    else:
+        raise ValueError(f"Unknown figure kind: {kind!r}")
+    ax.set_title(spec.get("title", ""))
+    if "xlabel" in spec:
+        ax.set_xlabel(spec["xlabel"])
+    if "ylabel" in spec:
+        ax.set_ylabel(spec["ylabel"])
+
+
+def render_figure(spec, data, output):
+    """
+    This Function will draw one spec and write it to output (format from the file suffix).
+
+    Uses matplotlib's Figure directly with the Agg canvas, so it needs no display and
+    shares no state with pyplot or other figures.
+
+    Args:
+        spec: Figure spec dict.
+        data: DataFrame with the columns of the spec.
+        output: Path of the PNG / SVG / PDF file.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure = Figure(figsize=spec.get("figsize", (6.4, 4.8)), dpi=spec.get("dpi", 100))
+    FigureCanvasAgg(figure)
+    _draw(figure.add_subplot(), spec, data)
+    figure.tight_layout()
+    output = Path(output)
+    # Write next to the target and rename, so a half-written figure is never left behind.
+    tmp_path = output.with_name(f".{output.name}.tmp")
+    figure.savefig(tmp_path, format=output.suffix.lstrip(".") or "png")
+    os.replace(tmp_path, output)
+    return str(output)
+
+
+def _render_job(job):
+    spec, data, output = job
+    return render_figure(spec, data, output)
+
+
+def _load_cache(output_dir):
+    try:
+        with open(output_dir / CACHE_FILE, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(output_dir, cache):
+    tmp_path = output_dir / f"{CACHE_FILE}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump(cache, file, indent=2, sort_keys=True)
+    os.replace(tmp_path, output_dir / CACHE_FILE)
+
+
+def render_figures(df, specs, output_dir, workers:int = None, default_format:str = "png", force:bool = False):
+    """
+    This Function will render many figure specs in parallel, skipping the unchanged ones.
+
+    Returns {output path: "rendered" or "cached"}.
+
+    Args:
+        df: DataFrame with the data of all figures.
+        specs: List of spec dicts; each needs a "name" (file name without suffix) and a "kind".
+        output_dir: Folder for the figures.
+        workers: Number of worker processes (default: number of CPUs; 1 renders in this process).
+        default_format: "png" or "svg" for specs without a "format".
+        force: Render every figure even if its cache key is unchanged.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    cache = _load_cache(output_dir)
+    status = {}
+    jobs = []
+    keys = {}
+    for spec in specs:
+        output = output_dir / f"{spec['name']}.{spec.get('format', default_format)}"
+        data = df[spec_columns(spec)]
+        key = figure_key(spec, data)
+        if not force and cache.get(output.name) == key and output.exists():
+            status[str(output)] = "cached"
+            continue
+        # Only the columns of the figure are sent to the worker process.
+        jobs.append((spec, data, str(output)))
+        keys[str(output)] = (output.name, key)
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) < 2:
+        rendered = [_render_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            rendered = list(pool.map(_render_job, jobs))
+
+    for output in rendered:
+        name, key = keys[output]
+        cache[name] = key
+        status[output] = "rendered"
+    _save_cache(output_dir, cache)
+    return status
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else Path(__file__).parent / "dataset" / "titanic_dataset.csv"
+    target_dir = sys.argv[2] if len(sys.argv) > 2 else Path(__file__).parent / "results" / "figures"
+    titanic = pd.read_csv(csv_path)
+    titanic["Age"] = titanic["Age"].fillna(titanic["Age"].median())
+
+    for attempt in ("first run", "second run"):
+        start = time.perf_counter()
+        result = render_figures(titanic, TITANIC_FIGURES, target_dir)
+        print(f"{attempt}: {time.perf_counter() - start:.2f}s")
+        for path, state in result.items():
+            print(f"    {state:>8}  {path}")
@@ -0,0 +1,295 @@
+"""
+Streaming quantiles (KLL sketch) and IQR outlier clipping for chunked data.
+
+The cleaning recipe in the day_7.py docstring does
+
+    Q1 = df['age'].quantile(0.25)
+    Q3 = df['age'].quantile(0.75)
+    df['age'] = np.where(df['age'] > upper_bound, upper_bound, np.where(...))
+
+which needs the whole column in memory and a full sort. KLLSketch keeps a few
+thousand values per column whatever the input size, and answers any quantile
+with a rank error of at most about 2.7 / k (k = 800 -> within ~0.35% of the true rank).
+Sketches of different chunks or workers can be merged.
+
+IQRClipper uses one sketch per column:
+1. fit: stream the chunks once and sketch every column (fit_files does this in
+   a process pool, one file per task, and merges the sketches),
+2. transform: stream the chunks again and clip to [Q1 - 1.5 IQR, Q3 + 1.5 IQR].
+
+Example:
+    from quantile_sketch import IQRClipper
+    clipper = IQRClipper(["age", "income"]).fit_chunks(pd.read_csv(path, chunksize=10**6))
+    for chunk in clipper.transform_chunks(pd.read_csv(path, chunksize=10**6)):
+        ...
+"""
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_K = 800
+_SHRINK = 2 / 3
+
+
+class KLLSketch:
+    """
+    This Class will summarize a stream of numbers so that any quantile can be estimated.
+
+    Level h holds sorted values that each stand for 2**h input values. When a level is
+    full it is compacted: every other value (random offset) moves up one level.
+
+    Args:
+        k: Size of the top level; the rank error is at most about 2.7 / k.
+        seed: Seed of the random offsets.
+    """
+
+    def __init__(self, k:int = DEFAULT_K, seed:int = None):
+        self.k = k
+        self.n = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level:int):
+        depth = len(self.levels) - 1 - level
+        return max(2, int(math.ceil(self.k * _SHRINK ** depth)))
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) >= self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # An odd item out stays on this level; the rest halve with a random offset.
+                keep = items[:len(items) % 2]
+                paired = items[len(items) % 2:]
+                promoted = paired[self._rng.integers(2)::2]
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def update(self, values):
+        """
+        This Function will add values to the sketch (NaN values are ignored).
+
+        Args:
+            values: Array-like of numbers.
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        self.n += len(values)
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """
+        This Function will add another sketch (for example from another worker) to this one.
+
+        Args:
+            other: A KLLSketch.
+        """
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.n += other.n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+        return self
+
+    def __len__(self):
+        """Number of values kept (not the number of values seen, which is n)."""
+        return sum(len(items) for items in self.levels)
+
+    def quantile(self, q):
+        """
+        This Function will estimate one or several quantiles (q between 0 and 1).
+
+        Args:
+            q: A probability or an array of probabilities.
+        """
+        if self.n == 0:
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else math.nan
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(items), 2.0 ** level) for level, items in enumerate(self.levels)])
+        order = np.argsort(values, kind="stable")
+        values, cumulative = values[order], np.cumsum(weights[order])
+        index = np.searchsorted(cumulative, np.asarray(q) * cumulative[-1], side="left")
+        result = values[np.minimum(index, len(values) - 1)]
+        # The exact extremes are known, so q=0 and q=1 are exact.
+        result = np.where(np.asarray(q) <= 0, self.min, np.where(np.asarray(q) >= 1, self.max, result))
+        return result if np.ndim(q) else float(result)
+
+
+class IQRClipper:
+    """
+    This Class will learn IQR bounds of columns from chunks and clip values to them.
+
+    Args:
+        columns: Column names to clip.
+        factor: Bounds are Q1 - factor * IQR and Q3 + factor * IQR.
+        k: Size parameter of the sketches.
+    """
+
+    def __init__(self, columns, factor:float = 1.5, k:int = DEFAULT_K):
+        self.columns = [columns] if isinstance(columns, str) else list(columns)
+        self.factor = factor
+        self.sketches = {column: KLLSketch(k) for column in self.columns}
+
+    def partial_fit(self, chunk):
+        """
+        This Function will add one chunk of rows to the sketches.
+
+        Args:
+            chunk: DataFrame with the columns.
+        """
+        for column in self.columns:
+            self.sketches[column].update(pd.to_numeric(chunk[column], errors="coerce").to_numpy(np.float64))
+        return self
+
+    def fit_chunks(self, chunks):
+        """
+        This Function will sketch every column over an iterable of DataFrames.
+
+        Args:
+            chunks: Iterable of DataFrames (e.g. pd.read_csv(path, chunksize=...)).
+        """
+        for chunk in chunks:
+            self.partial_fit(chunk)
+        return self
+
+    def merge(self, other):
+        """
+        This Function will merge the sketches of a clipper fitted on other data.
+
+        Args:
+            other: An IQRClipper with the same columns.
+        """
+        for column in self.columns:
+            self.sketches[column].merge(other.sketches[column])
+        return self
+
+    def fit_files(self, paths, workers:int = None, chunksize:int = 1_000_000, **read_csv_kwargs):
+        """
+        This Function will sketch several CSV files in parallel processes and merge the results.
+
+        Args:
+            paths: CSV files with the same columns (e.g. one per day).
+            workers: Number of processes (default: number of CPUs).
+            chunksize: Rows per chunk inside each file.
+            read_csv_kwargs: Extra options for pd.read_csv.
+        """
+        jobs = [(self.columns, self.factor, self.sketches[self.columns[0]].k, path, chunksize, read_csv_kwargs)
+                for path in paths]
+        if workers == 1 or len(jobs) < 2:
+            for result in map(_fit_file, jobs):
+                self.merge(result)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for result in pool.map(_fit_file, jobs):
+                    self.merge(result)
+        return self
+
+    @property
+    def bounds(self):
+        """
+        {column: (lower bound, upper bound)} from the sketched quartiles (NaN for a column without values).
+        """
+        result = {}
+        for column, sketch in self.sketches.items():
+            q1, q3 = sketch.quantile([0.25, 0.75])
+            iqr = q3 - q1
+            result[column] = (float(q1 - self.factor * iqr), float(q3 + self.factor * iqr))
+        return result
+
+    def transform(self, chunk, bounds=None):
+        """
+        This Function will clip the columns of one chunk to the IQR bounds (the chunk is modified).
+
+        Columns without finite bounds (nothing was fitted for them) are left unchanged.
+
+        Args:
+            chunk: DataFrame with the columns.
+            bounds: Precomputed self.bounds (saves recomputing it for every chunk).
+        """
+        bounds = bounds or self.bounds
+        for column in self.columns:
+            low, high = bounds[column]
+            if not (np.isfinite(low) and np.isfinite(high)):
+                continue
+            values = chunk[column].to_numpy(np.float64, copy=True)
+            np.clip(values, low, high, out=values)
+            chunk[column] = values
+        return chunk
+
+    def transform_chunks(self, chunks):
+        """
+        This Function will clip a stream of DataFrames (the second pass).
+
+        Args:
+            chunks: Iterable of DataFrames.
+        """
+        bounds = self.bounds
+        for chunk in chunks:
+            yield self.transform(chunk, bounds)
+
+    def clip_csv(self, source, destination, chunksize:int = 1_000_000, **read_csv_kwargs):
+        """
+        This Function will write a clipped copy of a CSV file, chunk by chunk.
+
+        Args:
+            source: Input CSV file.
+            destination: Output CSV file.
+            chunksize: Rows per chunk.
+            read_csv_kwargs: Extra options for pd.read_csv.
+        """
+        rows = 0
+        with pd.read_csv(source, chunksize=chunksize, **read_csv_kwargs) as reader, \
+                open(destination, "w", encoding="utf-8", newline="") as file:
+            for chunk in self.transform_chunks(reader):
+                chunk.to_csv(file, header=rows == 0, index=False)
+                rows += len(chunk)
+        return rows
+
+
+def _fit_file(job):
+    columns, factor, k, path, chunksize, read_csv_kwargs = job
+    clipper = IQRClipper(columns, factor, k)
+    with pd.read_csv(path, chunksize=chunksize, usecols=columns, **read_csv_kwargs) as reader:
+        return clipper.fit_chunks(reader)
+
+
+if __name__ == "__main__":
+    import time
+
+    rng = np.random.default_rng(0)
+    n = 10_000_000
+    data = rng.lognormal(3, 0.6, n)
+
+    start = time.perf_counter()
+    sketch = KLLSketch()
+    for part in np.array_split(data, 100):
+        sketch.update(part)
+    sketch_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    exact = np.quantile(data, [0.25, 0.75])
+    exact_time = time.perf_counter() - start
+
+    estimate = sketch.quantile([0.25, 0.75])
+    sorted_data = np.sort(data)
+    rank_error = np.abs(np.searchsorted(sorted_data, estimate) / n - np.array([0.25, 0.75]))
+    print(f"{n} values, {len(sketch)} kept")
+    print(f"Q1/Q3 exact {exact}  sketch {estimate}  rank error {rank_error.max():.4%}")
+    print(f"sketch {sketch_time:.2f}s (streaming)  np.quantile {exact_time:.2f}s (all in memory)")
@@ -0,0 +1,293 @@
+"""
+Batched linear algebra on stacks of small matrices and vectors.
+
+day_1.py multiplies one 2x2 or 3x3 matrix (or a matrix and a vector) at a time
+with np.dot. Transforming a million small matrices like that is a Python loop
+of a million np.dot calls. The functions here take whole stacks:
+
+    a: (..., k, k)   a stack of square matrices (e.g. (N, 3, 3))
+    x: (..., k)      a stack of vectors (e.g. (N, 3))
+
+and do every item in one NumPy call:
+- matmul / matvec / chain / einsum: products through np.matmul and np.einsum.
+  einsum contraction paths are computed once per (subscripts, shapes) and cached,
+  so repeated calls skip np.einsum_path.
+- det / inv / solve: for k <= 4 the closed formulas (ad - bc, adjugate / det)
+  are evaluated as whole-array expressions, which avoids LAPACK's per-matrix
+  overhead; larger k falls back to np.linalg.
+
+Example:
+    from batched_linalg import matvec, inv
+    points = matvec(rotations, points)        # (N, 3, 3) x (N, 3) -> (N, 3)
+    undo = inv(rotations)
+"""
+from functools import lru_cache
+
+import numpy as np
+
+CLOSED_FORM_MAX = 4
+
+
+def _check_square(a):
+    a = np.asarray(a)
+    if a.ndim < 2 or a.shape[-1] != a.shape[-2]:
+        raise ValueError(f"Expected a stack of square matrices (..., k, k), got shape {a.shape}")
+    return a
+
+
+@lru_cache(maxsize=256)
+def _einsum_path(subscripts:str, shapes:tuple):
+    """
+    This Function will return the optimized einsum contraction path for these operand shapes.
+    """
+    operands = [np.empty(shape) for shape in shapes]
+    return np.einsum_path(subscripts, *operands, optimize="optimal")[0]
+
+
+def einsum(subscripts:str, *operands):
+    """
+    This Function will run np.einsum with a contraction path that is cached per shape.
+
+    Args:
+        subscripts: Einstein summation subscripts, e.g. "nij,nj->ni".
+        operands: Arrays.
+    """
+    operands = [np.asarray(operand) for operand in operands]
+    path = _einsum_path(subscripts, tuple(operand.shape for operand in operands))
+    return np.einsum(subscripts, *operands, optimize=path)
+
+
+def matmul(a, b):
+    """
+    This Function will multiply two stacks of matrices item by item (a[i] @ b[i]).
+
+    A single matrix (k, m) on either side is used for every item.
+
+    Args:
+        a: Array (..., k, n).
+        b: Array (..., n, m).
+    """
+    return np.matmul(a, b)
+
+
+def matvec(a, x):
+    """
+    This Function will multiply a stack of matrices with a stack of vectors (a[i] @ x[i]).
+
+    Args:
+        a: Array (..., k, n) or a single (k, n) matrix.
+        x: Array (..., n) or a single (n,) vector.
+    """
+    return einsum("...ij,...j->...i", a, x)
+
+
+def chain(*operands):
+    """
+    This Function will multiply several stacks item by item: chain(a, b, c, x) = a[i] @ b[i] @ c[i] @ x[i].
+
+    The order of the products is picked by np.einsum_path (e.g. with a vector at the
+    end it is multiplied from the right, so no matrix-matrix product is done).
+
+    Args:
+        operands: Arrays (..., k, k); the last one may be a stack of vectors (..., k).
+    """
+    if len(operands) < 2:
+        raise ValueError("chain needs at least two operands")
+    operands = [np.asarray(operand) for operand in operands]
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    *matrices, last = operands
+    terms = [f"...{letters[i]}{letters[i + 1]}" for i in range(len(matrices))]
+    end = len(matrices)
+    if last.ndim == matrices[-1].ndim - 1:
+        terms.append(f"...{letters[end]}")
+        output = f"...{letters[0]}"
+    else:
+        terms.append(f"...{letters[end]}{letters[end + 1]}")
+        output = f"...{letters[0]}{letters[end + 1]}"
+    return einsum(",".join(terms) + "->" + output, *operands)
+
+
+def _entries(a):
+    """
+    This Function will return a (k, k, ...) copy of a stack, so that each a[i, j] is contiguous.
+    """
+    return np.ascontiguousarray(np.moveaxis(a, (-2, -1), (0, 1)), dtype=np.result_type(a, np.float64))
+
+
+def _det2(m):
+    return m[0, 0] * m[1, 1] - m[0, 1] * m[1, 0]
+
+
+def _cofactors3(m):
+    return np.stack([
+        np.stack([m[1, 1] * m[2, 2] - m[1, 2] * m[2, 1],
+                  m[0, 2] * m[2, 1] - m[0, 1] * m[2, 2],
+                  m[0, 1] * m[1, 2] - m[0, 2] * m[1, 1]]),
+        np.stack([m[1, 2] * m[2, 0] - m[1, 0] * m[2, 2],
+                  m[0, 0] * m[2, 2] - m[0, 2] * m[2, 0],
+                  m[0, 2] * m[1, 0] - m[0, 0] * m[1, 2]]),
+        np.stack([m[1, 0] * m[2, 1] - m[1, 1] * m[2, 0],
+                  m[0, 1] * m[2, 0] - m[0, 0] * m[2, 1],
+                  m[0, 0] * m[1, 1] - m[0, 1] * m[1, 0]]),
+    ])
+
+
+def _minors4(m):
+    """
+    This Function will return the 2x2 minors of the top two rows (s) and the bottom two rows (c) of 4x4 entries.
+    """
+    s = (m[0, 0] * m[1, 1] - m[1, 0] * m[0, 1], m[0, 0] * m[1, 2] - m[1, 0] * m[0, 2],
+         m[0, 0] * m[1, 3] - m[1, 0] * m[0, 3], m[0, 1] * m[1, 2] - m[1, 1] * m[0, 2],
+         m[0, 1] * m[1, 3] - m[1, 1] * m[0, 3], m[0, 2] * m[1, 3] - m[1, 2] * m[0, 3])
+    c = (m[2, 0] * m[3, 1] - m[3, 0] * m[2, 1], m[2, 0] * m[3, 2] - m[3, 0] * m[2, 2],
+         m[2, 0] * m[3, 3] - m[3, 0] * m[2, 3], m[2, 1] * m[3, 2] - m[3, 1] * m[2, 2],
+         m[2, 1] * m[3, 3] - m[3, 1] * m[2, 3], m[2, 2] * m[3, 3] - m[3, 2] * m[2, 3])
+    return s, c
+
+
+def _det4(m, minors=None):
+    (s0, s1, s2, s3, s4, s5), (c0, c1, c2, c3, c4, c5) = minors or _minors4(m)
+    return s0 * c5 - s1 * c4 + s2 * c3 + s3 * c2 - s4 * c1 + s5 * c0
+
+
+def _adjugate_det(m):
+    """
+    This Function will return (adjugate, determinant) of a (k, k, ...) entry array with k <= 4.
+
+    inv(a) = adjugate / det, and det is the first row of a times the first column of the adjugate.
+    """
+    k = m.shape[0]
+    if k == 1:
+        return np.ones_like(m), m[0, 0]
+    if k == 2:
+        adjugate = np.stack([np.stack([m[1, 1], -m[0, 1]]), np.stack([-m[1, 0], m[0, 0]])])
+        return adjugate, _det2(m)
+    if k == 3:
+        adjugate = _cofactors3(m)
+        return adjugate, m[0, 0] * adjugate[0, 0] + m[0, 1] * adjugate[1, 0] + m[0, 2] * adjugate[2, 0]
+    minors = _minors4(m)
+    (s0, s1, s2, s3, s4, s5), (c0, c1, c2, c3, c4, c5) = minors
+    adjugate = np.stack([
+        np.stack([m[1, 1] * c5 - m[1, 2] * c4 + m[1, 3] * c3, -m[0, 1] * c5 + m[0, 2] * c4 - m[0, 3] * c3,
+                  m[3, 1] * s5 - m[3, 2] * s4 + m[3, 3] * s3, -m[2, 1] * s5 + m[2, 2] * s4 - m[2, 3] * s3]),
+        np.stack([-m[1, 0] * c5 + m[1, 2] * c2 - m[1, 3] * c1, m[0, 0] * c5 - m[0, 2] * c2 + m[0, 3] * c1,
+                  -m[3, 0] * s5 + m[3, 2] * s2 - m[3, 3] * s1, m[2, 0] * s5 - m[2, 2] * s2 + m[2, 3] * s1]),
+        np.stack([m[1, 0] * c4 - m[1, 1] * c2 + m[1, 3] * c0, -m[0, 0] * c4 + m[0, 1] * c2 - m[0, 3] * c0,
+                  m[3, 0] * s4 - m[3, 1] * s2 + m[3, 3] * s0, -m[2, 0] * s4 + m[2, 1] * s2 - m[2, 3] * s0]),
+        np.stack([-m[1, 0] * c3 + m[1, 1] * c1 - m[1, 2] * c0, m[0, 0] * c3 - m[0, 1] * c1 + m[0, 2] * c0,
+                  -m[3, 0] * s3 + m[3, 1] * s1 - m[3, 2] * s0, m[2, 0] * s3 - m[2, 1] * s1 + m[2, 2] * s0]),
+    ])
+    return adjugate, _det4(m, minors)
+
+
+def det(a):
+    """
+    This Function will return the determinant of every matrix in a stack.
+
+    Args:
+        a: Array (..., k, k).
+    """
+    a = _check_square(a)
+    k = a.shape[-1]
+    if k > CLOSED_FORM_MAX:
+        return np.linalg.det(a)
+    m = _entries(a)
+    if k == 1:
+        return m[0, 0]
+    if k == 2:
+        return _det2(m)
+    if k == 3:
+        return (m[0, 0] * (m[1, 1] * m[2, 2] - m[1, 2] * m[2, 1])
+                - m[0, 1] * (m[1, 0] * m[2, 2] - m[1, 2] * m[2, 0])
+                + m[0, 2] * (m[1, 0] * m[2, 1] - m[1, 1] * m[2, 0]))
+    return _det4(m)
+
+
+def _closed_inverse(a):
+    adjugate, determinant = _adjugate_det(_entries(a))
+    if not np.all(determinant != 0):
+        raise np.linalg.LinAlgError("Singular matrix")
+    return np.moveaxis(adjugate / determinant, (0, 1), (-2, -1))
+
+
+def inv(a):
+    """
+    This Function will invert every matrix in a stack.
+
+    Raises np.linalg.LinAlgError when a matrix is singular, like np.linalg.inv.
+
+    Args:
+        a: Array (..., k, k).
+    """
+    a = _check_square(a)
+    if a.shape[-1] > CLOSED_FORM_MAX:
+        return np.linalg.inv(a)
+    return _closed_inverse(a)
+
+
+def solve(a, b):
+    """
+    This Function will solve a[i] @ x[i] = b[i] for every item of a stack.
+
+    For k <= 4 this multiplies b with the closed-form inverse, which is much faster
+    but less accurate than LU for badly conditioned matrices.
+
+    Args:
+        a: Array (..., k, k).
+        b: Array (..., k) of right-hand sides or (..., k, m) for several per item.
+    """
+    a = _check_square(a)
+    b = np.asarray(b)
+    if a.shape[-1] > CLOSED_FORM_MAX:
+        if b.ndim == a.ndim - 1:
+            return np.linalg.solve(a, b[..., None])[..., 0]
+        return np.linalg.solve(a, b)
+    inverse = _closed_inverse(a)
+    return matvec(inverse, b) if b.ndim == a.ndim - 1 else np.matmul(inverse, b)
+
+
+def benchmark(n:int = 100_000, k:int = 3, seed:int = 0):
+    """
+    This Function will time a Python loop of np.dot calls against the batched functions.
+
+    Returns {operation: (loop seconds, batched seconds)}.
+
+    Args:
+        n: Number of matrices.
+        k: Matrix size.
+        seed: Random seed.
+    """
+    import time
+
+    rng = np.random.default_rng(seed)
+    a = rng.standard_normal((n, k, k)) + k * np.eye(k)
+    b = rng.standard_normal((n, k, k))
+    x = rng.standard_normal((n, k))
+
+    def timed(function):
+        start = time.perf_counter()
+        result = function()
+        return time.perf_counter() - start, result
+
+    cases = {
+        "matmul": (lambda: np.array([np.dot(a[i], b[i]) for i in range(n)]), lambda: matmul(a, b)),
+        "matvec": (lambda: np.array([np.dot(a[i], x[i]) for i in range(n)]), lambda: matvec(a, x)),
+        "inv": (lambda: np.array([np.linalg.inv(a[i]) for i in range(n)]), lambda: inv(a)),
+        "det": (lambda: np.array([np.linalg.det(a[i]) for i in range(n)]), lambda: det(a)),
+        "solve": (lambda: np.array([np.linalg.solve(a[i], x[i]) for i in range(n)]), lambda: solve(a, x)),
+    }
+    results = {}
+    for name, (loop, batched) in cases.items():
+        loop_time, expected = timed(loop)
+        batched_time, result = timed(batched)
+        np.testing.assert_allclose(result, expected, rtol=1e-8, atol=1e-10)
+        results[name] = (loop_time, batched_time)
+    return results
+
+
+if __name__ == "__main__":
+    for size in (2, 3, 4, 8):
+        print(f"k = {size}, 100000 matrices")
+        for operation, (loop_seconds, batched_seconds) in benchmark(k=size).items():
+            print(f"    {operation:>7}: Python loop {loop_seconds:.3f}s  batched {batched_seconds:.4f}s"
+                  f"  ({loop_seconds / batched_seconds:.0f}x)")
@@ -101,3 +101,7 @@ A = np.array([[1,2,3],[4,5,6],[7,8,9]])
 result = np.dot(A,I)
 diagboal = np.diag([1,2,3])
 zero = np.zeros((3,3))
+
+# The same operations on many matrices at once (stacks of shape (N, k, k) and
+# (N, k)) instead of one np.dot call per matrix, with a benchmark:
+#     python batched_linalg.py
@@ -532,4 +532,11 @@ print("V Transpose: \n", Vt)
 Sigma = np.zeros((3, 3))
 np.fill_diagonal(Sigma, S)
 reconstructed = U @ Sigma @ Vt
-print("Reconstructed Matrix \n", reconstructed)
\ No newline at end of file
+print("Reconstructed Matrix \n", reconstructed)
+# To solve A x = b, prefer a factorization over inv(A) @ b and a condition
+# estimate over det(A) != 0 (factorize once, reuse for every b):
+#     python linear_solver.py
+
+# For the top-k eigenpairs of large sparse or matrix-free symmetric matrices
+# (stops on a tolerance, can warm-start from a previous result):
+#     python eigen_solver.py
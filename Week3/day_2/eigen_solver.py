@@ -0,0 +1,244 @@
+"""
+Top-k eigenpairs of large (sparse or matrix-free) symmetric matrices.
+
+power_iteration in day_2.py runs a fixed 100 iterations from a random vector
+and returns only the dominant eigenpair, and np.linalg.eig needs the whole
+dense matrix (a graph with a million nodes would need 8 TB). top_eigenpairs
+only multiplies the matrix with blocks of vectors (A @ X), so A can be
+
+- a NumPy array,
+- a scipy.sparse matrix (e.g. a graph adjacency or Laplacian),
+- a scipy.sparse.linalg.LinearOperator (matrix-free: only a function for A @ x),
+
+and it stops once every requested pair satisfies ||A v - lambda v|| <= tol * |lambda_1|.
+
+Methods (eigenvalues are ordered by magnitude, largest first):
+- "power":    block power iteration with k vectors plus Rayleigh-Ritz,
+- "subspace": the same with extra vectors, which converges much faster when
+              eigenvalue k+1 is close to eigenvalue k,
+- "lanczos":  scipy.sparse.linalg.eigsh (implicitly restarted Lanczos); usually fewest products,
+- "dense":    np.linalg.eigh, for small matrices.
+"auto" uses dense for n <= 200, Lanczos when scipy is available, else subspace.
+
+Warm start: pass the previous result as x0 after the matrix changed slightly
+(a few edges added); the iteration starts from the old eigenvectors and needs
+far fewer products.
+
+Example:
+    from eigen_solver import top_eigenpairs
+    result = top_eigenpairs(adjacency, k=5, tol=1e-8)
+    result = top_eigenpairs(updated_adjacency, k=5, x0=result)   # warm start
+    print(result.values, result.iterations)
+"""
+import numpy as np
+
+try:
+    from scipy.sparse.linalg import ArpackNoConvergence, LinearOperator, aslinearoperator, eigsh
+except ImportError:
+    eigsh = None
+
+METHODS = ("auto", "power", "subspace", "lanczos", "dense")
+DENSE_MAX = 200
+
+
+class EigenResult:
+    """
+    This Class will hold the eigenpairs found by top_eigenpairs.
+
+    Attributes:
+        values: Eigenvalues (k,), largest magnitude first.
+        vectors: Unit eigenvectors as columns (n, k).
+        residuals: ||A v - lambda v|| of every pair.
+        iterations: Number of block products A @ Q (power / subspace), of products A @ v (lanczos), or 0 (dense).
+        converged: Whether every residual is within the tolerance.
+        method: The method that was used.
+    """
+
+    def __init__(self, values, vectors, residuals, iterations, converged, method):
+        self.values = values
+        self.vectors = vectors
+        self.residuals = residuals
+        self.iterations = iterations
+        self.converged = converged
+        self.method = method
+
+    def __repr__(self):
+        return (f"EigenResult(values={self.values}, method={self.method!r}, iterations={self.iterations}, "
+                f"converged={self.converged})")
+
+
+def _starting_block(n:int, columns:int, x0, rng):
+    """
+    This Function will return an (n, columns) starting block: the columns of x0 first, random columns after.
+    """
+    block = rng.standard_normal((n, columns))
+    if x0 is not None:
+        x0 = np.asarray(x0.vectors if isinstance(x0, EigenResult) else x0, dtype=np.float64)
+        x0 = x0.reshape(n, -1)[:, :columns]
+        block[:, :x0.shape[1]] = x0
+    return _orthonormalize(block)
+
+
+def _orthonormalize(block):
+    """
+    This Function will return an orthonormal basis of the columns of a tall block (CholeskyQR2).
+
+    Two rounds of Q = X inv(R) with R = cholesky(X^T X) are matrix products only, which is
+    several times faster than Householder QR for (n, few) blocks; if X^T X is too badly
+    conditioned for Cholesky it falls back to np.linalg.qr.
+    """
+    try:
+        # Scaling the columns first keeps X^T X well conditioned when the column norms differ a lot.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            q = block / np.linalg.norm(block, axis=0)
+        for _ in range(2):
+            upper = np.linalg.cholesky(q.T @ q).T
+            q = q @ np.linalg.inv(upper)
+        if np.all(np.isfinite(q)):
+            return q
+    except np.linalg.LinAlgError:
+        pass
+    return np.linalg.qr(block)[0]
+
+
+def _ritz(q, aq, k:int):
+    """
+    This Function will return the top-k Ritz pairs (values, vectors, A @ vectors) of the subspace q.
+    """
+    small = q.T @ aq
+    values, rotation = np.linalg.eigh((small + small.T) / 2)
+    order = np.argsort(-np.abs(values))[:k]
+    rotation = rotation[:, order]
+    return values[order], q @ rotation, aq @ rotation
+
+
+def _block_iteration(a, k:int, columns:int, tol:float, max_iter:int, x0, rng):
+    n = a.shape[0]
+    q = _starting_block(n, columns, x0, rng)
+    values = vectors = residuals = None
+    for iteration in range(1, max_iter + 1):
+        aq = np.asarray(a @ q)
+        values, vectors, a_vectors = _ritz(q, aq, columns)
+        residuals = np.linalg.norm(a_vectors[:, :k] - vectors[:, :k] * values[:k], axis=0)
+        if np.all(residuals <= tol * max(abs(values[0]), np.finfo(float).tiny)):
+            return values[:k], vectors[:, :k], residuals, iteration, True
+        # The next subspace is A times the current Ritz vectors (already computed).
+        q = _orthonormalize(a_vectors)
+    return values[:k], vectors[:, :k], residuals, max_iter, False
+
+
+def _lanczos(a, k:int, tol:float, max_iter:int, x0, rng):
+    n = a.shape[0]
+    if x0 is not None:
+        # ARPACK takes one starting vector: the sum of the previous eigenvectors lies
+        # in their span, so the Krylov space starts out containing all of them.
+        v0 = np.asarray(x0.vectors if isinstance(x0, EigenResult) else x0, dtype=np.float64).reshape(n, -1)
+        v0 = (v0 * rng.choice([-1.0, 1.0], v0.shape[1])).sum(axis=1)
+    else:
+        v0 = rng.standard_normal(n)
+    # Count the products, ARPACK does not report them.
+    operator = aslinearoperator(a)
+    products = [0]
+
+    def matvec(x):
+        products[0] += 1
+        return operator.matvec(x)
+
+    counted = LinearOperator(operator.shape, matvec=matvec, dtype=operator.dtype)
+    # ARPACK's tol is relative to each eigenvalue; ours is relative to the largest.
+    try:
+        values, vectors = eigsh(counted, k=k, which="LM", tol=tol, maxiter=max_iter, v0=v0)
+        converged = True
+    except ArpackNoConvergence as error:
+        values, vectors, converged = error.eigenvalues, error.eigenvectors, False
+    order = np.argsort(-np.abs(values))
+    return values[order], vectors[:, order], None, products[0], converged
+
+
+def top_eigenpairs(a, k:int = 1, method:str = "auto", tol:float = 1e-8, max_iter:int = None, x0=None,
+                   oversample:int = None, seed:int = None):
+    """
+    This Function will find the k eigenvalues of largest magnitude, and their eigenvectors, of a symmetric matrix.
+
+    Args:
+        a: Symmetric (n, n) NumPy array, scipy.sparse matrix or LinearOperator.
+        k: Number of eigenpairs.
+        method: One of METHODS.
+        tol: Stop when ||A v - lambda v|| <= tol * |lambda_1| for all k pairs.
+        max_iter: Maximum number of block products (power / subspace) or ARPACK iterations (default 1000).
+        x0: Previous EigenResult or (n, j) array of vectors to start from (warm start).
+        oversample: Extra vectors for "subspace" (default: max(k, 8)).
+        seed: Seed of the random starting vectors.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown method {method!r}; choose from {METHODS}")
+    n = a.shape[0]
+    if a.ndim != 2 or a.shape[1] != n:
+        raise ValueError(f"Expected a square matrix, got shape {a.shape}")
+    if not 1 <= k <= n:
+        raise ValueError(f"k must be between 1 and {n}, got {k}")
+    max_iter = max_iter or 1000
+    rng = np.random.default_rng(seed)
+    if method == "auto":
+        if n <= DENSE_MAX and (isinstance(a, np.ndarray) or hasattr(a, "toarray")):
+            method = "dense"
+        elif eigsh is not None and k < n - 1:
+            method = "lanczos"
+        else:
+            method = "subspace"
+    if method == "lanczos" and eigsh is None:
+        raise ImportError("method='lanczos' needs scipy")
+
+    if method == "dense":
+        dense = a.toarray() if hasattr(a, "toarray") else np.asarray(a @ np.eye(n))
+        values, vectors = np.linalg.eigh(dense)
+        order = np.argsort(-np.abs(values))[:k]
+        values, vectors, iterations, converged = values[order], vectors[:, order], 0, True
+    elif method == "lanczos":
+        values, vectors, _, iterations, converged = _lanczos(a, k, tol, max_iter, x0, rng)
+    else:
+        columns = k if method == "power" else min(n, k + (oversample if oversample is not None else max(k, 8)))
+        values, vectors, residuals, iterations, converged = _block_iteration(a, k, columns, tol, max_iter, x0, rng)
+        return EigenResult(values, vectors, residuals, iterations, converged, method)
+
+    residuals = np.linalg.norm(np.asarray(a @ vectors) - vectors * values, axis=0)
+    converged = converged and bool(np.all(residuals <= tol * max(abs(values[0]), np.finfo(float).tiny)))
+    return EigenResult(values, vectors, residuals, iterations, converged, method)
+
+
+if __name__ == "__main__":
+    import time
+
+    import scipy.sparse as sp
+
+    # A graph with 5 communities: most edges stay inside a community, some are random.
+    rng = np.random.default_rng(0)
+    n, k, degree = 200_000, 5, 8
+    community = rng.integers(0, k, n)
+    members = np.argsort(community, kind="stable")
+    first = np.searchsorted(community[members], np.arange(k))
+    sizes = np.bincount(community, minlength=k)
+    sources = rng.integers(0, n, n * degree)
+    inside = members[first[community[sources]] + (rng.random(len(sources)) * sizes[community[sources]]).astype(int)]
+    noise = rng.integers(0, n, (2, n))
+    edges = sp.coo_matrix((np.ones(len(sources) + n), (np.r_[sources, noise[0]], np.r_[inside, noise[1]])),
+                          shape=(n, n)).tocsr()
+    graph = ((edges + edges.T) > 0).astype(np.float64)
+    print(f"graph: {n} nodes, {graph.nnz} nonzeros")
+
+    results = {}
+    for name in ("power", "subspace", "lanczos"):
+        start = time.perf_counter()
+        results[name] = top_eigenpairs(graph, k=k, method=name, tol=1e-6, seed=0)
+        print(f"{name:>9}: {time.perf_counter() - start:.2f}s  {results[name]}")
+
+    # A few new edges, then solve again from the previous eigenvectors.
+    extra = rng.integers(0, n, (2, 200))
+    update = sp.coo_matrix((np.ones(200), (extra[0], extra[1])), shape=(n, n)).tocsr()
+    updated = ((graph + update + update.T) > 0).astype(np.float64)
+    for name in ("subspace", "lanczos"):
+        for label, previous in (("cold", None), ("warm", results[name])):
+            start = time.perf_counter()
+            result = top_eigenpairs(updated, k=k, method=name, tol=1e-6, x0=previous, seed=1)
+            print(f"updated graph, {name} {label} start: {time.perf_counter() - start:.2f}s,"
+                  f" {result.iterations} products")
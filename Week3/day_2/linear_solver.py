@@ -0,0 +1,290 @@
+"""
+Factorize once, solve many times: a linear solver that replaces inv(A) @ b.
+
+day_2.py checks `det(A) != 0`, computes `np.linalg.inv(A)` and solves with
+`A_inv @ b`. For systems that are solved again and again with new right-hand
+sides that has two problems:
+- The inverse costs about three times the work of an LU factorization and the
+  result is less accurate.
+- det(A) says nothing about how close A is to singular: det(0.1 * I) for
+  n = 400 is 1e-400, which is 0.0 in floating point, for a perfectly
+  conditioned matrix.
+
+FactorizedSolver factorizes A once (Cholesky when A is symmetric positive
+definite, LU otherwise), keeps the factors, and solves every right-hand side
+with two triangular solves (O(n^2) instead of O(n^3)). Near-singularity is
+judged by the LAPACK reciprocal condition estimate (rcond), which is cheap
+once the factors exist.
+
+Without scipy the solver caches the inverse instead (numpy has no triangular
+solve), which is still one O(n^3) step for any number of right-hand sides.
+
+Example:
+    from linear_solver import FactorizedSolver
+    solver = FactorizedSolver(A)
+    print(solver.condition)
+    x = solver.solve(b)            # b: (n,) or (n, m) for m right-hand sides
+"""
+import hashlib
+import warnings
+from collections import OrderedDict
+
+import numpy as np
+
+try:
+    from scipy.linalg import LinAlgWarning, cho_factor, lu_factor
+    from scipy.linalg.lapack import get_lapack_funcs
+except ImportError:
+    cho_factor = None
+
+METHODS = ("auto", "lu", "cholesky")
+SOLVER_CACHE_SIZE = 8
+# Right-hand sides are solved in blocks of this many columns (bounds the temporary memory).
+DEFAULT_BLOCK = 4096
+
+_solver_cache = OrderedDict()
+
+
+class FactorizedSolver:
+    """
+    This Class will factorize a square matrix once and solve A x = b for any number of b.
+
+    Args:
+        a: Square matrix (n, n).
+        method: "lu", "cholesky" or "auto" (Cholesky if a is exactly symmetric and it succeeds, else LU).
+            "cholesky" uses only the upper triangle of a.
+        min_rcond: Raise np.linalg.LinAlgError when the reciprocal condition estimate is below
+            this. None (the default) means machine epsilon; 0 accepts any non-singular matrix.
+    """
+
+    def __init__(self, a, method:str = "auto", min_rcond:float = None):
+        a = np.asarray(a)
+        if a.ndim != 2 or a.shape[0] != a.shape[1]:
+            raise ValueError(f"Expected a square matrix, got shape {a.shape}")
+        if method not in METHODS:
+            raise ValueError(f"Unknown method {method!r}; choose from {METHODS}")
+        self.dtype = np.result_type(a, np.float64)
+        a = a.astype(self.dtype, copy=False)
+        self.n = a.shape[0]
+        self._norm1 = np.abs(a).sum(axis=0).max() if self.n else 0.0
+        self.method = None
+        self._factors = None
+        self._inverse = None
+
+        if cho_factor is None:
+            self._inverse = np.linalg.inv(a)
+            self.method = "inverse"
+        else:
+            # cho_factor reads only the upper triangle, so "auto" needs exact symmetry: with a
+            # tolerance, a slightly non-symmetric matrix would be solved as a different matrix.
+            if method == "cholesky" or (method == "auto" and self.n and np.array_equal(a, a.T.conj())):
+                try:
+                    self._factors = cho_factor(a, lower=False, check_finite=False)
+                    self.method = "cholesky"
+                except np.linalg.LinAlgError:
+                    if method == "cholesky":
+                        raise
+            if self.method is None:
+                with warnings.catch_warnings():
+                    # Singular matrices are reported below through rcond.
+                    warnings.simplefilter("ignore", LinAlgWarning)
+                    self._factors = lu_factor(a, check_finite=False)
+                self.method = "lu"
+            # Call LAPACK's triangular solves directly: scipy's wrappers re-check the inputs on every call.
+            self._lapack_solve, = get_lapack_funcs(("potrs" if self.method == "cholesky" else "getrs",),
+                                                   (self._factors[0],))
+
+        self.rcond = self._estimate_rcond()
+        min_rcond = np.finfo(self.dtype).eps if min_rcond is None else min_rcond
+        # An exactly singular matrix (rcond 0 or NaN) is rejected even with min_rcond = 0.
+        if self.n and not (self.rcond > 0 and self.rcond >= min_rcond):
+            raise np.linalg.LinAlgError(f"Matrix is singular to working precision (rcond = {self.rcond:.3g})")
+
+    def _estimate_rcond(self):
+        """
+        This Function will return the reciprocal 1-norm condition number (1 / cond), estimated by LAPACK.
+        """
+        if self.n == 0:
+            return 1.0
+        if self.method == "inverse":
+            return 1.0 / (self._norm1 * np.abs(self._inverse).sum(axis=0).max())
+        if np.any(np.diagonal(self._factors[0]) == 0):
+            return 0.0
+        if self.method == "cholesky":
+            pocon, = get_lapack_funcs(("pocon",), (self._factors[0],))
+            rcond, info = pocon(self._factors[0], self._norm1, uplo="U")
+        else:
+            gecon, = get_lapack_funcs(("gecon",), (self._factors[0],))
+            rcond, info = gecon(self._factors[0], self._norm1, norm="1")
+        return float(rcond)
+
+    @property
+    def condition(self):
+        """Estimated 1-norm condition number; about log10(condition) digits are lost in a solve."""
+        return np.inf if self.rcond == 0 else 1.0 / self.rcond
+
+    def solve(self, b, block:int = DEFAULT_BLOCK):
+        """
+        This Function will solve A x = b with the cached factors.
+
+        Args:
+            b: Right-hand side (n,) or several of them as columns (n, m).
+            block: Number of columns solved at a time.
+        """
+        b = np.asarray(b)
+        if b.shape[0] != self.n:
+            raise ValueError(f"Right-hand side has {b.shape[0]} rows, the matrix has {self.n}")
+        if b.ndim == 1 or b.shape[1] <= block:
+            return self._solve(b)
+        x = np.empty(b.shape, dtype=np.result_type(self.dtype, b))
+        for start in range(0, b.shape[1], block):
+            x[:, start:start + block] = self._solve(b[:, start:start + block])
+        return x
+
+    def _solve(self, b):
+        if self.method == "inverse":
+            return self._inverse @ b
+        if np.iscomplexobj(b) and not np.iscomplexobj(self._factors[0]):
+            # LAPACK would drop the imaginary part of b with real factors; solve both parts.
+            return self._solve(b.real) + 1j * self._solve(b.imag)
+        if self.method == "cholesky":
+            x, info = self._lapack_solve(self._factors[0], b, lower=0)
+        else:
+            x, info = self._lapack_solve(*self._factors, b)
+        if info != 0:
+            raise ValueError(f"LAPACK solve failed (info = {info})")
+        return x
+
+    def solve_rows(self, rows, block:int = DEFAULT_BLOCK):
+        """
+        This Function will solve A x = r for every row r of a (m, n) array and return the x as rows.
+
+        Args:
+            rows: Right-hand sides stored as rows (m, n), e.g. one sample per row.
+            block: Number of rows solved at a time.
+        """
+        return self.solve(np.asarray(rows).T, block).T
+
+    def slogdet(self):
+        """
+        This Function will return (sign, log|det A|) from the factors without another factorization.
+        """
+        if self.method == "inverse":
+            sign, logdet = np.linalg.slogdet(self._inverse)
+            return sign, -logdet
+        diagonal = np.diagonal(self._factors[0])
+        if self.method == "cholesky":
+            return 1.0, 2 * np.log(np.abs(diagonal)).sum()
+        swaps = np.count_nonzero(self._factors[1] != np.arange(self.n))
+        sign = (-1.0) ** swaps * np.prod(np.sign(diagonal))
+        with np.errstate(divide="ignore"):
+            return sign, np.log(np.abs(diagonal)).sum()
+
+    def det(self):
+        """
+        This Function will return det A from the factors (may over/underflow; slogdet does not).
+        """
+        sign, logdet = self.slogdet()
+        return sign * np.exp(logdet)
+
+
+def solver_for(a, method:str = "auto"):
+    """
+    This Function will return a FactorizedSolver for a, reusing one made for an identical matrix.
+
+    The matrix is recognized by a hash of its bytes (O(n^2)), so the O(n^3)
+    factorization runs once per distinct matrix among the last SOLVER_CACHE_SIZE.
+
+    Args:
+        a: Square matrix.
+        method: Factorization, see FactorizedSolver.
+    """
+    a = np.ascontiguousarray(a)
+    key = (a.shape, a.dtype.str, method, hashlib.blake2b(a.tobytes(), digest_size=16).hexdigest())
+    solver = _solver_cache.get(key)
+    if solver is None:
+        solver = _solver_cache[key] = FactorizedSolver(a, method)
+        if len(_solver_cache) > SOLVER_CACHE_SIZE:
+            _solver_cache.popitem(last=False)
+    else:
+        _solver_cache.move_to_end(key)
+    return solver
+
+
+def solve(a, b, method:str = "auto"):
+    """
+    This Function will solve a x = b, factorizing a only if it was not seen recently.
+
+    Args:
+        a: Square matrix (n, n).
+        b: Right-hand side (n,) or (n, m).
+        method: Factorization, see FactorizedSolver.
+    """
+    return solver_for(a, method).solve(b)
+
+
+def slogdet(a):
+    """
+    This Function will return (sign, log|det|) of every matrix in a stack (..., n, n).
+
+    Use this instead of det for large n: the log never over- or underflows.
+
+    Args:
+        a: Array (..., n, n).
+    """
+    a = np.asarray(a)
+    if a.ndim < 2 or a.shape[-1] != a.shape[-2]:
+        raise ValueError(f"Expected a stack of square matrices (..., n, n), got shape {a.shape}")
+    return np.linalg.slogdet(a)
+
+
+def det(a):
+    """
+    This Function will return the determinant of every matrix in a stack (..., n, n).
+
+    Args:
+        a: Array (..., n, n).
+    """
+    sign, logdet = slogdet(a)
+    return sign * np.exp(logdet)
+
+
+if __name__ == "__main__":
+    import time
+
+    def timed(function):
+        start = time.perf_counter()
+        result = function()
+        return time.perf_counter() - start, result
+
+    rng = np.random.default_rng(0)
+    n, m = 500, 2000
+    A = rng.standard_normal((n, n)) + n ** 0.5 * np.eye(n)
+    vectors = rng.standard_normal((m, n))
+
+    inverse_time, A_inv = timed(lambda: np.linalg.inv(A))
+    factor_time, solver = timed(lambda: FactorizedSolver(A))
+    print(f"n = {n}: inv {inverse_time * 1000:.1f} ms, {solver.method} factorization + rcond {factor_time * 1000:.1f} ms"
+          f" (condition ~ {solver.condition:.3g})")
+
+    loop_inverse, _ = timed(lambda: [A_inv @ b for b in vectors])
+    loop_solver, _ = timed(lambda: [solver.solve(b) for b in vectors])
+    block_inverse, _ = timed(lambda: A_inv @ vectors.T)
+    block_solver, _ = timed(lambda: solver.solve_rows(vectors))
+    print(f"{m} vectors one by one: A_inv @ b {loop_inverse:.3f}s, solver.solve {loop_solver:.3f}s")
+    print(f"{m} vectors as one block: A_inv @ B {block_inverse:.3f}s, solver.solve_rows {block_solver:.3f}s")
+
+    # Accuracy on a badly conditioned matrix (singular values from 1 to 1e-12).
+    U, _ = np.linalg.qr(rng.standard_normal((n, n)))
+    V, _ = np.linalg.qr(rng.standard_normal((n, n)))
+    hard = U @ np.diag(np.logspace(0, -12, n)) @ V.T
+    b = hard @ rng.standard_normal(n)
+    relative = lambda x: np.linalg.norm(hard @ x - b) / np.linalg.norm(b)
+    hard_solver = FactorizedSolver(hard)
+    print(f"condition ~ {hard_solver.condition:.3g}: residual inv(A) @ b {relative(np.linalg.inv(hard) @ b):.1e},"
+          f" factorized {relative(hard_solver.solve(b)):.1e}")
+
+    tiny = 0.1 * np.eye(400)
+    print(f"det(0.1 * I_400) = {np.linalg.det(tiny)}, yet condition = {FactorizedSolver(tiny).condition:.3g}")
+    sign, logdet = slogdet(rng.standard_normal((1000, 6, 6)))
+    print(f"slogdet of 1000 stacked 6x6 matrices: shapes {sign.shape}, {logdet.shape}")